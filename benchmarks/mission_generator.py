@@ -0,0 +1,47 @@
+import random
+from dataclasses import dataclass
+
+from src.domain.robot.value_objects import HEADING_DELTAS, HEADING_NAMES
+
+
+@dataclass(frozen=True)
+class MissionParameters:
+    robot_count: int
+    instruction_length: int
+    grid_size: int
+    turn_ratio: float
+    seed: int = 0
+
+
+def generate_mission(parameters: MissionParameters) -> str:
+    """Build a mission document in the text input format.
+
+    The same parameters always produce the same document. Robots never leave
+    the grid: a move that would cross the edge is replaced by a right turn.
+    """
+    rng = random.Random(parameters.seed)
+    grid_size = parameters.grid_size
+    lines = [f"{grid_size} {grid_size}"]
+    for _ in range(parameters.robot_count):
+        x, y = rng.randint(0, grid_size), rng.randint(0, grid_size)
+        heading = rng.randrange(4)
+        lines.append(f"{x} {y} {HEADING_NAMES[heading]}")
+
+        commands = []
+        for _ in range(parameters.instruction_length):
+            if rng.random() < parameters.turn_ratio:
+                command = rng.choice("LR")
+            else:
+                delta_x, delta_y = HEADING_DELTAS[heading]
+                if 0 <= x + delta_x <= grid_size and 0 <= y + delta_y <= grid_size:
+                    command = "M"
+                    x, y = x + delta_x, y + delta_y
+                else:
+                    command = "R"
+            if command == "L":
+                heading = (heading - 1) % 4
+            elif command == "R":
+                heading = (heading + 1) % 4
+            commands.append(command)
+        lines.append("".join(commands))
+    return "\n".join(lines)
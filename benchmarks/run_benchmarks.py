@@ -0,0 +1,181 @@
+"""Time each stage of the parse, simulate and format pipeline.
+
+Usage:
+    python -m benchmarks.run_benchmarks --output bench_output.json
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import tempfile
+import time
+from typing import Callable, Optional
+
+from benchmarks.mission_generator import MissionParameters, generate_mission
+from src.application.services.robot_service import RobotService
+from src.application.services.work_space import WorkSpaceService
+from src.domain.robot.entity import Robot
+from src.domain.robot.instruction_program import InstructionProgram
+from src.infrastructure.file_input_reader import FileInputReader
+from src.infrastructure.text_mission_document import TextMissionDocument
+from src.infrastructure.text_robot_repository import TextRobotRepository
+from src.infrastructure.text_work_space_repository import TextWorkSpaceRepository
+
+DEFAULT_SCENARIOS = {
+    "many_short_robots": MissionParameters(
+        robot_count=20000, instruction_length=20, grid_size=100, turn_ratio=0.3
+    ),
+    "few_long_robots": MissionParameters(
+        robot_count=20, instruction_length=20000, grid_size=100, turn_ratio=0.3
+    ),
+    "long_straight_runs": MissionParameters(
+        robot_count=20, instruction_length=20000, grid_size=100000, turn_ratio=0.01
+    ),
+    "turn_heavy": MissionParameters(
+        robot_count=2000, instruction_length=200, grid_size=10, turn_ratio=0.8
+    ),
+}
+
+
+def _time_stage(run: Callable[[], object], repeat: int) -> dict:
+    durations = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        durations.append(time.perf_counter() - start)
+    return {
+        "min_seconds": min(durations),
+        "median_seconds": statistics.median(durations),
+        "repeat": repeat,
+    }
+
+
+def _run_robots(robot_repository: TextRobotRepository, workspace, execute):
+    for position, orientation, instructions in robot_repository.iter_robots():
+        robot = Robot(position=position, orientation=orientation)
+        execute(robot, instructions, workspace)
+
+
+def run_scenario(parameters: MissionParameters, repeat: int) -> dict:
+    input_text = generate_mission(parameters)
+    with tempfile.TemporaryDirectory() as directory:
+        input_path = os.path.join(directory, "input.txt")
+        with open(input_path, "w") as file:
+            file.write(input_text)
+        read_timing = _time_stage(
+            lambda: FileInputReader().get_input(input_path), repeat
+        )
+
+    document = TextMissionDocument(input_text=input_text)
+    workspace = TextWorkSpaceRepository(document=document).get_workspace()
+    robot_repository = TextRobotRepository(document=document)
+    programs = {
+        instructions: InstructionProgram.compile(instructions)
+        for instructions in robot_repository.get_robot_instruction_list()
+    }
+    robot_service = RobotService(
+        robot_repository=robot_repository,
+        workspace_service=WorkSpaceService(
+            workspace_repository=TextWorkSpaceRepository(document=document)
+        ),
+    )
+    final_states = list(robot_service.iter_final_states())
+
+    def run_pipeline():
+        robot_service.program_cache.clear()
+        robot_service.process_instructions()
+
+    return {
+        "parameters": vars(parameters),
+        "input_bytes": len(input_text),
+        "stages": {
+            "read": read_timing,
+            "parse": _time_stage(
+                lambda: TextRobotRepository(input_text=input_text), repeat
+            ),
+            "simulate_instructions": _time_stage(
+                lambda: _run_robots(
+                    robot_repository,
+                    workspace,
+                    lambda robot, instructions, workspace: robot.execute_instructions(
+                        instructions, workspace
+                    ),
+                ),
+                repeat,
+            ),
+            "simulate_program": _time_stage(
+                lambda: _run_robots(
+                    robot_repository,
+                    workspace,
+                    lambda robot, instructions, workspace: robot.execute_program(
+                        programs[instructions], workspace
+                    ),
+                ),
+                repeat,
+            ),
+            "format": _time_stage(
+                lambda: robot_service._format_final_states(final_states),
+                repeat,
+            ),
+            "pipeline": _time_stage(run_pipeline, repeat),
+        },
+    }
+
+
+def _current_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main(argv: Optional[list[str]] = None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--output", default="bench_output.json")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--scenario", action="append", choices=sorted(DEFAULT_SCENARIOS),
+        help="Scenario to run; may be repeated. Defaults to all scenarios.",
+    )
+    parser.add_argument("--robots", type=int, help="Run a custom scenario instead")
+    parser.add_argument("--instruction-length", type=int, default=100)
+    parser.add_argument("--grid-size", type=int, default=100)
+    parser.add_argument("--turn-ratio", type=float, default=0.3)
+    parser.add_argument("--seed", type=int, default=0)
+    arguments = parser.parse_args(argv)
+
+    if arguments.robots is not None:
+        scenarios = {
+            "custom": MissionParameters(
+                robot_count=arguments.robots,
+                instruction_length=arguments.instruction_length,
+                grid_size=arguments.grid_size,
+                turn_ratio=arguments.turn_ratio,
+                seed=arguments.seed,
+            )
+        }
+    else:
+        names = arguments.scenario or sorted(DEFAULT_SCENARIOS)
+        scenarios = {name: DEFAULT_SCENARIOS[name] for name in names}
+
+    report = {
+        "commit": _current_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "scenarios": {
+            name: run_scenario(parameters, arguments.repeat)
+            for name, parameters in scenarios.items()
+        },
+    }
+    with open(arguments.output, "w") as file:
+        json.dump(report, file, indent=2)
+    print(f"Benchmark results written to {arguments.output}")
+
+
+if __name__ == "__main__":
+    main()
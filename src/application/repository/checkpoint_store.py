@@ -0,0 +1,55 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Iterator, NamedTuple, Optional, Union
+
+from src.domain.robot.robot_failure import RobotFailure
+from src.domain.robot.value_objects import Orientation, Position
+
+FinalState = Union[tuple[Position, Orientation], RobotFailure]
+
+
+class RobotProgress(NamedTuple):
+    """Pose of a robot after its first ``step`` commands."""
+
+    step: int
+    position: Position
+    orientation: Orientation
+
+
+@dataclass(frozen=True)
+class FleetCheckpoint:
+    """How far a run got: the number of robots whose final state is stored,
+    and the progress of the robot after them, if it was part-way through.
+
+    ``fingerprint`` covers the workspace and the input of every robot the
+    checkpoint holds, the one in progress included, so a resume can tell
+    whether it is given the same mission.
+    """
+
+    completed_robots: int
+    in_progress: Optional[RobotProgress] = None
+    fingerprint: bytes = b""
+
+
+class CheckpointStore(ABC):
+    """Durable progress of a fleet run, saved so an interrupted run can
+    resume where it stopped."""
+
+    @abstractmethod
+    def load(self) -> Optional[FleetCheckpoint]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def iter_final_states(self) -> Iterator[FinalState]:
+        """Final states of the completed robots of the loaded checkpoint."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def save(self, checkpoint: FleetCheckpoint, new_final_states: list[FinalState]):
+        """Store the final states completed since the last save and commit
+        ``checkpoint`` in one atomic step."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def clear(self):
+        raise NotImplementedError
@@ -0,0 +1,12 @@
+from abc import ABC, abstractmethod
+
+
+class OutputWriter(ABC):
+
+    @abstractmethod
+    def write_line(self, line: str):
+        raise NotImplementedError
+
+    @abstractmethod
+    def flush(self):
+        raise NotImplementedError
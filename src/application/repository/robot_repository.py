@@ -1,5 +1,7 @@
 from abc import ABC, abstractmethod
+from typing import Iterator
 
+from src.domain.robot.packed_instructions import Instructions
 from src.domain.robot.value_objects import Orientation, Position
 
 
@@ -15,4 +17,11 @@ class RobotRepository(ABC):
 
     @abstractmethod
     def get_robot_instruction_list(self) -> str:
-        raise NotImplementedError
\ No newline at end of file
+        raise NotImplementedError
+
+    def iter_robots(self) -> Iterator[tuple[Position, Orientation, Instructions]]:
+        return zip(
+            self.get_robot_position_list(),
+            self.get_robot_orientation_list(),
+            self.get_robot_instruction_list(),
+        )
@@ -0,0 +1,21 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from src.domain.robot.value_objects import Orientation, Position
+
+
+class SimulationResultCache(ABC):
+    """Final poses of previously simulated robots, keyed by a fingerprint of
+    everything the result depends on."""
+
+    @abstractmethod
+    def get(self, fingerprint: bytes) -> Optional[tuple[Position, Orientation]]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def put(self, fingerprint: bytes, position: Position, orientation: Orientation):
+        raise NotImplementedError
+
+    @abstractmethod
+    def flush(self):
+        raise NotImplementedError
@@ -0,0 +1,15 @@
+from abc import ABC, abstractmethod
+
+from src.domain.robot.trajectory import Trajectory
+
+
+class TrajectoryWriter(ABC):
+    """Destination for the path of every simulated robot."""
+
+    @abstractmethod
+    def write(self, robot_index: int, trajectory: Trajectory):
+        raise NotImplementedError
+
+    @abstractmethod
+    def flush(self):
+        raise NotImplementedError
@@ -0,0 +1,125 @@
+from typing import Iterable, Optional
+
+from src.application.services.path_planner import (
+    DistanceField,
+    FreeCellGrid,
+    StartDistanceField,
+    format_pose,
+    search_path,
+    uses_distance_fields,
+)
+from src.application.services.work_space import WorkSpaceService
+from src.domain.robot.value_objects import Orientation, Position
+from src.domain.workspace.entity import WorkSpace
+
+# Start pose and goal pose of one robot
+PlanRequest = tuple[Position, Orientation, Position, Orientation]
+
+
+def _pose_key(position: Position, orientation: Orientation) -> tuple[int, int, int]:
+    return position.x, position.y, orientation.heading
+
+
+def _unreachable(index: int, request: PlanRequest) -> ValueError:
+    start, start_orientation, goal, goal_orientation = request
+    return ValueError(
+        f"Request {index}: Goal {format_pose(goal, goal_orientation)} "
+        f"is unreachable from {format_pose(start, start_orientation)}"
+    )
+
+
+class BatchPathPlanner:
+    """Plans many ``(start, goal)`` pairs against one workspace at once.
+
+    Requests are grouped so that every distinct goal is flooded once, or
+    every distinct start when there are fewer of them, and each pair is then
+    answered from the shared distance fields. Only one field is held at a
+    time. Like ``PathPlanner``, workspaces over ``max_field_cells`` cells are
+    searched with A* instead, once per distinct pair and with at most
+    ``max_search_states`` states each; the first unreachable pair ends the
+    batch before any later one is searched.
+    """
+
+    def __init__(
+        self,
+        workspace_service: WorkSpaceService,
+        max_field_cells: int = 1 << 20,
+        max_search_states: int = 1 << 20,
+    ):
+        self.workspace_service = workspace_service
+        self.max_field_cells = max_field_cells
+        self.max_search_states = max_search_states
+        self.floods = 0
+        self.searches = 0
+
+    def plan_all(self, requests: Iterable[PlanRequest]) -> list[str]:
+        """Shortest instruction string of every request, in request order."""
+        requests = list(requests)
+        workspace = self.workspace_service.get_workspace()
+        for index, (start, _, goal, _) in enumerate(requests):
+            for name, position in (("Start", start), ("Goal", goal)):
+                if not workspace.is_position_valid(position=position):
+                    raise ValueError(
+                        f"Request {index}: {name} position {position} is not a free cell"
+                    )
+
+        if uses_distance_fields(workspace, self.max_field_cells):
+            paths = self._plan_with_floods(workspace, requests)
+        else:
+            paths = self._plan_with_searches(workspace, requests)
+
+        for index, path in enumerate(paths):
+            if path is None:
+                raise _unreachable(index, requests[index])
+        return paths
+
+    def _plan_with_searches(
+        self, workspace: WorkSpace, requests: list[PlanRequest]
+    ) -> list[str]:
+        found: dict[tuple[tuple[int, int, int], tuple[int, int, int]], Optional[str]] = {}
+        paths = []
+        for index, request in enumerate(requests):
+            start, start_orientation, goal, goal_orientation = request
+            key = (_pose_key(start, start_orientation), _pose_key(goal, goal_orientation))
+            if key not in found:
+                self.searches += 1
+                try:
+                    found[key] = search_path(
+                        workspace, *request, max_expansions=self.max_search_states
+                    )
+                except ValueError as e:
+                    raise ValueError(f"Request {index}: {e}") from e
+            path = found[key]
+            if path is None:
+                raise _unreachable(index, request)
+            paths.append(path)
+        return paths
+
+    def _plan_with_floods(
+        self, workspace: WorkSpace, requests: list[PlanRequest]
+    ) -> list[Optional[str]]:
+        grid = FreeCellGrid(workspace)
+        goals: dict[tuple[int, int, int], list[int]] = {}
+        starts: dict[tuple[int, int, int], list[int]] = {}
+        for index, (start, start_orientation, goal, goal_orientation) in enumerate(
+            requests
+        ):
+            goals.setdefault(_pose_key(goal, goal_orientation), []).append(index)
+            starts.setdefault(_pose_key(start, start_orientation), []).append(index)
+
+        paths: list[Optional[str]] = [None] * len(requests)
+        if len(starts) < len(goals):
+            for indexes in starts.values():
+                start, start_orientation = requests[indexes[0]][:2]
+                field = StartDistanceField(grid, start, start_orientation)
+                self.floods += 1
+                for index in indexes:
+                    paths[index] = field.path_to(*requests[index][2:])
+        else:
+            for indexes in goals.values():
+                goal, goal_orientation = requests[indexes[0]][2:]
+                field = DistanceField(grid, goal, goal_orientation)
+                self.floods += 1
+                for index in indexes:
+                    paths[index] = field.path_from(*requests[index][:2])
+        return paths
@@ -0,0 +1,227 @@
+from typing import Optional
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised only without numpy
+    np = None
+
+from src.application.repository.robot_repository import RobotRepository
+from src.application.services.work_space import WorkSpaceService
+from src.domain.robot.value_objects import HEADING_DELTAS, HEADING_NAMES, Position
+
+# Instruction codes: 0 is any invalid command, 4 is a no-op for robots
+# that already finished or failed
+_INVALID, _LEFT, _RIGHT, _MOVE, _NOOP = range(5)
+
+(
+    _NO_ERROR,
+    _INITIAL_POSITION_ERROR,
+    _INITIAL_OBSTACLE_ERROR,
+    _BOUNDS_ERROR,
+    _OBSTACLE_ERROR,
+    _INSTRUCTION_ERROR,
+) = range(6)
+
+
+class _ObstacleLookup:
+    """Obstacle runs of a workspace flattened into sorted NumPy keys once
+    per run, so the cells of a whole step are checked together.
+
+    A run of row band ``b`` covering ``start..end`` becomes the keys
+    ``b * width + start`` and ``b * width + end``; runs never overlap and
+    bands are in order, so the keys are sorted and a cell is blocked when
+    the first run ending at or after its key also starts at or before it.
+    Only cells inside the workspace give meaningful answers.
+    """
+
+    def __init__(self, workspace):
+        band_starts, band_runs = workspace.obstacles.row_bands()
+        self.width = workspace.max_x - workspace.min_x + 1
+        self.min_x = workspace.min_x
+        self.band_starts = np.array(band_starts, dtype=np.int64)
+        run_starts: list[int] = []
+        run_ends: list[int] = []
+        for band, runs in enumerate(band_runs):
+            if runs is None:
+                continue
+            starts, ends = runs
+            offset = band * self.width - self.min_x
+            run_starts.extend(start + offset for start in starts)
+            run_ends.extend(end + offset for end in ends)
+        self.run_starts = np.array(run_starts, dtype=np.int64)
+        self.run_ends = np.array(run_ends, dtype=np.int64)
+
+    def blocked(self, x, y):
+        band = np.searchsorted(self.band_starts, y, side="right") - 1
+        keys = band * self.width + (x - self.min_x)
+        index = np.searchsorted(self.run_ends, keys, side="left")
+        found = index < len(self.run_ends)
+        index[~found] = 0
+        return found & (self.run_starts[index] <= keys) & (band >= 0)
+
+
+class BatchRobotService:
+    """Simulates the whole fleet at once with NumPy arrays.
+
+    Every robot advances one instruction per step, so a step costs a few
+    vectorised operations over the robots that still have instructions
+    left. Robots are independent, so the error raised is the one the
+    sequential ``RobotService`` would hit first: the failure of the earliest
+    robot in input order.
+    """
+
+    def __init__(
+        self,
+        robot_repository: RobotRepository,
+        workspace_service: WorkSpaceService,
+    ):
+        if np is None:
+            raise ImportError("BatchRobotService requires numpy to be installed")
+        self.robot_repository = robot_repository
+        self.workspace_service = workspace_service
+
+    def process_instructions(self) -> str:
+        workspace = self.workspace_service.get_workspace()
+        x_list, y_list, heading_list, instruction_list = [], [], [], []
+        load_error: Optional[Exception] = None
+        try:
+            for position, orientation, instructions in self.robot_repository.iter_robots():
+                x_list.append(position.x)
+                y_list.append(position.y)
+                heading_list.append(orientation.heading)
+                instruction_list.append(str(instructions))
+        except ValueError as e:
+            # Robots read before the bad record still get to fail first
+            load_error = e
+
+        x = np.array(x_list, dtype=np.int64)
+        y = np.array(y_list, dtype=np.int64)
+        heading = np.array(heading_list, dtype=np.int8)
+        error_kind = np.full(len(x), _NO_ERROR, dtype=np.int8)
+        error_x = np.zeros(len(x), dtype=np.int64)
+        error_y = np.zeros(len(x), dtype=np.int64)
+        error_step = np.zeros(len(x), dtype=np.int64)
+
+        initial_invalid = (
+            (x < workspace.min_x) | (x > workspace.max_x)
+            | (y < workspace.min_y) | (y > workspace.max_y)
+        )
+        error_kind[initial_invalid] = _INITIAL_POSITION_ERROR
+        obstacles = None
+        if workspace.obstacles is not None:
+            obstacles = _ObstacleLookup(workspace)
+            error_kind[~initial_invalid & obstacles.blocked(x, y)] = _INITIAL_OBSTACLE_ERROR
+        self._simulate(
+            instruction_list, workspace, obstacles, x, y, heading,
+            error_kind, error_x, error_y, error_step,
+        )
+
+        failed = np.flatnonzero(error_kind)
+        if len(failed):
+            i = int(failed[0])
+            kind = error_kind[i]
+            if kind == _INITIAL_POSITION_ERROR:
+                raise ValueError(
+                    f"Initial position {Position(x_list[i], y_list[i])} "
+                    "is out of workspace bounds"
+                )
+            if kind == _INITIAL_OBSTACLE_ERROR:
+                raise ValueError(
+                    f"Initial position {Position(x_list[i], y_list[i])} "
+                    "is blocked by an obstacle"
+                )
+            next_position = Position(int(error_x[i]), int(error_y[i]))
+            if kind == _BOUNDS_ERROR:
+                raise ValueError(
+                    f"Position {next_position} is out of workspace bounds"
+                )
+            if kind == _OBSTACLE_ERROR:
+                raise ValueError(
+                    f"Position {next_position} is blocked by an obstacle"
+                )
+            raise ValueError(
+                f"Invalid instruction: {instruction_list[i][error_step[i]]}"
+            )
+        if load_error is not None:
+            raise load_error
+
+        return "\n".join(
+            f"{final_x} {final_y} {HEADING_NAMES[final_heading]}"
+            for final_x, final_y, final_heading in zip(
+                x.tolist(), y.tolist(), heading.tolist()
+            )
+        )
+
+    def _simulate(
+        self, instruction_list, workspace, obstacles, x, y, heading,
+        error_kind, error_x, error_y, error_step,
+    ):
+        lengths = np.array([len(i) for i in instruction_list], dtype=np.int64)
+        if not len(lengths) or not lengths.max():
+            return
+        offsets = np.zeros(len(lengths), dtype=np.int64)
+        np.cumsum(lengths[:-1], out=offsets[1:])
+        commands = np.frombuffer(
+            "".join(instruction_list).encode("ascii", "replace"), dtype=np.uint8
+        )
+        command_codes = np.zeros(256, dtype=np.int8)
+        command_codes[ord("L")], command_codes[ord("R")], command_codes[ord("M")] = (
+            _LEFT, _RIGHT, _MOVE
+        )
+        turn_by_code = np.array([0, 3, 1, 0, 0], dtype=np.int8)
+        move_by_code = np.array([0, 0, 0, 1, 0], dtype=np.int64)
+        delta_x, delta_y = np.array(HEADING_DELTAS, dtype=np.int64).T
+
+        # Longest instruction strings first, so the robots still running at
+        # any step are always a prefix of ``order``
+        order = np.argsort(-lengths, kind="stable")
+        descending_lengths = -lengths[order]
+        sorted_offsets = offsets[order]
+        alive = error_kind[order] == _NO_ERROR
+
+        x_sorted, y_sorted, heading_sorted = x[order], y[order], heading[order]
+        for step in range(int(-descending_lengths[0])):
+            active = int(np.searchsorted(descending_lengths, -step, side="left"))
+            robot_alive = alive[:active]
+            codes = command_codes[commands[sorted_offsets[:active] + step]]
+            codes[~robot_alive] = _NOOP
+
+            invalid = codes == _INVALID
+            if invalid.any():
+                failed = order[:active][invalid]
+                error_kind[failed] = _INSTRUCTION_ERROR
+                error_step[failed] = step
+                robot_alive[invalid] = False
+                codes[invalid] = _NOOP
+
+            current_heading = heading_sorted[:active]
+            current_heading[:] = (current_heading + turn_by_code[codes]) % 4
+            moves = move_by_code[codes]
+            next_x = x_sorted[:active] + delta_x[current_heading] * moves
+            next_y = y_sorted[:active] + delta_y[current_heading] * moves
+            out_of_bounds = (moves == 1) & (
+                (next_x < workspace.min_x) | (next_x > workspace.max_x)
+                | (next_y < workspace.min_y) | (next_y > workspace.max_y)
+            )
+            if out_of_bounds.any():
+                failed = order[:active][out_of_bounds]
+                error_kind[failed] = _BOUNDS_ERROR
+                error_x[failed] = next_x[out_of_bounds]
+                error_y[failed] = next_y[out_of_bounds]
+                robot_alive[out_of_bounds] = False
+                next_x[out_of_bounds] = x_sorted[:active][out_of_bounds]
+                next_y[out_of_bounds] = y_sorted[:active][out_of_bounds]
+            if obstacles is not None:
+                blocked = (moves == 1) & robot_alive & obstacles.blocked(next_x, next_y)
+                if blocked.any():
+                    failed = order[:active][blocked]
+                    error_kind[failed] = _OBSTACLE_ERROR
+                    error_x[failed] = next_x[blocked]
+                    error_y[failed] = next_y[blocked]
+                    robot_alive[blocked] = False
+                    next_x[blocked] = x_sorted[:active][blocked]
+                    next_y[blocked] = y_sorted[:active][blocked]
+            x_sorted[:active] = next_x
+            y_sorted[:active] = next_y
+
+        x[order], y[order], heading[order] = x_sorted, y_sorted, heading_sorted
@@ -0,0 +1,87 @@
+from functools import partial
+from typing import Callable, Iterator, Optional
+
+from src.application.repository.checkpoint_store import FinalState
+from src.application.repository.robot_repository import RobotRepository
+from src.application.repository.simulation_result_cache import SimulationResultCache
+from src.application.services.fleet_metrics import FleetMetrics
+from src.application.services.instruction_program_cache import InstructionProgramCache
+from src.application.services.robot_error_table import RobotErrorTable
+from src.application.services.robot_service import RobotService, simulate_robot
+from src.application.services.simulation_fingerprint import (
+    fingerprint_robot,
+    fingerprint_workspace,
+)
+from src.application.services.work_space import WorkSpaceService
+from src.domain.robot.packed_instructions import Instructions
+from src.domain.robot.value_objects import Position, Orientation
+from src.domain.workspace.entity import WorkSpace
+
+
+class CachedRobotService(RobotService):
+    """``RobotService`` that looks every robot up in ``result_cache`` before
+    simulating it, and stores the final pose of the robots it simulates."""
+
+    def __init__(
+        self,
+        robot_repository: RobotRepository,
+        workspace_service: WorkSpaceService,
+        result_cache: SimulationResultCache,
+        program_cache: Optional[InstructionProgramCache] = None,
+        metrics: Optional[FleetMetrics] = None,
+        park_finished_robots: bool = False,
+        error_table: Optional[RobotErrorTable] = None,
+    ):
+        if park_finished_robots:
+            # A parked fleet makes each result depend on the robots before it
+            raise ValueError("Finished robots cannot be parked when caching results")
+        super().__init__(
+            robot_repository=robot_repository,
+            workspace_service=workspace_service,
+            program_cache=program_cache,
+            metrics=metrics,
+            error_table=error_table,
+        )
+        self.result_cache = result_cache
+
+    def _iter_final_states(
+        self,
+        workspace: WorkSpace,
+        robots: Iterator[tuple[Position, Orientation, Instructions]],
+    ) -> Iterator[FinalState]:
+        return self._flush_when_done(
+            super()._iter_final_states(workspace, robots), self.result_cache
+        )
+
+    def _simulator(
+        self, workspace: WorkSpace, first_index: int
+    ) -> Callable[..., tuple[Position, Orientation]]:
+        return partial(
+            self._simulate_with_result_cache, fingerprint_workspace(workspace)
+        )
+
+    def _simulate_with_result_cache(
+        self,
+        workspace_fingerprint: bytes,
+        position: Position,
+        orientation: Orientation,
+        instructions: Instructions,
+        workspace: WorkSpace,
+        program_cache: InstructionProgramCache,
+    ) -> tuple[Position, Orientation]:
+        fingerprint = fingerprint_robot(
+            workspace_fingerprint, position, orientation, instructions
+        )
+        final_state = self.result_cache.get(fingerprint)
+        if final_state is not None and self.metrics is not None:
+            self.metrics.counters["result_cache_hits"] += 1
+        if final_state is None:
+            final_state = simulate_robot(
+                position=position,
+                orientation=orientation,
+                instructions=instructions,
+                workspace=workspace,
+                program_cache=program_cache,
+            )
+            self.result_cache.put(fingerprint, *final_state)
+        return final_state
@@ -0,0 +1,185 @@
+from functools import partial
+from itertools import chain, count, islice
+from typing import Iterator, Optional
+
+from src.application.repository.checkpoint_store import (
+    CheckpointStore,
+    FinalState,
+    FleetCheckpoint,
+    RobotProgress,
+)
+from src.application.repository.robot_repository import RobotRepository
+from src.application.services.fleet_checkpointer import FleetCheckpointer
+from src.application.services.fleet_metrics import FleetMetrics
+from src.application.services.instruction_program_cache import InstructionProgramCache
+from src.application.services.robot_error_table import RobotErrorTable
+from src.application.services.robot_service import (
+    RobotService,
+    check_initial_position,
+    simulate_robot,
+)
+from src.application.services.simulation_fingerprint import (
+    extend_fingerprint,
+    fingerprint_robot,
+    fingerprint_workspace,
+)
+from src.application.services.work_space import WorkSpaceService
+from src.domain.robot.entity import Robot
+from src.domain.robot.packed_instructions import Instructions
+from src.domain.robot.robot_failure import RobotFailure
+from src.domain.robot.value_objects import Position, Orientation
+from src.domain.workspace.entity import WorkSpace
+
+
+class CheckpointedRobotService(RobotService):
+    """``RobotService`` that saves its progress to ``checkpoint_store`` and
+    resumes from it when run again."""
+
+    def __init__(
+        self,
+        robot_repository: RobotRepository,
+        workspace_service: WorkSpaceService,
+        checkpoint_store: CheckpointStore,
+        program_cache: Optional[InstructionProgramCache] = None,
+        metrics: Optional[FleetMetrics] = None,
+        park_finished_robots: bool = False,
+        error_table: Optional[RobotErrorTable] = None,
+        checkpoint_interval: float = 5.0,
+        checkpoint_steps: int = 1 << 20,
+    ):
+        super().__init__(
+            robot_repository=robot_repository,
+            workspace_service=workspace_service,
+            program_cache=program_cache,
+            metrics=metrics,
+            park_finished_robots=park_finished_robots,
+            error_table=error_table,
+        )
+        # Progress is saved at most every checkpoint_interval seconds, and
+        # robots with more than checkpoint_steps commands save it part-way
+        self.checkpoint_store = checkpoint_store
+        self.checkpoint_interval = checkpoint_interval
+        self.checkpoint_steps = checkpoint_steps
+
+    def _iter_final_states(
+        self,
+        workspace: WorkSpace,
+        robots: Iterator[tuple[Position, Orientation, Instructions]],
+    ) -> Iterator[FinalState]:
+        workspace_fingerprint = fingerprint_workspace(workspace)
+        checkpoint = self.checkpoint_store.load() or FleetCheckpoint(
+            completed_robots=0, fingerprint=workspace_fingerprint
+        )
+        robots, fingerprint = self._skip_checkpointed_robots(
+            robots, checkpoint, workspace_fingerprint
+        )
+        # Completed robots are restored rather than simulated again
+        for final_state in self.checkpoint_store.iter_final_states():
+            if isinstance(final_state, RobotFailure):
+                if self.error_table is not None:
+                    self.error_table.record(final_state)
+            elif self.park_finished_robots:
+                workspace.occupy(final_state[0])
+            yield final_state
+
+        checkpointer = FleetCheckpointer(
+            self.checkpoint_store,
+            completed_robots=checkpoint.completed_robots,
+            fingerprint=fingerprint,
+            interval=self.checkpoint_interval,
+        )
+        final_states = self._iter_simulated_final_states(
+            workspace,
+            self._iter_started_robots(robots, workspace_fingerprint, checkpointer),
+            simulate=partial(
+                self._simulate_with_progress,
+                count(checkpoint.completed_robots),
+                checkpoint,
+                checkpointer,
+            ),
+            first_index=checkpoint.completed_robots,
+        )
+        try:
+            for final_state in final_states:
+                checkpointer.complete(final_state)
+                yield final_state
+        finally:
+            checkpointer.save()
+
+    def _skip_checkpointed_robots(
+        self,
+        robots: Iterator[tuple[Position, Orientation, Instructions]],
+        checkpoint: FleetCheckpoint,
+        workspace_fingerprint: bytes,
+    ) -> tuple[Iterator[tuple[Position, Orientation, Instructions]], bytes]:
+        """Skip the completed robots of ``checkpoint`` and return the robots
+        left with the fingerprint of the skipped ones, after checking that
+        they and the robot in progress are the ones it was saved for."""
+        fingerprint = workspace_fingerprint
+        for robot in islice(robots, checkpoint.completed_robots):
+            fingerprint = extend_fingerprint(
+                fingerprint, fingerprint_robot(workspace_fingerprint, *robot)
+            )
+        saved_fingerprint = fingerprint
+        if checkpoint.in_progress is not None:
+            robot = next(robots, None)
+            if robot is not None:
+                saved_fingerprint = extend_fingerprint(
+                    fingerprint, fingerprint_robot(workspace_fingerprint, *robot)
+                )
+                robots = chain([robot], robots)
+        if saved_fingerprint != checkpoint.fingerprint:
+            raise ValueError(
+                "Checkpoint does not match this mission; clear it to start over"
+            )
+        return robots, fingerprint
+
+    def _iter_started_robots(
+        self,
+        robots: Iterator[tuple[Position, Orientation, Instructions]],
+        workspace_fingerprint: bytes,
+        checkpointer: FleetCheckpointer,
+    ) -> Iterator[tuple[Position, Orientation, Instructions]]:
+        for robot in robots:
+            checkpointer.start(fingerprint_robot(workspace_fingerprint, *robot))
+            yield robot
+
+    def _simulate_with_progress(
+        self,
+        robot_indexes: Iterator[int],
+        checkpoint: FleetCheckpoint,
+        checkpointer: FleetCheckpointer,
+        position: Position,
+        orientation: Orientation,
+        instructions: Instructions,
+        workspace: WorkSpace,
+        program_cache: InstructionProgramCache,
+    ) -> tuple[Position, Orientation]:
+        robot_index = next(robot_indexes)
+        step = 0
+        if (
+            robot_index == checkpoint.completed_robots
+            and checkpoint.in_progress is not None
+        ):
+            step, position, orientation = checkpoint.in_progress
+        elif len(instructions) <= self.checkpoint_steps:
+            return simulate_robot(
+                position=position,
+                orientation=orientation,
+                instructions=instructions,
+                workspace=workspace,
+                program_cache=program_cache,
+            )
+        else:
+            check_initial_position(position, workspace)
+
+        # Long robots run a chunk at a time, reporting progress after each
+        robot = Robot(position=position, orientation=orientation)
+        while step < len(instructions):
+            chunk = instructions[step:step + self.checkpoint_steps]
+            program, effect = program_cache.get(chunk)
+            robot.execute_program(program=program, workspace=workspace, effect=effect)
+            step += len(chunk)
+            if step < len(instructions):
+                checkpointer.progress(RobotProgress(step, *robot.get_state()))
+        return robot.get_state()
@@ -0,0 +1,71 @@
+import time
+from typing import Callable, Optional
+
+from src.application.repository.checkpoint_store import (
+    CheckpointStore,
+    FinalState,
+    FleetCheckpoint,
+    RobotProgress,
+)
+from src.application.services.simulation_fingerprint import extend_fingerprint
+
+
+class FleetCheckpointer:
+    """Collects the results of a run and saves a checkpoint at most once
+    every ``interval`` seconds, so saving stays cheap on fleets of millions
+    of robots.
+
+    ``fingerprint`` covers the robots completed so far; each robot is added
+    to it by ``start`` before it is simulated.
+    """
+
+    def __init__(
+        self,
+        store: CheckpointStore,
+        completed_robots: int = 0,
+        fingerprint: bytes = b"",
+        interval: float = 5.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.store = store
+        self.completed_robots = completed_robots
+        self.fingerprint = fingerprint
+        self.interval = interval
+        self.clock = clock
+        self.saves = 0
+        self._pending: list[FinalState] = []
+        self._in_progress: Optional[RobotProgress] = None
+        self._started_fingerprint = fingerprint
+        self._last_save = clock()
+
+    def start(self, robot_fingerprint: bytes):
+        self._started_fingerprint = extend_fingerprint(
+            self.fingerprint, robot_fingerprint
+        )
+
+    def complete(self, final_state: FinalState):
+        self._pending.append(final_state)
+        self.completed_robots += 1
+        self.fingerprint = self._started_fingerprint
+        self._in_progress = None
+        self._save_if_due()
+
+    def progress(self, robot_progress: RobotProgress):
+        self._in_progress = robot_progress
+        self._save_if_due()
+
+    def _save_if_due(self):
+        if self.clock() - self._last_save >= self.interval:
+            self.save()
+
+    def save(self):
+        fingerprint = (
+            self.fingerprint if self._in_progress is None else self._started_fingerprint
+        )
+        self.store.save(
+            FleetCheckpoint(self.completed_robots, self._in_progress, fingerprint),
+            self._pending,
+        )
+        self._pending = []
+        self._last_save = self.clock()
+        self.saves += 1
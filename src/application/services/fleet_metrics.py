@@ -0,0 +1,120 @@
+import time
+from contextlib import contextmanager
+from typing import Iterable, Iterator, TypeVar
+
+from src.domain.robot.packed_instructions import Instructions
+from src.domain.robot.value_objects import Position
+from src.domain.workspace.entity import WorkSpace
+
+T = TypeVar("T")
+
+_COUNTER_HELP = {
+    "robots_processed": "Robots that reached their final pose",
+    "result_cache_hits": "Robots whose final pose came from the result cache",
+    "steps_executed": "Instructions executed by robots",
+    "turns": "Turn instructions executed by robots",
+    "moves": "Move instructions executed by robots",
+    "bounds_checks": "Workspace bounds checks performed",
+}
+
+
+class FleetMetrics:
+    """Counters and per-stage timings collected while a fleet runs.
+
+    Services only touch it when one is passed in, so a run without metrics
+    pays nothing beyond a ``None`` check per robot.
+    """
+
+    def __init__(self):
+        self.counters = {name: 0 for name in _COUNTER_HELP}
+        self.stage_seconds: dict[str, float] = {}
+
+    def add_time(self, stage: str, seconds: float):
+        self.stage_seconds[stage] = self.stage_seconds.get(stage, 0.0) + seconds
+
+    @contextmanager
+    def time_stage(self, stage: str, exclude: tuple[str, ...] = ()) -> Iterator[None]:
+        """Time a block as ``stage``, minus the time the ``exclude`` stages
+        recorded inside it, so nested stages are not counted twice."""
+        nested_start = sum(self.stage_seconds.get(name, 0.0) for name in exclude)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            nested = sum(self.stage_seconds.get(name, 0.0) for name in exclude)
+            self.add_time(stage, elapsed - (nested - nested_start))
+
+    def time_iterator(self, stage: str, items: Iterable[T]) -> Iterator[T]:
+        iterator = iter(items)
+        while True:
+            start = time.perf_counter()
+            try:
+                item = next(iterator)
+            except StopIteration:
+                return
+            finally:
+                self.add_time(stage, time.perf_counter() - start)
+            yield item
+
+    def record_robot(self, instructions: Instructions):
+        """Count a robot that executed all of ``instructions``."""
+        self.counters["robots_processed"] += 1
+        self.record_commands(instructions)
+
+    def record_commands(self, instructions: Instructions):
+        """Count ``instructions`` as executed, for a robot that ran only
+        part of its instructions or finished without running them."""
+        moves = instructions.count("M")
+        turns = instructions.count("L") + instructions.count("R")
+        self.counters["steps_executed"] += moves + turns
+        self.counters["moves"] += moves
+        self.counters["turns"] += turns
+
+    def to_report(self) -> dict:
+        return {
+            "counters": dict(self.counters),
+            "stage_seconds": dict(self.stage_seconds),
+        }
+
+    def to_prometheus(self) -> str:
+        lines = []
+        for name, value in self.counters.items():
+            metric = f"robot_fleet_{name}_total"
+            lines.append(f"# HELP {metric} {_COUNTER_HELP[name]}")
+            lines.append(f"# TYPE {metric} counter")
+            lines.append(f"{metric} {value}")
+        lines.append("# HELP robot_fleet_stage_seconds_total Time spent per stage")
+        lines.append("# TYPE robot_fleet_stage_seconds_total counter")
+        for stage, seconds in self.stage_seconds.items():
+            lines.append(f'robot_fleet_stage_seconds_total{{stage="{stage}"}} {seconds}')
+        return "\n".join(lines) + "\n"
+
+
+class InstrumentedWorkSpace:
+    """Counts and times the bounds checks made against a workspace."""
+
+    def __init__(self, workspace: WorkSpace, metrics: FleetMetrics):
+        self._workspace = workspace
+        self._metrics = metrics
+
+    def __getattr__(self, name: str):
+        return getattr(self._workspace, name)
+
+    def _check(self, is_valid, *positions: Position) -> bool:
+        start = time.perf_counter()
+        result = is_valid(*positions)
+        self._metrics.add_time("bounds_check", time.perf_counter() - start)
+        self._metrics.counters["bounds_checks"] += 1
+        return result
+
+    def is_position_valid(self, position: Position) -> bool:
+        return self._check(self._workspace.is_position_valid, position)
+
+    def is_segment_valid(self, first_position: Position, last_position: Position) -> bool:
+        return self._check(
+            self._workspace.is_segment_valid, first_position, last_position
+        )
+
+    def is_area_valid(self, lower_left: Position, upper_right: Position) -> bool:
+        return self._check(self._workspace.is_area_valid, lower_left, upper_right)
@@ -0,0 +1,169 @@
+from enum import Enum
+
+from src.application.repository.robot_repository import RobotRepository
+from src.application.services.work_space import WorkSpaceService
+from src.domain.robot.entity import Robot
+from src.domain.robot.value_objects import Position
+from src.domain.workspace.entity import WorkSpace
+
+
+class ConflictPolicy(Enum):
+    # Wait in place and retry the same move on the next tick
+    BLOCK = "block"
+    # Drop the move and carry on with the next instruction
+    SKIP = "skip"
+    # Raise a ValueError for the first conflicting robot
+    FAIL = "fail"
+
+
+class FleetScheduler:
+    """Runs every robot in lock-step, one instruction per robot per tick.
+
+    All moves in a tick happen at once. A move is in conflict when another
+    robot with a lower index claims the same cell, when two robots would
+    swap cells, or when the target cell stays taken by a robot that is not
+    leaving it this tick. Conflicts are handled according to the
+    ``ConflictPolicy``. Robots are kept in the workspace occupancy map, so a
+    tick only touches the robots that still have instructions left.
+    """
+
+    def __init__(
+        self,
+        robot_repository: RobotRepository,
+        workspace_service: WorkSpaceService,
+        conflict_policy: ConflictPolicy = ConflictPolicy.BLOCK,
+    ):
+        self.robot_repository = robot_repository
+        self.workspace_service = workspace_service
+        self.conflict_policy = conflict_policy
+        self.tick_count = 0
+
+    def _place_robots(self, workspace: WorkSpace) -> tuple[list[Robot], list[str]]:
+        robots = []
+        instruction_list = []
+        for position, orientation, instructions in self.robot_repository.iter_robots():
+            if not workspace.is_position_valid(position=position):
+                if workspace.is_blocked(position=position):
+                    raise ValueError(
+                        f"Initial position {position} is blocked by an obstacle"
+                    )
+                if workspace.is_occupied(position=position):
+                    raise ValueError(
+                        f"Initial position {position} is occupied by another robot"
+                    )
+                raise ValueError(
+                    f"Initial position {position} is out of workspace bounds"
+                )
+            workspace.occupy(position, occupant=len(robots))
+            robots.append(Robot(position=position, orientation=orientation))
+            instruction_list.append(str(instructions))
+        return robots, instruction_list
+
+    def _find_blocked_moves(
+        self,
+        robots: list[Robot],
+        moves: dict[int, Position],
+        workspace: WorkSpace,
+    ) -> list[int]:
+        claims: dict[tuple[int, int], int] = {}
+        blocked = []
+        for index, target in moves.items():
+            cell = (target.x, target.y)
+            if cell in claims:
+                blocked.append(index)
+            else:
+                claims[cell] = index
+
+        for index in claims.values():
+            occupant = workspace.occupant_at(moves[index])
+            if occupant is None:
+                continue
+            if occupant not in moves or moves[occupant] == robots[index].position:
+                # Staying put, or swapping cells with this robot
+                blocked.append(index)
+
+        # A robot that stays where it is blocks whoever wanted its cell
+        is_blocked = set(blocked)
+        pending = list(blocked)
+        while pending:
+            position = robots[pending.pop()].position
+            follower = claims.get((position.x, position.y))
+            if follower is not None and follower not in is_blocked:
+                is_blocked.add(follower)
+                blocked.append(follower)
+                pending.append(follower)
+        return sorted(is_blocked)
+
+    def _run_tick(
+        self,
+        robots: list[Robot],
+        instruction_list: list[str],
+        next_instruction: list[int],
+        active: list[int],
+        workspace: WorkSpace,
+    ) -> bool:
+        progressed = False
+        moves: dict[int, Position] = {}
+        for index in active:
+            robot = robots[index]
+            command = instruction_list[index][next_instruction[index]]
+            if command != "M":
+                robot.execute_instructions(command, workspace)
+                next_instruction[index] += 1
+                progressed = True
+                continue
+            target = robot.position.move(robot.orientation)
+            if not workspace.is_within_bounds(target) or workspace.is_blocked(target):
+                # Let the robot report the out of bounds or blocked move
+                robot.execute_instructions(command, workspace)
+            moves[index] = target
+
+        blocked = self._find_blocked_moves(robots, moves, workspace)
+        if blocked and self.conflict_policy is ConflictPolicy.FAIL:
+            index = blocked[0]
+            raise ValueError(
+                f"Robot at index {index} collides with another robot "
+                f"at {moves[index]} on tick {self.tick_count}"
+            )
+        for index in blocked:
+            del moves[index]
+            if self.conflict_policy is ConflictPolicy.SKIP:
+                next_instruction[index] += 1
+                progressed = True
+
+        for index in moves:
+            workspace.release(robots[index].position)
+        for index in moves:
+            robot = robots[index]
+            robot.execute_instructions("M", workspace)
+            workspace.occupy(robot.position, occupant=index)
+            next_instruction[index] += 1
+            progressed = True
+        return progressed
+
+    def process_instructions(self) -> str:
+        workspace = self.workspace_service.get_workspace().empty_copy()
+        robots, instruction_list = self._place_robots(workspace)
+        next_instruction = [0] * len(robots)
+        active = [index for index in range(len(robots)) if instruction_list[index]]
+
+        self.tick_count = 0
+        while active:
+            if not self._run_tick(
+                robots, instruction_list, next_instruction, active, workspace
+            ):
+                raise ValueError(
+                    f"Robots at indexes {active} are deadlocked "
+                    f"on tick {self.tick_count}"
+                )
+            self.tick_count += 1
+            active = [
+                index for index in active
+                if next_instruction[index] < len(instruction_list[index])
+            ]
+
+        return "\n".join(
+            f"{robot.position.x} {robot.position.y} "
+            f"{robot.orientation.current_orientation}"
+            for robot in robots
+        )
@@ -0,0 +1,74 @@
+from collections import OrderedDict
+from typing import Optional
+
+from src.domain.robot.instruction_program import InstructionEffect, InstructionProgram
+from src.domain.robot.packed_instructions import Instructions
+
+
+class InstructionProgramCache:
+    """Least recently used cache of compiled programs and their effects,
+    keyed by instruction string or packed instructions.
+
+    ``maxsize`` bounds the number of entries (``None`` for no limit, ``0``
+    disables caching) and ``max_instruction_length`` keeps very long one-off
+    instruction strings from being held as keys. Strings shorter than
+    ``min_instruction_length`` run faster step by step than compiled, so
+    simulations skip the cache for them; ``0`` compiles every string, which
+    pays off when a few short strings repeat across the fleet.
+    """
+
+    def __init__(
+        self,
+        maxsize: Optional[int] = 1024,
+        max_instruction_length: Optional[int] = 4096,
+        min_instruction_length: int = 32,
+    ):
+        self.maxsize = maxsize
+        self.max_instruction_length = max_instruction_length
+        self.min_instruction_length = min_instruction_length
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: OrderedDict[
+            Instructions, tuple[InstructionProgram, InstructionEffect]
+        ] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(
+        self, instructions: Instructions
+    ) -> tuple[InstructionProgram, InstructionEffect]:
+        entry = self._entries.get(instructions)
+        if entry is not None:
+            self.hits += 1
+            self._entries.move_to_end(instructions)
+            return entry
+
+        self.misses += 1
+        program = InstructionProgram.compile(instructions)
+        entry = program, InstructionEffect.of(program)
+        if self._is_cacheable(instructions):
+            self._entries[instructions] = entry
+            if self.maxsize is not None and len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return entry
+
+    def compiles(self, instructions: Instructions) -> bool:
+        """Whether ``instructions`` are worth compiling rather than stepping."""
+        return len(instructions) >= self.min_instruction_length
+
+    def clear(self):
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _is_cacheable(self, instructions: Instructions) -> bool:
+        if self.maxsize == 0:
+            return False
+        return (
+            self.max_instruction_length is None
+            or len(instructions) <= self.max_instruction_length
+        )
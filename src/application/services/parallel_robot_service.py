@@ -0,0 +1,124 @@
+import os
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Iterator, Optional
+
+from src.application.repository.robot_repository import RobotRepository
+from src.application.services.instruction_program_cache import InstructionProgramCache
+from src.application.services.robot_service import simulate_robot
+from src.application.services.work_space import WorkSpaceService
+from src.domain.robot.value_objects import Position, Orientation
+from src.domain.workspace.entity import WorkSpace
+
+# Robots travel between processes as (x, y, orientation, instructions) and
+# come back as (x, y, orientation)
+RobotTuple = tuple[int, int, str, str]
+StateTuple = tuple[int, int, str]
+
+_worker_workspace: Optional[WorkSpace] = None
+_worker_program_cache: Optional[InstructionProgramCache] = None
+
+
+def _init_worker(workspace: WorkSpace):
+    global _worker_workspace, _worker_program_cache
+    _worker_workspace = workspace
+    _worker_program_cache = InstructionProgramCache()
+
+
+def _simulate_chunk(
+    robots: list[RobotTuple],
+) -> tuple[list[StateTuple], Optional[ValueError]]:
+    states = []
+    for x, y, orientation, instructions in robots:
+        try:
+            final_position, final_orientation = simulate_robot(
+                position=Position(x, y),
+                orientation=Orientation(orientation),
+                instructions=instructions,
+                workspace=_worker_workspace,
+                program_cache=_worker_program_cache,
+            )
+        except ValueError as e:
+            # Later robots in the chunk cannot change which error is raised
+            return states, e
+        states.append(
+            (final_position.x, final_position.y, final_orientation.current_orientation)
+        )
+    return states, None
+
+
+class ParallelRobotService:
+    """Runs robots across a pool of worker processes.
+
+    Robots never see each other, so the fleet is split into chunks that are
+    simulated independently and reassembled in input order. At most a few
+    chunks per worker are in flight, so memory stays bounded when robots
+    are streamed from the repository. The first failing robot in input
+    order raises, as with ``RobotService``.
+    """
+
+    def __init__(
+        self,
+        robot_repository: RobotRepository,
+        workspace_service: WorkSpaceService,
+        max_workers: Optional[int] = None,
+        chunk_size: int = 1024,
+    ):
+        self.robot_repository = robot_repository
+        self.workspace_service = workspace_service
+        self.max_workers = max_workers
+        self.chunk_size = chunk_size
+
+    def _iter_chunks(self) -> Iterator[list[RobotTuple]]:
+        chunk: list[RobotTuple] = []
+        try:
+            for position, orientation, instructions in self.robot_repository.iter_robots():
+                chunk.append(
+                    (position.x, position.y, orientation.current_orientation, instructions)
+                )
+                if len(chunk) == self.chunk_size:
+                    yield chunk
+                    chunk = []
+        except ValueError:
+            # Hand over the robots read before the bad record, then fail
+            if chunk:
+                yield chunk
+            raise
+        if chunk:
+            yield chunk
+
+    def _collect(self, future: Future, states: list[StateTuple]):
+        chunk_states, error = future.result()
+        if error is not None:
+            raise error
+        states.extend(chunk_states)
+
+    def process_instructions(self) -> str:
+        workspace = self.workspace_service.get_workspace()
+        max_workers = self.max_workers or os.cpu_count() or 1
+        states: list[StateTuple] = []
+        executor = ProcessPoolExecutor(
+            max_workers=max_workers, initializer=_init_worker, initargs=(workspace,)
+        )
+        try:
+            pending: deque[Future] = deque()
+            chunks = self._iter_chunks()
+            while True:
+                try:
+                    chunk = next(chunks, None)
+                except ValueError:
+                    # Robots read before the bad record still get to fail first
+                    while pending:
+                        self._collect(pending.popleft(), states)
+                    raise
+                if chunk is None:
+                    break
+                pending.append(executor.submit(_simulate_chunk, chunk))
+                if len(pending) > 2 * max_workers:
+                    self._collect(pending.popleft(), states)
+            while pending:
+                self._collect(pending.popleft(), states)
+        finally:
+            executor.shutdown(cancel_futures=True)
+
+        return "\n".join(f"{x} {y} {orientation}" for x, y, orientation in states)
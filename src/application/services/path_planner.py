@@ -0,0 +1,408 @@
+import heapq
+from array import array
+from collections import OrderedDict, deque
+from typing import Optional
+
+from src.application.services.work_space import WorkSpaceService
+from src.domain.robot.value_objects import HEADING_DELTAS, Orientation, Position
+from src.domain.workspace.entity import WorkSpace
+
+_UNREACHED = -1
+
+# Free cells explored around the start and the goal before A*, so a pose
+# shut in a small pocket is found unreachable without a full search
+_POCKET_CELLS = 1 << 12
+
+
+def format_pose(position: Position, orientation: Orientation) -> str:
+    return f"{position.x} {position.y} {orientation.current_orientation}"
+
+
+def uses_distance_fields(workspace: WorkSpace, max_field_cells: int) -> bool:
+    """Whether a workspace is small enough to flood whole distance fields."""
+    return (workspace.max_x + 1) * (workspace.max_y + 1) <= max_field_cells
+
+
+def _rotation(heading: int, other: int) -> int:
+    return min((heading - other) & 3, (other - heading) & 3)
+
+
+def _build_turn_table() -> dict[tuple[int, int, int, int], int]:
+    # Fewest turns from a heading to the goal heading that still face every
+    # direction the goal lies in, keyed by the signs of the offsets to it
+    headings = {delta: heading for heading, delta in enumerate(HEADING_DELTAS)}
+    table = {}
+    for sign_x in (-1, 0, 1):
+        for sign_y in (-1, 0, 1):
+            needed = [
+                headings[delta] for delta in ((sign_x, 0), (0, sign_y)) if any(delta)
+            ]
+            orders = [needed, needed[::-1]]
+            for heading in range(4):
+                for goal_heading in range(4):
+                    table[sign_x, sign_y, heading, goal_heading] = min(
+                        sum(
+                            _rotation(a, b)
+                            for a, b in zip([heading, *order], [*order, goal_heading])
+                        )
+                        for order in orders
+                    )
+    return table
+
+
+_TURNS_TO_GOAL = _build_turn_table()
+
+
+def _is_pocketed(workspace: WorkSpace, inside: Position, outside: Position) -> bool:
+    """Whether the free cells connected to ``inside`` are fewer than
+    ``_POCKET_CELLS`` and leave out ``outside``.
+
+    A robot turns on the spot, so it reaches exactly the cells connected to
+    its own; such a pocket proves ``outside`` unreachable from ``inside``.
+    """
+    target = (outside.x, outside.y)
+    seen = {(inside.x, inside.y)}
+    pending = [(inside.x, inside.y)]
+    while pending:
+        x, y = pending.pop()
+        for dx, dy in HEADING_DELTAS:
+            cell = (x + dx, y + dy)
+            if cell == target:
+                return False
+            if cell in seen or not workspace.is_position_valid(position=Position(*cell)):
+                continue
+            if len(seen) >= _POCKET_CELLS:
+                return False
+            seen.add(cell)
+            pending.append(cell)
+    return target not in seen
+
+
+def search_path(
+    workspace: WorkSpace,
+    start: Position,
+    start_orientation: Orientation,
+    goal: Position,
+    goal_orientation: Orientation,
+    max_expansions: int = 1 << 20,
+) -> Optional[str]:
+    """Shortest instruction string found by A*, or ``None`` when unreachable,
+    for workspaces too large to flood.
+
+    Raises ``ValueError`` when no answer is found after expanding
+    ``max_expansions`` states, which bounds both time and memory.
+    """
+    if _is_pocketed(workspace, goal, start) or _is_pocketed(workspace, start, goal):
+        return None
+    # A* over (x, y, heading); the estimate is the cost without obstacles,
+    # the Manhattan distance plus the fewest turns, so it never overestimates
+    goal_state = (goal.x, goal.y, goal_orientation.heading)
+    start_state = (start.x, start.y, start_orientation.heading)
+    costs = {start_state: 0}
+    parents: dict[tuple[int, int, int], tuple[tuple[int, int, int], str]] = {}
+    # Ties on the estimate go to the deepest state, so an open workspace is
+    # crossed along one path instead of every equally short one
+    frontier = [(0, 0, start_state)]
+    expansions = 0
+    while frontier:
+        _, negative_cost, state = heapq.heappop(frontier)
+        cost = -negative_cost
+        if state == goal_state:
+            return _rebuild_path(parents, state)
+        if cost > costs[state]:
+            continue
+        expansions += 1
+        if expansions > max_expansions:
+            raise ValueError(
+                f"No path from {format_pose(start, start_orientation)} to "
+                f"{format_pose(goal, goal_orientation)} found within "
+                f"{max_expansions} search states"
+            )
+        x, y, heading = state
+        dx, dy = HEADING_DELTAS[heading]
+        successors = [
+            ((x, y, (heading - 1) & 3), "L"),
+            ((x, y, (heading + 1) & 3), "R"),
+        ]
+        if workspace.is_position_valid(position=Position(x + dx, y + dy)):
+            successors.append(((x + dx, y + dy, heading), "M"))
+        for successor, command in successors:
+            if cost + 1 < costs.get(successor, cost + 2):
+                costs[successor] = cost + 1
+                parents[successor] = (state, command)
+                offset_x, offset_y = goal.x - successor[0], goal.y - successor[1]
+                estimate = abs(offset_x) + abs(offset_y) + _TURNS_TO_GOAL[
+                    (offset_x > 0) - (offset_x < 0),
+                    (offset_y > 0) - (offset_y < 0),
+                    successor[2],
+                    goal_state[2],
+                ]
+                heapq.heappush(frontier, (cost + 1 + estimate, -cost - 1, successor))
+    return None
+
+
+def _rebuild_path(
+    parents: dict[tuple[int, int, int], tuple[tuple[int, int, int], str]],
+    state: tuple[int, int, int],
+) -> str:
+    commands = []
+    while state in parents:
+        state, command = parents[state]
+        commands.append(command)
+    return "".join(reversed(commands))
+
+
+class FreeCellGrid:
+    """Snapshot of the cells of a workspace a robot may stand on, one byte
+    per cell, row by row from the origin."""
+
+    def __init__(self, workspace: WorkSpace):
+        self.width = workspace.max_x + 1
+        self.height = workspace.max_y + 1
+        self.cells = bytearray(b"\x01") * (self.width * self.height)
+        if workspace.obstacles is not None:
+            for x1, y1, x2, y2 in workspace.obstacles.rectangles:
+                for y in range(y1, y2 + 1):
+                    start = y * self.width
+                    self.cells[start + x1:start + x2 + 1] = bytes(x2 - x1 + 1)
+        for x, y in workspace.occupied_cells:
+            self.cells[y * self.width + x] = 0
+        # Flat index offset of one step along each heading
+        self.step_offsets = tuple(dx + dy * self.width for dx, dy in HEADING_DELTAS)
+
+    def __len__(self) -> int:
+        return len(self.cells)
+
+    def cell_of(self, position: Position) -> int:
+        return position.y * self.width + position.x
+
+    def neighbour(self, cell: int, heading: int) -> int:
+        """Cell one step away along ``heading``, or -1 when it is not free."""
+        dx, dy = HEADING_DELTAS[heading]
+        y, x = divmod(cell, self.width)
+        return self.neighbour_at(cell, x + dx, y + dy, heading)
+
+    def previous(self, cell: int, heading: int) -> int:
+        """Cell one step back from ``heading``, or -1 when it is not free."""
+        dx, dy = HEADING_DELTAS[heading]
+        y, x = divmod(cell, self.width)
+        return self.neighbour_at(cell, x - dx, y - dy, heading ^ 2)
+
+    def neighbour_at(self, cell: int, x: int, y: int, heading: int) -> int:
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            return -1
+        neighbour = cell + self.step_offsets[heading]
+        return neighbour if self.cells[neighbour] else -1
+
+
+class DistanceField:
+    """Instruction count from every ``(x, y, heading)`` state to one goal
+    pose, filled by a reverse breadth-first flood from the goal.
+
+    Every command costs one instruction, so following any command that
+    lowers the distance by one yields a shortest instruction string.
+    """
+
+    def __init__(self, grid: FreeCellGrid, goal: Position, goal_orientation: Orientation):
+        self.grid = grid
+        self.goal = goal
+        self.goal_orientation = goal_orientation
+        self.distances = array("i", [_UNREACHED]) * (4 * len(grid))
+        goal_state = grid.cell_of(goal) * 4 + goal_orientation.heading
+        self.distances[goal_state] = 0
+        self._flood(goal_state)
+
+    def _flood(self, goal_state: int):
+        grid, distances = self.grid, self.distances
+        queue = deque((goal_state,))
+        while queue:
+            state = queue.popleft()
+            next_distance = distances[state] + 1
+            cell, heading = divmod(state, 4)
+            # States that reach this one with L, with R and with M
+            predecessors = [cell * 4 + ((heading + 1) & 3), cell * 4 + ((heading - 1) & 3)]
+            previous_cell = grid.previous(cell, heading)
+            if previous_cell >= 0:
+                predecessors.append(previous_cell * 4 + heading)
+            for predecessor in predecessors:
+                if distances[predecessor] == _UNREACHED:
+                    distances[predecessor] = next_distance
+                    queue.append(predecessor)
+
+    def distance(self, position: Position, orientation: Orientation) -> int:
+        """Shortest instruction count to the goal, or -1 when unreachable."""
+        return self.distances[self.grid.cell_of(position) * 4 + orientation.heading]
+
+    def path_from(self, position: Position, orientation: Orientation) -> Optional[str]:
+        """Shortest instruction string to the goal, or ``None`` when unreachable."""
+        grid, distances = self.grid, self.distances
+        cell, heading = self.grid.cell_of(position), orientation.heading
+        remaining = distances[cell * 4 + heading]
+        if remaining == _UNREACHED:
+            return None
+        commands = []
+        while remaining:
+            remaining -= 1
+            next_cell = grid.neighbour(cell, heading)
+            if next_cell >= 0 and distances[next_cell * 4 + heading] == remaining:
+                commands.append("M")
+                cell = next_cell
+            elif distances[cell * 4 + ((heading - 1) & 3)] == remaining:
+                commands.append("L")
+                heading = (heading - 1) & 3
+            else:
+                commands.append("R")
+                heading = (heading + 1) & 3
+        return "".join(commands)
+
+
+class StartDistanceField:
+    """Instruction count from one start pose to every ``(x, y, heading)``
+    state, filled by a forward breadth-first flood from the start."""
+
+    def __init__(self, grid: FreeCellGrid, start: Position, start_orientation: Orientation):
+        self.grid = grid
+        self.start = start
+        self.start_orientation = start_orientation
+        self.distances = array("i", [_UNREACHED]) * (4 * len(grid))
+        start_state = grid.cell_of(start) * 4 + start_orientation.heading
+        self.distances[start_state] = 0
+        self._flood(start_state)
+
+    def _flood(self, start_state: int):
+        grid, distances = self.grid, self.distances
+        queue = deque((start_state,))
+        while queue:
+            state = queue.popleft()
+            next_distance = distances[state] + 1
+            cell, heading = divmod(state, 4)
+            # States reached from this one with L, with R and with M
+            successors = [cell * 4 + ((heading - 1) & 3), cell * 4 + ((heading + 1) & 3)]
+            next_cell = grid.neighbour(cell, heading)
+            if next_cell >= 0:
+                successors.append(next_cell * 4 + heading)
+            for successor in successors:
+                if distances[successor] == _UNREACHED:
+                    distances[successor] = next_distance
+                    queue.append(successor)
+
+    def distance(self, position: Position, orientation: Orientation) -> int:
+        """Shortest instruction count from the start, or -1 when unreachable."""
+        return self.distances[self.grid.cell_of(position) * 4 + orientation.heading]
+
+    def path_to(self, position: Position, orientation: Orientation) -> Optional[str]:
+        """Shortest instruction string from the start, or ``None`` when unreachable."""
+        grid, distances = self.grid, self.distances
+        cell, heading = self.grid.cell_of(position), orientation.heading
+        remaining = distances[cell * 4 + heading]
+        if remaining == _UNREACHED:
+            return None
+        # Walk back to the start, then reverse the commands
+        commands = []
+        while remaining:
+            remaining -= 1
+            previous_cell = grid.previous(cell, heading)
+            if previous_cell >= 0 and distances[previous_cell * 4 + heading] == remaining:
+                commands.append("M")
+                cell = previous_cell
+            elif distances[cell * 4 + ((heading + 1) & 3)] == remaining:
+                commands.append("L")
+                heading = (heading + 1) & 3
+            else:
+                commands.append("R")
+                heading = (heading - 1) & 3
+        return "".join(reversed(commands))
+
+
+class PathPlanner:
+    """Shortest ``L``/``R``/``M`` instruction strings between poses.
+
+    The first query for a goal floods a ``DistanceField`` over the whole
+    workspace; later queries for the same goal only walk the answer. Fields
+    are kept in a least recently used cache of ``maxsize`` goals. Workspaces
+    over ``max_field_cells`` cells are searched with A* per query instead,
+    giving up with ``ValueError`` after ``max_search_states`` states.
+
+    Obstacles and occupied cells are read once, on the first query;
+    ``clear`` picks up later changes to the workspace.
+    """
+
+    def __init__(
+        self,
+        workspace_service: WorkSpaceService,
+        maxsize: Optional[int] = 64,
+        max_field_cells: int = 1 << 20,
+        max_search_states: int = 1 << 20,
+    ):
+        self.workspace_service = workspace_service
+        self.maxsize = maxsize
+        self.max_field_cells = max_field_cells
+        self.max_search_states = max_search_states
+        self.hits = 0
+        self.misses = 0
+        self._workspace: Optional[WorkSpace] = None
+        self._grid: Optional[FreeCellGrid] = None
+        self._fields: OrderedDict[tuple[int, int, int], DistanceField] = OrderedDict()
+
+    def _get_workspace(self) -> WorkSpace:
+        if self._workspace is None:
+            self._workspace = self.workspace_service.get_workspace()
+        return self._workspace
+
+    def _get_grid(self) -> FreeCellGrid:
+        if self._grid is None:
+            self._grid = FreeCellGrid(self._get_workspace())
+        return self._grid
+
+    def get_distance_field(
+        self, goal: Position, goal_orientation: Orientation
+    ) -> DistanceField:
+        key = (goal.x, goal.y, goal_orientation.heading)
+        field = self._fields.get(key)
+        if field is not None:
+            self.hits += 1
+            self._fields.move_to_end(key)
+            return field
+
+        self.misses += 1
+        field = DistanceField(self._get_grid(), goal, goal_orientation)
+        if self.maxsize != 0:
+            self._fields[key] = field
+            if self.maxsize is not None and len(self._fields) > self.maxsize:
+                self._fields.popitem(last=False)
+        return field
+
+    def plan(
+        self,
+        start: Position,
+        start_orientation: Orientation,
+        goal: Position,
+        goal_orientation: Orientation,
+    ) -> str:
+        workspace = self._get_workspace()
+        for name, position in (("Start", start), ("Goal", goal)):
+            if not workspace.is_position_valid(position=position):
+                raise ValueError(f"{name} position {position} is not a free cell")
+
+        if uses_distance_fields(workspace, self.max_field_cells):
+            path = self.get_distance_field(goal, goal_orientation).path_from(
+                start, start_orientation
+            )
+        else:
+            path = search_path(
+                workspace, start, start_orientation, goal, goal_orientation,
+                max_expansions=self.max_search_states,
+            )
+        if path is None:
+            raise ValueError(
+                f"Goal {format_pose(goal, goal_orientation)} is unreachable "
+                f"from {format_pose(start, start_orientation)}"
+            )
+        return path
+
+    def clear(self):
+        self._workspace = None
+        self._grid = None
+        self._fields.clear()
+        self.hits = 0
+        self.misses = 0
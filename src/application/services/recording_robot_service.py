@@ -0,0 +1,82 @@
+from functools import partial
+from itertools import count
+from typing import Callable, Iterator, Optional
+
+from src.application.repository.checkpoint_store import FinalState
+from src.application.repository.robot_repository import RobotRepository
+from src.application.repository.trajectory_writer import TrajectoryWriter
+from src.application.services.fleet_metrics import FleetMetrics
+from src.application.services.instruction_program_cache import InstructionProgramCache
+from src.application.services.robot_error_table import RobotErrorTable
+from src.application.services.robot_service import (
+    RobotService,
+    simulate_robot_trajectory,
+)
+from src.application.services.work_space import WorkSpaceService
+from src.domain.robot.packed_instructions import Instructions
+from src.domain.robot.trajectory import Trajectory
+from src.domain.robot.value_objects import Position, Orientation
+from src.domain.workspace.entity import WorkSpace
+
+
+class RecordingRobotService(RobotService):
+    """``RobotService`` that steps every robot and writes each pose it
+    visits to ``trajectory_writer``."""
+
+    def __init__(
+        self,
+        robot_repository: RobotRepository,
+        workspace_service: WorkSpaceService,
+        trajectory_writer: TrajectoryWriter,
+        program_cache: Optional[InstructionProgramCache] = None,
+        metrics: Optional[FleetMetrics] = None,
+        park_finished_robots: bool = False,
+        error_table: Optional[RobotErrorTable] = None,
+    ):
+        super().__init__(
+            robot_repository=robot_repository,
+            workspace_service=workspace_service,
+            program_cache=program_cache,
+            metrics=metrics,
+            park_finished_robots=park_finished_robots,
+            error_table=error_table,
+        )
+        self.trajectory_writer = trajectory_writer
+
+    def _iter_final_states(
+        self,
+        workspace: WorkSpace,
+        robots: Iterator[tuple[Position, Orientation, Instructions]],
+    ) -> Iterator[FinalState]:
+        return self._flush_when_done(
+            super()._iter_final_states(workspace, robots), self.trajectory_writer
+        )
+
+    def _simulator(
+        self, workspace: WorkSpace, first_index: int
+    ) -> Callable[..., tuple[Position, Orientation]]:
+        return partial(self._simulate_with_trajectory, count(first_index))
+
+    def _simulate_with_trajectory(
+        self,
+        robot_indexes: Iterator[int],
+        position: Position,
+        orientation: Orientation,
+        instructions: Instructions,
+        workspace: WorkSpace,
+        program_cache: InstructionProgramCache,
+    ) -> tuple[Position, Orientation]:
+        robot_index = next(robot_indexes)
+        trajectory = Trajectory()
+        try:
+            return simulate_robot_trajectory(
+                position=position,
+                orientation=orientation,
+                instructions=instructions,
+                workspace=workspace,
+                trajectory=trajectory,
+            )
+        finally:
+            # A failing robot's path up to the failure is kept for audits
+            if len(trajectory):
+                self.trajectory_writer.write(robot_index, trajectory)
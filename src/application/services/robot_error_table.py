@@ -0,0 +1,54 @@
+from array import array
+from typing import Iterator
+
+from src.domain.robot.robot_failure import RobotFailure
+from src.domain.robot.value_objects import HEADING_NAMES, Orientation, Position
+
+
+class RobotErrorTable:
+    """Failures of a fail-soft run in robot order, stored column by column."""
+
+    def __init__(self):
+        self.robot_indexes = array("q")
+        self.steps = array("q")
+        self.xs = array("i")
+        self.ys = array("i")
+        self.headings = array("b")
+        self.reasons: list[str] = []
+
+    def __len__(self) -> int:
+        return len(self.reasons)
+
+    def record(self, failure: RobotFailure):
+        self.robot_indexes.append(failure.robot_index)
+        self.steps.append(failure.step)
+        self.xs.append(failure.position.x)
+        self.ys.append(failure.position.y)
+        self.headings.append(failure.orientation.heading)
+        self.reasons.append(failure.reason)
+
+    def __iter__(self) -> Iterator[RobotFailure]:
+        orientations = [Orientation(name) for name in HEADING_NAMES]
+        for robot_index, step, x, y, heading, reason in zip(
+            self.robot_indexes, self.steps, self.xs, self.ys, self.headings, self.reasons
+        ):
+            yield RobotFailure(
+                robot_index=robot_index,
+                step=step,
+                position=Position(x, y),
+                orientation=orientations[heading],
+                reason=reason,
+            )
+
+    def failed_indexes(self) -> list[int]:
+        """Indexes of the robots to fix and run again."""
+        return list(self.robot_indexes)
+
+    def format_lines(self) -> Iterator[str]:
+        """One ``index step x y heading reason`` line per failure."""
+        for failure in self:
+            yield (
+                f"{failure.robot_index} {failure.step} {failure.position.x} "
+                f"{failure.position.y} {failure.orientation.current_orientation} "
+                f"{failure.reason}"
+            )
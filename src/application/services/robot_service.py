@@ -1,7 +1,130 @@
+from contextlib import nullcontext
+from functools import partial
+from itertools import count
+from typing import Callable, Iterator, Optional, Union
+
+from src.application.repository.checkpoint_store import FinalState
+from src.application.repository.output_writer import OutputWriter
 from src.application.repository.robot_repository import RobotRepository
+from src.application.repository.simulation_result_cache import SimulationResultCache
+from src.application.repository.trajectory_writer import TrajectoryWriter
+from src.application.services.fleet_metrics import FleetMetrics, InstrumentedWorkSpace
+from src.application.services.instruction_program_cache import InstructionProgramCache
+from src.application.services.robot_error_table import RobotErrorTable
 from src.application.services.work_space import WorkSpaceService
 from src.domain.robot.entity import Robot
+from src.domain.robot.packed_instructions import Instructions
+from src.domain.robot.robot_failure import RobotFailure
+from src.domain.robot.trajectory import StepCounter, Trajectory
 from src.domain.robot.value_objects import Position, Orientation
+from src.domain.workspace.entity import WorkSpace
+
+
+def simulate_robot(
+    position: Position,
+    orientation: Orientation,
+    instructions: Instructions,
+    workspace: WorkSpace,
+    program_cache: InstructionProgramCache,
+) -> tuple[Position, Orientation]:
+    check_initial_position(position, workspace)
+    robot = Robot(position=position, orientation=orientation)
+    if program_cache.compiles(instructions):
+        program, effect = program_cache.get(instructions)
+        robot.execute_program(program=program, workspace=workspace, effect=effect)
+    else:
+        robot.execute_instructions(instructions, workspace)
+    return robot.get_state()
+
+
+def simulate_robot_trajectory(
+    position: Position,
+    orientation: Orientation,
+    instructions: Instructions,
+    workspace: WorkSpace,
+    trajectory: Trajectory,
+) -> tuple[Position, Orientation]:
+    """Simulate one robot step by step, appending every pose it visits,
+    its start included, to ``trajectory``."""
+    check_initial_position(position, workspace)
+    robot = Robot(position=position, orientation=orientation)
+    trajectory.append(position, orientation)
+    robot.execute_instructions(instructions, workspace, trajectory=trajectory)
+    return robot.get_state()
+
+
+def _move_command_index(instructions: Instructions, moves: int) -> int:
+    """Index of the command making forward move number ``moves``, counted
+    from zero, found by bisecting on the number of moves before an index."""
+    if isinstance(instructions, str):
+        def moves_before(end: int) -> int:
+            return instructions.count("M", 0, end)
+    else:
+        def moves_before(end: int) -> int:
+            return instructions[:end].count("M")
+    low, high = 0, len(instructions)
+    while low < high:
+        middle = (low + high) // 2
+        if moves_before(middle + 1) > moves:
+            high = middle
+        else:
+            low = middle + 1
+    return low
+
+
+def locate_failure(
+    robot_index: int,
+    position: Position,
+    orientation: Orientation,
+    instructions: Instructions,
+    workspace: WorkSpace,
+    reason: str,
+    program_cache: InstructionProgramCache,
+) -> RobotFailure:
+    """Find the step and pose a failed robot stopped at.
+
+    A robot that left the workspace is located on the path envelope of its
+    program; any other failure is replayed, counting commands."""
+    if not workspace.is_position_valid(position=position):
+        return RobotFailure(robot_index, 0, position, orientation, reason)
+    _, effect = program_cache.get(instructions)
+    path_exit = effect.envelope.first_exit(
+        position,
+        orientation,
+        Position(workspace.min_x, workspace.min_y),
+        Position(workspace.max_x, workspace.max_y),
+    )
+    # An obstacle or robot on the way would have stopped it first
+    if path_exit is not None and workspace.is_area_valid(
+        path_exit.lower_left, path_exit.upper_right
+    ):
+        return RobotFailure(
+            robot_index,
+            _move_command_index(instructions, path_exit.moves) + 1,
+            path_exit.position,
+            path_exit.orientation,
+            reason,
+        )
+    robot = Robot(position=position, orientation=orientation)
+    steps = StepCounter()
+    try:
+        robot.execute_instructions(instructions, workspace, trajectory=steps)
+    except ValueError:
+        pass
+    return RobotFailure(robot_index, steps.count + 1, *robot.get_state(), reason)
+
+
+def check_initial_position(position: Position, workspace: WorkSpace):
+    if not workspace.is_position_valid(position=position):
+        if workspace.is_blocked(position=position):
+            raise ValueError(
+                f"Initial position {position} is blocked by an obstacle"
+            )
+        if workspace.is_occupied(position=position):
+            raise ValueError(
+                f"Initial position {position} is occupied by another robot"
+            )
+        raise ValueError(f"Initial position {position} is out of workspace bounds")
 
 
 class RobotService:
@@ -10,47 +133,192 @@ class RobotService:
         self,
         robot_repository: RobotRepository,
         workspace_service: WorkSpaceService,
+        program_cache: Optional[InstructionProgramCache] = None,
+        metrics: Optional[FleetMetrics] = None,
+        park_finished_robots: bool = False,
+        error_table: Optional[RobotErrorTable] = None,
     ):
         self.robot_repository = robot_repository
         self.workspace_service = workspace_service
+        self.program_cache = (
+            program_cache if program_cache is not None else InstructionProgramCache()
+        )
+        self.metrics = metrics
+        self.park_finished_robots = park_finished_robots
+        # Failures are recorded here, and the run carries on, when set
+        self.error_table = error_table
 
-    def _parse_robot_position_orientation(
-        self, position_list: list[Position], orientation_list: list[Orientation]
-    ) -> str:
-        result_position_orientation = []
-        for i in range(len(position_list)):
-            position = position_list[i]
-            orientation = orientation_list[i]
-            result_position_orientation.append(
-                f"{position.x} {position.y} {orientation.current_orientation}"
-            )
-        return "\n".join(result_position_orientation)
+    def _format_robot_state(self, position: Position, orientation: Orientation) -> str:
+        return f"{position.x} {position.y} {orientation.current_orientation}"
 
-    def process_instructions(self) -> str:
-        instruction_list = self.robot_repository.get_robot_instruction_list()
-        initial_position_list = self.robot_repository.get_robot_position_list()
-        initial_orientation_list = self.robot_repository.get_robot_orientation_list()
+    def _format_robot_failure(self, failure: RobotFailure) -> str:
+        return f"ERROR {failure.reason}"
+
+    def _format_final_state(self, final_state: FinalState) -> str:
+        if isinstance(final_state, RobotFailure):
+            return self._format_robot_failure(final_state)
+        return self._format_robot_state(*final_state)
 
+    def _format_final_states(self, final_states: list[FinalState]) -> str:
+        return "\n".join(map(self._format_final_state, final_states))
+
+    def iter_final_states(
+        self,
+    ) -> Iterator[FinalState]:
+        """Final pose of every robot in input order. With an error table, a
+        robot that fails yields its ``RobotFailure`` instead of raising."""
         workspace = self.workspace_service.get_workspace()
-        final_position_list = []
-        final_orientation_list = []
-        for i in range(len(instruction_list)):
-            if not workspace.is_position_valid(position=initial_position_list[i]):
-                raise ValueError(
-                    f"Initial position {initial_position_list} is out of workspace bounds"
+        robots = self.robot_repository.iter_robots()
+        if self.park_finished_robots:
+            # Parked robots belong to this run, not to the shared workspace
+            workspace = workspace.empty_copy()
+        return self._iter_final_states(workspace, robots)
+
+    def _iter_final_states(
+        self,
+        workspace: WorkSpace,
+        robots: Iterator[tuple[Position, Orientation, Instructions]],
+    ) -> Iterator[FinalState]:
+        return self._iter_simulated_final_states(workspace, robots)
+
+    def _simulator(
+        self, workspace: WorkSpace, first_index: int
+    ) -> Callable[..., tuple[Position, Orientation]]:
+        """Function simulating one robot of a run whose first robot has
+        index ``first_index``."""
+        return simulate_robot
+
+    def _iter_simulated_final_states(
+        self,
+        workspace: WorkSpace,
+        robots: Iterator[tuple[Position, Orientation, Instructions]],
+        simulate: Optional[Callable[..., tuple[Position, Orientation]]] = None,
+        first_index: int = 0,
+    ) -> Iterator[FinalState]:
+        if simulate is None:
+            simulate = self._simulator(workspace, first_index)
+        if self.error_table is not None:
+            simulate = partial(self._simulate_fail_soft, count(first_index), simulate)
+
+        if self.metrics is not None:
+            final_states = self._iter_instrumented_final_states(
+                workspace, robots, simulate
+            )
+        else:
+            final_states = (
+                simulate(
+                    position=position,
+                    orientation=orientation,
+                    instructions=instructions,
+                    workspace=workspace,
+                    program_cache=self.program_cache,
                 )
+                for position, orientation, instructions in robots
+            )
+
+        if self.park_finished_robots:
+            final_states = self._park_finished_robots(workspace, final_states)
+        return final_states
 
-            robot = Robot(
-                position=initial_position_list[i],
-                orientation=initial_orientation_list[i],
+    def _simulate_fail_soft(
+        self,
+        robot_indexes: Iterator[int],
+        simulate: Callable[..., tuple[Position, Orientation]],
+        position: Position,
+        orientation: Orientation,
+        instructions: Instructions,
+        workspace: WorkSpace,
+        program_cache: InstructionProgramCache,
+    ) -> FinalState:
+        robot_index = next(robot_indexes)
+        try:
+            return simulate(
+                position=position,
+                orientation=orientation,
+                instructions=instructions,
+                workspace=workspace,
+                program_cache=program_cache,
             )
-            robot.execute_instructions(
-                instructions=instruction_list[i], workspace=workspace
+        except ValueError as error:
+            failure = locate_failure(
+                robot_index,
+                position,
+                orientation,
+                instructions,
+                workspace,
+                str(error),
+                program_cache,
             )
-            final_position, final_orientation = robot.get_state()
-            final_position_list.append(final_position)
-            final_orientation_list.append(final_orientation)
-        return self._parse_robot_position_orientation(
-            position_list=final_position_list,
-            orientation_list=final_orientation_list,
-        )
+            self.error_table.record(failure)
+            return failure
+
+    def _flush_when_done(
+        self,
+        final_states: Iterator[FinalState],
+        sink: Union[SimulationResultCache, TrajectoryWriter],
+    ) -> Iterator[FinalState]:
+        try:
+            yield from final_states
+        finally:
+            # Robots finished before a failure are kept
+            sink.flush()
+
+    def _park_finished_robots(
+        self,
+        workspace: WorkSpace,
+        final_states: Iterator[tuple[Position, Orientation]],
+    ) -> Iterator[tuple[Position, Orientation]]:
+        for final_state in final_states:
+            if not isinstance(final_state, RobotFailure):
+                workspace.occupy(final_state[0])
+            yield final_state
+
+    def _iter_instrumented_final_states(
+        self,
+        workspace: WorkSpace,
+        robots: Iterator[tuple[Position, Orientation, Instructions]],
+        simulate: Callable[..., tuple[Position, Orientation]] = simulate_robot,
+    ) -> Iterator[tuple[Position, Orientation]]:
+        workspace = InstrumentedWorkSpace(workspace, self.metrics)
+        counters = self.metrics.counters
+        for position, orientation, instructions in self.metrics.time_iterator(
+            "parse", robots
+        ):
+            cache_hits = counters["result_cache_hits"]
+            with self.metrics.time_stage("simulate", exclude=("bounds_check",)):
+                final_state = simulate(
+                    position=position,
+                    orientation=orientation,
+                    instructions=instructions,
+                    workspace=workspace,
+                    program_cache=self.program_cache,
+                )
+            # Only the commands a robot actually ran are counted
+            if isinstance(final_state, RobotFailure):
+                self.metrics.record_commands(instructions[:max(final_state.step - 1, 0)])
+            elif counters["result_cache_hits"] != cache_hits:
+                counters["robots_processed"] += 1
+            else:
+                self.metrics.record_robot(instructions)
+            yield final_state
+
+    def write_final_states(self, output_writer: OutputWriter) -> int:
+        robot_count = 0
+        try:
+            for final_state in self.iter_final_states():
+                output_writer.write_line(self._format_final_state(final_state))
+                robot_count += 1
+        finally:
+            # Robots finished before a failure are still delivered
+            output_writer.flush()
+        return robot_count
+
+    def process_instructions(self) -> str:
+        # Failures stay in place so every line still matches its robot
+        final_states = list(self.iter_final_states())
+        with (
+            self.metrics.time_stage("format")
+            if self.metrics is not None
+            else nullcontext()
+        ):
+            return self._format_final_states(final_states)
@@ -0,0 +1,37 @@
+import hashlib
+
+from src.domain.robot.packed_instructions import Instructions
+from src.domain.robot.value_objects import Orientation, Position
+from src.domain.workspace.entity import WorkSpace
+
+# Bump whenever simulation rules change, so cached results are not reused
+FINGERPRINT_VERSION = 1
+
+
+def fingerprint_workspace(workspace: WorkSpace) -> bytes:
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(
+        f"v{FINGERPRINT_VERSION} {workspace.min_x} {workspace.min_y} "
+        f"{workspace.max_x} {workspace.max_y}".encode()
+    )
+    if workspace.obstacles is not None:
+        for rectangle in workspace.obstacles.rectangles:
+            digest.update(" {} {} {} {}".format(*rectangle).encode())
+    return digest.digest()
+
+
+def fingerprint_robot(
+    workspace_fingerprint: bytes,
+    position: Position,
+    orientation: Orientation,
+    instructions: Instructions,
+) -> bytes:
+    digest = hashlib.blake2b(workspace_fingerprint, digest_size=16)
+    digest.update(f"{position.x} {position.y} {orientation.heading} ".encode())
+    digest.update(str(instructions).encode())
+    return digest.digest()
+
+
+def extend_fingerprint(fingerprint: bytes, robot_fingerprint: bytes) -> bytes:
+    """Fingerprint of a run so far, ``fingerprint``, followed by one more robot."""
+    return hashlib.blake2b(fingerprint + robot_fingerprint, digest_size=16).digest()
@@ -1,5 +1,13 @@
+from typing import Optional, Union
+
 from src.domain.workspace.entity import WorkSpace
 from src.domain.robot.value_objects import Position, Orientation
+from src.domain.robot.instruction_program import (
+    InstructionEffect,
+    InstructionProgram,
+)
+from src.domain.robot.packed_instructions import MOVE, TURN_LEFT, PackedInstructions
+from src.domain.robot.trajectory import StepCounter, Trajectory
 
 
 class Robot:
@@ -16,12 +24,41 @@ class Robot:
     def _move_forward(self, workspace: WorkSpace):
         next_position = self.position.move(self.orientation)
         if not workspace.is_position_valid(next_position):
+            if workspace.is_blocked(next_position):
+                raise ValueError(
+                    f"Position {next_position} is blocked by an obstacle"
+                )
+            if workspace.is_occupied(next_position):
+                raise ValueError(
+                    f"Position {next_position} is occupied by another robot"
+                )
             raise ValueError(
                 f"Position {next_position} is out of workspace bounds"
             )
         self.position = next_position
 
-    def execute_instructions(self, instructions: str, workspace: WorkSpace):
+    def _move_forward_steps(self, steps: int, workspace: WorkSpace):
+        first_position = self.position.move(self.orientation)
+        last_position = self.position.move(self.orientation, steps)
+        if workspace.is_segment_valid(first_position, last_position):
+            self.position = last_position
+            return
+        # Replay step by step to stop at, and report, the first invalid position
+        for _ in range(steps):
+            self._move_forward(workspace)
+
+    def execute_instructions(
+        self,
+        instructions: Union[str, PackedInstructions],
+        workspace: WorkSpace,
+        trajectory: Union[Trajectory, StepCounter, None] = None,
+    ):
+        if trajectory is not None:
+            self._execute_recorded_instructions(instructions, workspace, trajectory)
+            return
+        if isinstance(instructions, PackedInstructions):
+            self._execute_packed_instructions(instructions, workspace)
+            return
         for command in instructions:
             if command == "L":
                 self._turn_left()
@@ -32,5 +69,97 @@ class Robot:
             else:
                 raise ValueError(f"Invalid instruction: {command}")
 
+    def _execute_packed_instructions(
+        self, instructions: PackedInstructions, workspace: WorkSpace
+    ):
+        # Packed commands were validated when packed
+        for code in instructions:
+            if code == MOVE:
+                self._move_forward(workspace)
+            elif code == TURN_LEFT:
+                self._turn_left()
+            else:
+                self._turn_right()
+
+    def _execute_recorded_instructions(
+        self,
+        instructions: Union[str, PackedInstructions],
+        workspace: WorkSpace,
+        trajectory: Union[Trajectory, StepCounter],
+    ):
+        # Kept apart from the plain loops so they pay nothing for recording
+        commands = instructions
+        if isinstance(instructions, PackedInstructions):
+            commands = map("LRM".__getitem__, instructions)
+        for command in commands:
+            if command == "L":
+                self._turn_left()
+            elif command == "R":
+                self._turn_right()
+            elif command == "M":
+                self._move_forward(workspace)
+            else:
+                raise ValueError(f"Invalid instruction: {command}")
+            trajectory.append(self.position, self.orientation)
+
+    def _apply_effect(self, effect: InstructionEffect, workspace: WorkSpace) -> bool:
+        min_dx, max_dx, min_dy, max_dy = effect.bounding_box(self.orientation)
+        x, y = self.position.x, self.position.y
+        if not workspace.is_area_valid(
+            Position(x + min_dx, y + min_dy), Position(x + max_dx, y + max_dy)
+        ):
+            return False
+        delta_x, delta_y = effect.displacement(self.orientation)
+        self.position = Position(x + delta_x, y + delta_y)
+        self.orientation = self.orientation.rotate(effect.quarter_turns)
+        return True
+
+    def _reject_path_leaving_workspace(
+        self, effect: InstructionEffect, workspace: WorkSpace
+    ):
+        min_dx, max_dx, min_dy, max_dy = effect.bounding_box(self.orientation)
+        x, y = self.position.x, self.position.y
+        if (
+            workspace.is_within_bounds(Position(x + min_dx, y + min_dy))
+            and workspace.is_within_bounds(Position(x + max_dx, y + max_dy))
+        ) or effect.envelope is None:
+            return
+        path_exit = effect.envelope.first_exit(
+            self.position,
+            self.orientation,
+            Position(workspace.min_x, workspace.min_y),
+            Position(workspace.max_x, workspace.max_y),
+        )
+        # An obstacle or robot on the way would stop the robot first
+        if path_exit is None or not workspace.is_area_valid(
+            path_exit.lower_left, path_exit.upper_right
+        ):
+            return
+        self.position = path_exit.position
+        self.orientation = path_exit.orientation
+        raise ValueError(f"Position {path_exit.next_position} is out of workspace bounds")
+
+    def execute_program(
+        self,
+        program: InstructionProgram,
+        workspace: WorkSpace,
+        effect: Optional[InstructionEffect] = None,
+    ):
+        if (
+            effect is not None
+            and program.invalid_instruction is None
+            and self._apply_effect(effect, workspace)
+        ):
+            return
+        if effect is not None:
+            self._reject_path_leaving_workspace(effect, workspace)
+        for quarter_turns, steps in program.segments:
+            if quarter_turns:
+                self.orientation = self.orientation.rotate(quarter_turns)
+            if steps:
+                self._move_forward_steps(steps, workspace)
+        if program.invalid_instruction is not None:
+            raise ValueError(f"Invalid instruction: {program.invalid_instruction}")
+
     def get_state(self) -> tuple[Position, Orientation]:
         return self.position, self.orientation
@@ -0,0 +1,249 @@
+import re
+from array import array
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from functools import cached_property
+from itertools import accumulate
+from operator import neg
+from typing import NamedTuple, Optional, Union
+
+from src.domain.robot.packed_instructions import PackedInstructions
+from src.domain.robot.value_objects import HEADING_DELTAS, Orientation, Position
+
+_INSTRUCTION_RUN = re.compile(r"([LR]*)(M*)")
+_PACKED_INSTRUCTION_RUN = re.compile(rb"([\x00\x01]*)(\x02*)")
+_INVALID_INSTRUCTION = re.compile(r"[^LRM]")
+
+
+@dataclass(frozen=True)
+class InstructionProgram:
+    """Instruction string compiled into straight segments.
+
+    Each segment is a ``(quarter_turns, steps)`` pair: a run of turns folded
+    into a single clockwise rotation, followed by a run of forward moves.
+    An invalid command stops compilation and is kept so it is reported
+    only after every command before it has run.
+    """
+
+    segments: tuple[tuple[int, int], ...]
+    invalid_instruction: Optional[str] = None
+
+    @classmethod
+    def compile(
+        cls, instructions: Union[str, PackedInstructions]
+    ) -> "InstructionProgram":
+        if isinstance(instructions, PackedInstructions):
+            return cls._compile_packed(instructions)
+        invalid_match = _INVALID_INSTRUCTION.search(instructions)
+        if invalid_match is not None:
+            instructions = instructions[: invalid_match.start()]
+
+        segments = []
+        for turns, moves in _INSTRUCTION_RUN.findall(instructions):
+            quarter_turns = (turns.count("R") - turns.count("L")) % 4
+            if quarter_turns or moves:
+                segments.append((quarter_turns, len(moves)))
+
+        return cls(
+            segments=tuple(segments),
+            invalid_instruction=(
+                invalid_match.group() if invalid_match is not None else None
+            ),
+        )
+
+    @classmethod
+    def _compile_packed(cls, instructions: PackedInstructions) -> "InstructionProgram":
+        # Same runs as for strings, matched over the codes with L=0, R=1, M=2
+        segments = []
+        for turns, moves in _PACKED_INSTRUCTION_RUN.findall(instructions.codes()):
+            quarter_turns = (turns.count(1) - turns.count(0)) % 4
+            if quarter_turns or moves:
+                segments.append((quarter_turns, len(moves)))
+        return cls(segments=tuple(segments))
+
+
+def _rotate_box(
+    box: tuple[int, int, int, int], quarter_turns: int
+) -> tuple[int, int, int, int]:
+    """Rotate a ``(min_x, max_x, min_y, max_y)`` box clockwise about the origin."""
+    min_x, max_x, min_y, max_y = box
+    for _ in range(quarter_turns & 3):
+        min_x, max_x, min_y, max_y = min_y, max_y, -max_x, -min_x
+    return min_x, max_x, min_y, max_y
+
+
+def _rotate_offset(x: int, y: int, quarter_turns: int) -> tuple[int, int]:
+    for _ in range(quarter_turns & 3):
+        x, y = y, -x
+    return x, y
+
+
+class PathExit(NamedTuple):
+    """Where a path first leaves a box: the last ``position`` inside it,
+    the ``orientation`` held there and the ``next_position`` outside it.
+    ``lower_left`` and ``upper_right`` bound the path up to ``position``,
+    reached after ``moves`` forward moves."""
+
+    position: Position
+    orientation: Orientation
+    next_position: Position
+    lower_left: Position
+    upper_right: Position
+    moves: int
+
+
+@dataclass(frozen=True)
+class PathEnvelope:
+    """Running extrema of a program's path for a robot starting north at
+    the origin, one entry per run of moves.
+
+    The extrema only ever grow, so the first run that leaves a box is found
+    by bisection instead of by stepping.
+    """
+
+    end_xs: array
+    end_ys: array
+    end_moves: array
+    headings: array
+    max_xs: array
+    negated_min_xs: array
+    max_ys: array
+    negated_min_ys: array
+
+    @classmethod
+    def of(cls, program: "InstructionProgram") -> "PathEnvelope":
+        headings = accumulate(quarter_turns for quarter_turns, _ in program.segments)
+        runs = [
+            (heading & 3, steps)
+            for heading, (_, steps) in zip(headings, program.segments)
+            if steps
+        ]
+        end_xs = array("i", accumulate(HEADING_DELTAS[h][0] * steps for h, steps in runs))
+        end_ys = array("i", accumulate(HEADING_DELTAS[h][1] * steps for h, steps in runs))
+        return cls(
+            end_xs=end_xs,
+            end_ys=end_ys,
+            end_moves=array("q", accumulate(steps for _, steps in runs)),
+            headings=array("b", (heading for heading, _ in runs)),
+            max_xs=array("i", accumulate(end_xs, max, initial=0))[1:],
+            negated_min_xs=array("i", accumulate(map(neg, end_xs), max, initial=0))[1:],
+            max_ys=array("i", accumulate(end_ys, max, initial=0))[1:],
+            negated_min_ys=array("i", accumulate(map(neg, end_ys), max, initial=0))[1:],
+        )
+
+    def first_exit(
+        self,
+        position: Position,
+        orientation: Orientation,
+        lower_left: Position,
+        upper_right: Position,
+    ) -> Optional[PathExit]:
+        """First step of the path from ``position`` that leaves the box from
+        ``lower_left`` to ``upper_right``, or ``None`` if it stays inside."""
+        # Bring the box into the frame of a robot starting north at the origin
+        min_x, max_x, min_y, max_y = _rotate_box(
+            (
+                lower_left.x - position.x,
+                upper_right.x - position.x,
+                lower_left.y - position.y,
+                upper_right.y - position.y,
+            ),
+            -orientation.heading,
+        )
+        run = min(
+            bisect_right(self.max_xs, max_x),
+            bisect_right(self.negated_min_xs, -min_x),
+            bisect_right(self.max_ys, max_y),
+            bisect_right(self.negated_min_ys, -min_y),
+        )
+        if run == len(self.headings):
+            return None
+
+        x = y = low_x = high_x = low_y = high_y = moves = 0
+        if run:
+            x, y = self.end_xs[run - 1], self.end_ys[run - 1]
+            moves = self.end_moves[run - 1]
+            low_x, high_x = -self.negated_min_xs[run - 1], self.max_xs[run - 1]
+            low_y, high_y = -self.negated_min_ys[run - 1], self.max_ys[run - 1]
+        heading = self.headings[run]
+        delta_x, delta_y = HEADING_DELTAS[heading]
+        # Moves of this run that stay inside the box
+        if delta_x:
+            steps = max_x - x if delta_x > 0 else x - min_x
+        else:
+            steps = max_y - y if delta_y > 0 else y - min_y
+        x += delta_x * steps
+        y += delta_y * steps
+        low_x, high_x, low_y, high_y = _rotate_box(
+            (min(low_x, x), max(high_x, x), min(low_y, y), max(high_y, y)),
+            orientation.heading,
+        )
+        last_x, last_y = _rotate_offset(x, y, orientation.heading)
+        next_x, next_y = _rotate_offset(
+            x + delta_x, y + delta_y, orientation.heading
+        )
+        return PathExit(
+            position=Position(position.x + last_x, position.y + last_y),
+            orientation=orientation.rotate(heading),
+            next_position=Position(position.x + next_x, position.y + next_y),
+            lower_left=Position(position.x + low_x, position.y + low_y),
+            upper_right=Position(position.x + high_x, position.y + high_y),
+            moves=moves + steps,
+        )
+
+
+@dataclass(frozen=True)
+class InstructionEffect:
+    """Relative effect of running a program, for each starting heading.
+
+    Displacements and bounding boxes are offsets from the start position,
+    indexed by starting heading in N, E, S, W order. A bounding box is
+    ``(min_dx, max_dx, min_dy, max_dy)`` over every position on the path.
+    """
+
+    quarter_turns: int
+    displacements: tuple[tuple[int, int], ...]
+    bounding_boxes: tuple[tuple[int, int, int, int], ...]
+    program: Optional[InstructionProgram] = field(default=None, compare=False, repr=False)
+
+    @classmethod
+    def of(cls, program: InstructionProgram) -> "InstructionEffect":
+        heading = 0
+        x = y = 0
+        min_x = max_x = min_y = max_y = 0
+        for quarter_turns, steps in program.segments:
+            heading = (heading + quarter_turns) % 4
+            delta_x, delta_y = HEADING_DELTAS[heading]
+            x += delta_x * steps
+            y += delta_y * steps
+            min_x, max_x = min(min_x, x), max(max_x, x)
+            min_y, max_y = min(min_y, y), max(max_y, y)
+
+        displacements = []
+        bounding_boxes = []
+        for _ in range(4):
+            displacements.append((x, y))
+            bounding_boxes.append((min_x, max_x, min_y, max_y))
+            # Starting a quarter turn clockwise rotates the whole path with it
+            x, y = y, -x
+            min_x, max_x, min_y, max_y = min_y, max_y, -max_x, -min_x
+
+        return cls(
+            quarter_turns=heading,
+            displacements=tuple(displacements),
+            bounding_boxes=tuple(bounding_boxes),
+            program=program,
+        )
+
+    @cached_property
+    def envelope(self) -> Optional[PathEnvelope]:
+        """Built on first use, as only paths that may leave the workspace need it."""
+        if self.program is None:
+            return None
+        return PathEnvelope.of(self.program)
+
+    def displacement(self, orientation: Orientation) -> tuple[int, int]:
+        return self.displacements[orientation.heading]
+
+    def bounding_box(self, orientation: Orientation) -> tuple[int, int, int, int]:
+        return self.bounding_boxes[orientation.heading]
@@ -0,0 +1,145 @@
+import re
+from typing import Iterator, Union
+
+# Commands are stored as 2-bit codes, four to a byte, lowest bits first
+TURN_LEFT, TURN_RIGHT, MOVE = range(3)
+
+_COMMANDS = b"LRM"
+_INVALID_INSTRUCTION = re.compile(r"[^LRM]")
+_ENCODE_TABLE = bytes.maketrans(_COMMANDS, bytes(range(len(_COMMANDS))))
+_DECODE_TABLE = bytes.maketrans(bytes(range(len(_COMMANDS))), _COMMANDS)
+
+# Packed bytes unpacked at once while iterating, to bound the temporary copy
+_UNPACK_BLOCK_SIZE = 1 << 16
+
+# Below this many packed bytes a table lookup per byte beats unpacking the
+# whole stream as one integer
+_SHORT_PACKED_SIZE = 64
+
+_UNPACKED_BYTES = [
+    bytes((value >> shift) & 3 for shift in (0, 2, 4, 6)) for value in range(256)
+]
+
+# Bytes whose four codes are all commands; code 3 stands for none
+_VALID_BYTES = bytes(value for value in range(256) if 3 not in _UNPACKED_BYTES[value])
+
+
+def _pack_codes(codes: bytes) -> bytes:
+    # Every code fits in 2 bits, so shifting the whole byte string as one
+    # integer moves each code within its own byte
+    codes += bytes(-len(codes) % 4)
+    packed = 0
+    for shift in range(4):
+        packed |= int.from_bytes(codes[shift::4], "little") << (2 * shift)
+    return packed.to_bytes(len(codes) // 4, "little")
+
+
+def _unpack_codes(packed: bytes) -> bytes:
+    if len(packed) < _SHORT_PACKED_SIZE:
+        return b"".join(map(_UNPACKED_BYTES.__getitem__, packed))
+    value = int.from_bytes(packed, "little")
+    mask = int.from_bytes(b"\x03" * len(packed), "little")
+    codes = bytearray(4 * len(packed))
+    for shift in range(4):
+        codes[shift::4] = ((value >> (2 * shift)) & mask).to_bytes(len(packed), "little")
+    return bytes(codes)
+
+
+class PackedInstructions:
+    """Immutable ``L``/``R``/``M`` command stream stored 2 bits per command.
+
+    Commands are validated once when packing, and packed bytes once when
+    constructed, so iterating yields the codes ``TURN_LEFT``, ``TURN_RIGHT``
+    and ``MOVE`` with no further checks, at a quarter of the memory of the
+    instruction string.
+    """
+
+    __slots__ = ("_data", "_length")
+
+    def __init__(self, data: bytes, length: int):
+        if len(data) != (length + 3) // 4:
+            raise ValueError(
+                f"Packed instructions of length {length} need "
+                f"{(length + 3) // 4} bytes, got {len(data)}"
+            )
+        data = bytes(data)
+        if length % 4 and data[-1] >> (2 * (length % 4)):
+            raise ValueError(
+                f"Packed instructions of length {length} have padding bits set"
+            )
+        if data.translate(None, _VALID_BYTES):
+            index = next(
+                index for index, code in enumerate(_unpack_codes(data)) if code == 3
+            )
+            raise ValueError(f"Invalid instruction code 3 at command {index}")
+        self._data = data
+        self._length = length
+
+    @classmethod
+    def pack(cls, instructions: str) -> "PackedInstructions":
+        invalid_match = _INVALID_INSTRUCTION.search(instructions)
+        if invalid_match is not None:
+            raise ValueError(f"Invalid instruction: {invalid_match.group()}")
+        codes = instructions.encode("ascii").translate(_ENCODE_TABLE)
+        return cls(_pack_codes(codes), len(instructions))
+
+    @property
+    def data(self) -> bytes:
+        return self._data
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, PackedInstructions):
+            return NotImplemented
+        return self._length == other._length and self._data == other._data
+
+    def __hash__(self) -> int:
+        return hash((self._data, self._length))
+
+    def __repr__(self) -> str:
+        return f"PackedInstructions.pack({str(self)!r})"
+
+    def __str__(self) -> str:
+        return self.codes().translate(_DECODE_TABLE).decode("ascii")
+
+    def __reduce__(self):
+        return PackedInstructions, (self._data, self._length)
+
+    def codes(self) -> bytes:
+        """Every command code, one per byte."""
+        return _unpack_codes(self._data)[: self._length]
+
+    def __iter__(self) -> Iterator[int]:
+        remaining = self._length
+        for start in range(0, len(self._data), _UNPACK_BLOCK_SIZE):
+            codes = _unpack_codes(self._data[start:start + _UNPACK_BLOCK_SIZE])
+            yield from codes[:remaining]
+            remaining -= len(codes)
+
+    def __getitem__(self, index: slice) -> "PackedInstructions":
+        if not isinstance(index, slice):
+            raise TypeError("PackedInstructions can only be sliced")
+        start, stop, step = index.indices(self._length)
+        if step != 1:
+            raise ValueError("PackedInstructions slices cannot have a step")
+        length = max(stop - start, 0)
+        if start % 4:
+            codes = _unpack_codes(self._data[start // 4:(start + length + 3) // 4 + 1])
+            offset = start % 4
+            return PackedInstructions(_pack_codes(codes[offset:offset + length]), length)
+        # Slices from a byte boundary reuse the packed bytes as they are
+        data = bytearray(self._data[start // 4:(start + length + 3) // 4])
+        if length % 4:
+            data[-1] &= (1 << (2 * (length % 4))) - 1
+        return PackedInstructions(bytes(data), length)
+
+    def count(self, command: str) -> int:
+        if len(command) != 1 or command not in "LRM":
+            return 0
+        return self.codes().count(_COMMANDS.index(command.encode("ascii")))
+
+
+# Instructions as handed out by the robot repositories
+Instructions = Union[str, PackedInstructions]
@@ -0,0 +1,19 @@
+from dataclasses import dataclass
+
+from src.domain.robot.value_objects import Orientation, Position
+
+
+@dataclass(frozen=True)
+class RobotFailure:
+    """Why and where one robot stopped.
+
+    ``step`` is the 1-based index of the command that failed, or 0 when the
+    start pose itself was rejected. ``position`` and ``orientation`` are the
+    last pose the robot reached.
+    """
+
+    robot_index: int
+    step: int
+    position: Position
+    orientation: Orientation
+    reason: str
@@ -0,0 +1,48 @@
+from array import array
+from typing import Iterator
+
+from src.domain.robot.value_objects import HEADING_NAMES, Orientation, Position
+
+
+class Trajectory:
+    """Poses visited by a robot, stored column by column in typed arrays.
+
+    Each pose costs 9 bytes (two 4-byte coordinates and a 1-byte heading)
+    instead of a pair of Python objects per step.
+    """
+
+    __slots__ = ("xs", "ys", "headings")
+
+    def __init__(self):
+        self.xs = array("i")
+        self.ys = array("i")
+        self.headings = array("b")
+
+    def __len__(self) -> int:
+        return len(self.xs)
+
+    def append(self, position: Position, orientation: Orientation):
+        self.xs.append(position.x)
+        self.ys.append(position.y)
+        self.headings.append(orientation.heading)
+
+    def __iter__(self) -> Iterator[tuple[Position, Orientation]]:
+        orientations = [Orientation(name) for name in HEADING_NAMES]
+        for x, y, heading in zip(self.xs, self.ys, self.headings):
+            yield Position(x, y), orientations[heading]
+
+
+class StepCounter:
+    """Stands in for a ``Trajectory`` when only the number of poses matters,
+    so a long path can be followed without being stored."""
+
+    __slots__ = ("count",)
+
+    def __init__(self):
+        self.count = 0
+
+    def __len__(self) -> int:
+        return self.count
+
+    def append(self, position: Position, orientation: Orientation):
+        self.count += 1
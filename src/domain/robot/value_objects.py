@@ -1,43 +1,105 @@
-from dataclasses import dataclass
 from typing_extensions import Literal
 
+# Headings are encoded as 0-3 clockwise from north
+HEADING_NAMES = ("N", "E", "S", "W")
+
+HEADING_DELTAS = ((0, 1), (1, 0), (0, -1), (-1, 0))
+
 
-@dataclass(frozen=True)
 class Orientation:
-    current_orientation: Literal["N", "E", "S", "W"]
+    """Immutable heading. There is a single interned instance per heading,
+    so turning is a tuple lookup and never allocates.
+    """
+
+    __slots__ = ("_heading",)
 
-    _TURN_LEFT_MAP = {"N": "W", "W": "S", "S": "E", "E": "N"}
+    _BY_NAME: dict[str, "Orientation"] = {}
 
-    _TURN_RIGHT_MAP = {"N": "E", "E": "S", "S": "W", "W": "N"}
+    _BY_HEADING: tuple["Orientation", ...] = ()
 
-    def __post_init__(self):
-        if self.current_orientation not in self._TURN_LEFT_MAP:
+    def __new__(cls, current_orientation: Literal["N", "E", "S", "W"]):
+        try:
+            return cls._BY_NAME[current_orientation]
+        except (KeyError, TypeError):
             raise ValueError(
-                f"Invalid orientation: {self.current_orientation}. "
-                f"Must be one of {list(self._TURN_LEFT_MAP.keys())}"
-            )
+                f"Invalid orientation: {current_orientation}. "
+                "Must be one of ['N', 'W', 'S', 'E']"
+            ) from None
+
+    @classmethod
+    def _intern(cls, heading: int) -> "Orientation":
+        orientation = object.__new__(cls)
+        object.__setattr__(orientation, "_heading", heading)
+        return orientation
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"cannot assign to field '{name}'")
+
+    @property
+    def heading(self) -> int:
+        return self._heading
 
+    @property
+    def current_orientation(self) -> Literal["N", "E", "S", "W"]:
+        return HEADING_NAMES[self._heading]
+
+    def __repr__(self) -> str:
+        return f"Orientation(current_orientation={self.current_orientation!r})"
+
+    def __reduce__(self):
+        return Orientation, (self.current_orientation,)
 
     def turn_left(self) -> "Orientation":
-        new_orientation = self._TURN_LEFT_MAP[self.current_orientation]
-        return Orientation(new_orientation)
+        return self._BY_HEADING[(self._heading - 1) & 3]
 
     def turn_right(self) -> "Orientation":
-        new_orientation = self._TURN_RIGHT_MAP[self.current_orientation]
-        return Orientation(new_orientation)
+        return self._BY_HEADING[(self._heading + 1) & 3]
+
+    def rotate(self, quarter_turns: int) -> "Orientation":
+        return self._BY_HEADING[(self._heading + quarter_turns) & 3]
+
+
+Orientation._BY_HEADING = tuple(Orientation._intern(heading) for heading in range(4))
+Orientation._BY_NAME = dict(zip(HEADING_NAMES, Orientation._BY_HEADING))
 
 
-@dataclass(frozen=True)
 class Position:
-    x: int
-    y: int
-
-    def move(self, orientation: Orientation) -> "Position":
-        if orientation.current_orientation == "N":
-            return Position(self.x, self.y + 1)
-        if orientation.current_orientation == "E":
-            return Position(self.x + 1, self.y)
-        if orientation.current_orientation == "S":
-            return Position(self.x, self.y - 1)
-        if orientation.current_orientation == "W":
-            return Position(self.x - 1, self.y)
\ No newline at end of file
+    __slots__ = ("_x", "_y")
+
+    def __init__(self, x: int, y: int):
+        _set_x(self, x)
+        _set_y(self, y)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"cannot assign to field '{name}'")
+
+    def __reduce__(self):
+        return Position, (self._x, self._y)
+
+    @property
+    def x(self) -> int:
+        return self._x
+
+    @property
+    def y(self) -> int:
+        return self._y
+
+    def __eq__(self, other) -> bool:
+        if other.__class__ is not Position:
+            return NotImplemented
+        return self._x == other._x and self._y == other._y
+
+    def __hash__(self) -> int:
+        return hash((self._x, self._y))
+
+    def __repr__(self) -> str:
+        return f"Position(x={self._x!r}, y={self._y!r})"
+
+    def move(self, orientation: Orientation, steps: int = 1) -> "Position":
+        delta_x, delta_y = HEADING_DELTAS[orientation.heading]
+        return Position(self._x + delta_x * steps, self._y + delta_y * steps)
+
+
+# Slot setters used by the constructor, which bypass the assignment guard
+_set_x = Position._x.__set__
+_set_y = Position._y.__set__
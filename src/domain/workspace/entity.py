@@ -1,7 +1,20 @@
+from bisect import bisect_left, insort
+from typing import Any, Optional
+
 from src.domain.robot.value_objects import Position
+from src.domain.workspace.obstacle_map import ObstacleMap
+
+
+def _has_value_between(values: Optional[list[int]], first: int, last: int) -> bool:
+    if not values:
+        return False
+    low, high = min(first, last), max(first, last)
+    index = bisect_left(values, low)
+    return index < len(values) and values[index] <= high
+
 
 class WorkSpace:
-    def __init__(self, max_x: int, max_y: int):
+    def __init__(self, max_x: int, max_y: int, obstacles: Optional[ObstacleMap] = None):
         if max_x <= 0 or max_y <= 0:
             raise ValueError(
                 f"Workspace dimensions must be non-negative, "
@@ -11,7 +24,118 @@ class WorkSpace:
         self.max_y = max_y
         self.min_x = 0
         self.min_y = 0
-        
-    def is_position_valid(self, position: Position) -> bool:
+        # An empty obstacle map is dropped so lookups can skip it
+        self.obstacles = obstacles or None
+        if self.obstacles is not None:
+            for x1, y1, x2, y2 in self.obstacles.rectangles:
+                if not (self.is_within_bounds(Position(x1, y1)) and
+                        self.is_within_bounds(Position(x2, y2))):
+                    raise ValueError(
+                        f"Obstacle {(x1, y1, x2, y2)} is out of workspace bounds"
+                    )
+        # Occupant of each taken cell, plus sorted per-row and per-column
+        # indexes of the same cells for segment and area queries
+        self.occupied_cells: dict[tuple[int, int], Any] = {}
+        self._occupied_rows: dict[int, list[int]] = {}
+        self._occupied_columns: dict[int, list[int]] = {}
+
+    def empty_copy(self) -> "WorkSpace":
+        """Workspace with the same layout and obstacles and no occupied cells."""
+        return WorkSpace(max_x=self.max_x, max_y=self.max_y, obstacles=self.obstacles)
+
+    def occupy(self, position: Position, occupant: Any = True):
+        cell = (position.x, position.y)
+        if cell in self.occupied_cells:
+            self.occupied_cells[cell] = occupant
+            return
+        self.occupied_cells[cell] = occupant
+        insort(self._occupied_rows.setdefault(position.y, []), position.x)
+        insort(self._occupied_columns.setdefault(position.x, []), position.y)
+
+    def release(self, position: Position):
+        cell = (position.x, position.y)
+        if cell not in self.occupied_cells:
+            return
+        del self.occupied_cells[cell]
+        for index, key, value in (
+            (self._occupied_rows, position.y, position.x),
+            (self._occupied_columns, position.x, position.y),
+        ):
+            values = index[key]
+            del values[bisect_left(values, value)]
+            if not values:
+                del index[key]
+
+    def is_occupied(self, position: Position) -> bool:
+        return (position.x, position.y) in self.occupied_cells
+
+    def occupant_at(self, position: Position) -> Any:
+        return self.occupied_cells.get((position.x, position.y))
+
+    def is_blocked(self, position: Position) -> bool:
+        return self.obstacles is not None and \
+               self.obstacles.is_blocked(position.x, position.y)
+
+    def is_within_bounds(self, position: Position) -> bool:
         return self.min_x <= position.x <= self.max_x and \
-               self.min_y <= position.y <= self.max_y
\ No newline at end of file
+               self.min_y <= position.y <= self.max_y
+
+    def is_position_valid(self, position: Position) -> bool:
+        return self.is_within_bounds(position) and \
+               not self.is_blocked(position) and \
+               (not self.occupied_cells or not self.is_occupied(position))
+
+    def is_segment_valid(self, first_position: Position, last_position: Position) -> bool:
+        # The workspace is a rectangle, so a straight segment stays inside it
+        # whenever both of its ends do
+        if not (self.is_within_bounds(first_position) and
+                self.is_within_bounds(last_position)):
+            return False
+        if self.obstacles is not None:
+            if first_position.y == last_position.y:
+                if not self.obstacles.is_row_clear(
+                    first_position.y, first_position.x, last_position.x
+                ):
+                    return False
+            elif not self.obstacles.is_column_clear(
+                first_position.x, first_position.y, last_position.y
+            ):
+                return False
+        if not self.occupied_cells:
+            return True
+        if first_position.y == last_position.y:
+            return not _has_value_between(
+                self._occupied_rows.get(first_position.y),
+                first_position.x,
+                last_position.x,
+            )
+        return not _has_value_between(
+            self._occupied_columns.get(first_position.x),
+            first_position.y,
+            last_position.y,
+        )
+
+    def is_area_valid(self, lower_left: Position, upper_right: Position) -> bool:
+        if not (self.is_within_bounds(lower_left) and
+                self.is_within_bounds(upper_right)):
+            return False
+        if self.obstacles is not None and not self.obstacles.is_area_clear(
+            lower_left.x, lower_left.y, upper_right.x, upper_right.y
+        ):
+            return False
+        if not self.occupied_cells:
+            return True
+        # Scan whichever is smaller: the rows of the area or the occupied rows
+        if upper_right.y - lower_left.y < len(self._occupied_rows):
+            rows = (
+                self._occupied_rows.get(y)
+                for y in range(lower_left.y, upper_right.y + 1)
+            )
+        else:
+            rows = (
+                xs for y, xs in self._occupied_rows.items()
+                if lower_left.y <= y <= upper_right.y
+            )
+        return not any(
+            _has_value_between(xs, lower_left.x, upper_right.x) for xs in rows
+        )
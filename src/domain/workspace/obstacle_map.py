@@ -0,0 +1,136 @@
+from bisect import bisect_left, bisect_right
+from typing import Iterable, Optional
+
+# Obstacles are given as inclusive (x1, y1, x2, y2) rectangles; a single
+# blocked cell is a rectangle with x1 == x2 and y1 == y2
+Rectangle = tuple[int, int, int, int]
+
+# Merged runs of one row or column: run i covers starts[i]..ends[i]
+Runs = tuple[list[int], list[int]]
+
+# Consecutive rows (or columns) sharing the same runs: band i covers
+# band_starts[i] up to the next band start, the last band has no runs
+Bands = tuple[list[int], list[Optional[Runs]]]
+
+
+def _runs_overlap(runs: Runs, first: int, last: int) -> bool:
+    starts, ends = runs
+    index = bisect_left(ends, min(first, last))
+    return index < len(ends) and starts[index] <= max(first, last)
+
+
+def _merge_spans(spans: list[tuple[int, int]]) -> Runs:
+    starts: list[int] = []
+    ends: list[int] = []
+    for start, end in sorted(spans):
+        if ends and start <= ends[-1] + 1:
+            ends[-1] = max(ends[-1], end)
+        else:
+            starts.append(start)
+            ends.append(end)
+    return starts, ends
+
+
+def _build_bands(extents: list[tuple[int, int, int, int]]) -> Bands:
+    # Sweep (first, last, start, end) extents along the band axis; the runs
+    # only change where an extent begins or ends
+    boundaries = sorted({first for first, _, _, _ in extents} |
+                        {last + 1 for _, last, _, _ in extents})
+    pending = sorted(extents, reverse=True)
+    active: list[tuple[int, int, int, int]] = []
+    band_starts: list[int] = []
+    band_runs: list[Optional[Runs]] = []
+    for boundary in boundaries:
+        active = [extent for extent in active if extent[1] >= boundary]
+        while pending and pending[-1][0] == boundary:
+            active.append(pending.pop())
+        runs = _merge_spans([(start, end) for _, _, start, end in active]) if active else None
+        if band_runs and band_runs[-1] == runs:
+            continue
+        band_starts.append(boundary)
+        band_runs.append(runs)
+    return band_starts, band_runs
+
+
+def _runs_at(bands: Bands, index: int) -> Optional[Runs]:
+    band_starts, band_runs = bands
+    band = bisect_right(band_starts, index) - 1
+    return band_runs[band] if band >= 0 else None
+
+
+class ObstacleMap:
+    """Blocked cells of a workspace, stored as bands of consecutive rows
+    (and of columns) that share the same merged runs.
+
+    Memory and build time depend on the number of rectangles, not on their
+    area, so a no-go zone over a huge grid costs as much as a pillar. A cell
+    lookup is a bisect over the bands plus one over the few runs of its
+    band, and a straight segment is checked against its row or column in
+    one go. The bands are built on the first lookup, so a workspace can
+    reject out-of-bounds rectangles before any of that work is done.
+    """
+
+    def __init__(self, rectangles: Iterable[Rectangle] = ()):
+        self.rectangles: list[Rectangle] = []
+        for x1, y1, x2, y2 in rectangles:
+            x1, x2 = min(x1, x2), max(x1, x2)
+            y1, y2 = min(y1, y2), max(y1, y2)
+            self.rectangles.append((x1, y1, x2, y2))
+        self._row_bands: Optional[Bands] = None
+        self._column_bands: Optional[Bands] = None
+
+    def __bool__(self) -> bool:
+        return bool(self.rectangles)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, ObstacleMap):
+            return NotImplemented
+        return self.row_bands() == other.row_bands()
+
+    def __repr__(self) -> str:
+        return f"ObstacleMap(rectangles={self.rectangles!r})"
+
+    def row_bands(self) -> Bands:
+        """Runs of blocked x values per band of rows."""
+        if self._row_bands is None:
+            self._row_bands = _build_bands(
+                [(y1, y2, x1, x2) for x1, y1, x2, y2 in self.rectangles]
+            )
+        return self._row_bands
+
+    def column_bands(self) -> Bands:
+        """Runs of blocked y values per band of columns."""
+        if self._column_bands is None:
+            self._column_bands = _build_bands(
+                [(x1, x2, y1, y2) for x1, y1, x2, y2 in self.rectangles]
+            )
+        return self._column_bands
+
+    def _row_runs(self, y: int) -> Optional[Runs]:
+        return _runs_at(self.row_bands(), y)
+
+    def _column_runs(self, x: int) -> Optional[Runs]:
+        return _runs_at(self.column_bands(), x)
+
+    def is_blocked(self, x: int, y: int) -> bool:
+        runs = self._row_runs(y)
+        return runs is not None and _runs_overlap(runs, x, x)
+
+    def is_row_clear(self, y: int, first_x: int, last_x: int) -> bool:
+        runs = self._row_runs(y)
+        return runs is None or not _runs_overlap(runs, first_x, last_x)
+
+    def is_column_clear(self, x: int, first_y: int, last_y: int) -> bool:
+        runs = self._column_runs(x)
+        return runs is None or not _runs_overlap(runs, first_y, last_y)
+
+    def is_area_clear(self, min_x: int, min_y: int, max_x: int, max_y: int) -> bool:
+        # Only the bands overlapping the rows of the area need a look
+        band_starts, band_runs = self.row_bands()
+        band = max(bisect_right(band_starts, min_y) - 1, 0)
+        while band < len(band_starts) and band_starts[band] <= max_y:
+            runs = band_runs[band]
+            if runs is not None and _runs_overlap(runs, min_x, max_x):
+                return False
+            band += 1
+        return True
@@ -0,0 +1,198 @@
+"""Run many mission files in one process.
+
+Missions are given as directories (every ``*.txt`` file inside), glob
+patterns, or ``@manifest`` files listing one mission path per line. Results
+go to one combined JSONL stream, or to one ``.out`` file per mission with
+``--output-dir``, laid out like the missions below the deepest directory
+they share. A failing mission is reported and the batch carries on.
+"""
+import argparse
+import glob
+import json
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import asdict, dataclass
+from typing import Iterable, Iterator, Optional, TextIO
+
+from src.infrastructure.file_input_reader import FileInputReader
+from src.infrastructure.text_mission_runner import run_mission
+
+
+@dataclass(frozen=True)
+class MissionResult:
+    path: str
+    output: Optional[str] = None
+    error: Optional[str] = None
+    seconds: float = 0.0
+
+
+def collect_mission_paths(sources: Iterable[str]) -> list[str]:
+    paths = []
+    for source in sources:
+        if source.startswith("@"):
+            manifest_path = source[1:]
+            base = os.path.dirname(manifest_path)
+            with FileInputReader().open_input(manifest_path) as manifest:
+                for line in manifest:
+                    line = line.strip()
+                    if line and not line.startswith("#"):
+                        paths.append(os.path.join(base, line))
+        elif os.path.isdir(source):
+            paths.extend(sorted(glob.glob(os.path.join(source, "*.txt"))))
+        elif glob.has_magic(source):
+            paths.extend(sorted(glob.glob(source, recursive=True)))
+        else:
+            paths.append(source)
+    return paths
+
+
+def output_names(paths: list[str]) -> dict[str, str]:
+    """Output file of every mission: its path below the deepest directory
+    shared by all missions, with the extension replaced by ``.out``.
+
+    Raises ``ValueError`` when two different missions would share a name.
+    """
+    if not paths:
+        return {}
+    base = os.path.commonpath(
+        [os.path.dirname(os.path.abspath(path)) for path in paths]
+    )
+    names: dict[str, str] = {}
+    owners: dict[str, str] = {}
+    for path in paths:
+        absolute_path = os.path.abspath(path)
+        name = os.path.relpath(os.path.splitext(absolute_path)[0], base) + ".out"
+        owner = owners.setdefault(name, absolute_path)
+        if owner != absolute_path:
+            raise ValueError(f"Missions {owner} and {absolute_path} would both write {name}")
+        names[path] = name
+    return names
+
+
+def run_mission_file(path: str) -> MissionResult:
+    start = time.perf_counter()
+    try:
+        output = run_mission(FileInputReader().get_input(path))
+    except (ValueError, OSError) as e:
+        return MissionResult(path=path, error=str(e), seconds=time.perf_counter() - start)
+    return MissionResult(path=path, output=output, seconds=time.perf_counter() - start)
+
+
+def _run_mission_files(paths: list[str]) -> list[MissionResult]:
+    return [run_mission_file(path) for path in paths]
+
+
+def _run_isolated(path: str) -> MissionResult:
+    """Run one mission in a worker of its own, reporting the worker dying
+    as the failure of that mission."""
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        try:
+            return executor.submit(_run_mission_files, [path]).result()[0]
+        except BrokenProcessPool:
+            return MissionResult(path=path, error="The worker process running it died")
+
+
+def run_missions(
+    paths: list[str], max_workers: Optional[int] = None, chunk_size: int = 16
+) -> Iterator[MissionResult]:
+    """Yield the result of every mission, in the order of ``paths``.
+
+    A worker that dies breaks the whole pool, so the missions not finished
+    yet go to a fresh pool, and the first unfinished chunk is rerun one
+    mission per worker to tell which of them killed it.
+    """
+    if max_workers == 1 or len(paths) <= 1:
+        yield from map(run_mission_file, paths)
+        return
+    # Chunks keep small missions from paying a round trip each
+    pending = deque(
+        paths[start:start + chunk_size] for start in range(0, len(paths), chunk_size)
+    )
+    while pending:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(_run_mission_files, chunk) for chunk in pending]
+            for future in futures:
+                try:
+                    results = future.result()
+                except BrokenProcessPool:
+                    break
+                pending.popleft()
+                yield from results
+        if pending:
+            yield from map(_run_isolated, pending.popleft())
+
+
+def write_result(
+    result: MissionResult, output_path: Optional[str], jsonl_stream: Optional[TextIO]
+):
+    if jsonl_stream is not None:
+        jsonl_stream.write(json.dumps(asdict(result)) + "\n")
+    if output_path is not None and result.output is not None:
+        os.makedirs(os.path.dirname(output_path), exist_ok=True)
+        with open(output_path, "w") as output_file:
+            output_file.write(result.output + "\n")
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "sources", nargs="+", help="Mission directories, glob patterns or @manifest files"
+    )
+    parser.add_argument("--output-dir", help="Write one .out file per mission here")
+    parser.add_argument(
+        "--jsonl", help="Write combined JSONL results to this file (default: stdout)"
+    )
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--chunk-size", type=int, default=16)
+    arguments = parser.parse_args(argv)
+
+    try:
+        paths = collect_mission_paths(arguments.sources)
+    except (OSError, UnicodeDecodeError) as e:
+        # Only manifests are read while collecting
+        parser.error(f"cannot read manifest: {e}")
+    output_paths: dict[str, str] = {}
+    if arguments.output_dir is not None:
+        # Checked before any mission runs, so no result is overwritten
+        try:
+            names = output_names(paths)
+        except ValueError as e:
+            parser.error(str(e))
+        output_paths = {
+            path: os.path.join(arguments.output_dir, name) for path, name in names.items()
+        }
+        os.makedirs(arguments.output_dir, exist_ok=True)
+    jsonl_stream = None
+    if arguments.jsonl is not None:
+        jsonl_stream = open(arguments.jsonl, "w")
+    elif arguments.output_dir is None:
+        jsonl_stream = sys.stdout
+
+    start = time.perf_counter()
+    failures = 0
+    try:
+        for result in run_missions(paths, arguments.workers, arguments.chunk_size):
+            write_result(result, output_paths.get(result.path), jsonl_stream)
+            if result.error is not None:
+                failures += 1
+                print(f"FAILED {result.path}: {result.error}", file=sys.stderr)
+    finally:
+        if jsonl_stream is not None and jsonl_stream is not sys.stdout:
+            jsonl_stream.close()
+    elapsed = time.perf_counter() - start
+
+    throughput = len(paths) / elapsed if elapsed else 0.0
+    print(
+        f"Processed {len(paths)} missions ({failures} failed) "
+        f"in {elapsed:.3f}s, {throughput:.1f} missions/s",
+        file=sys.stderr,
+    )
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,279 @@
+"""Compiled binary mission format.
+
+Layout, all little-endian:
+
+- header: magic ``b"RBM1"``, ``max_x``, ``max_y`` (int32), obstacle count,
+  robot count (uint32) and the byte offset of the robot table (uint64)
+- obstacle table: one ``x1 y1 x2 y2`` int32 record per obstacle
+- instruction area: each robot's instructions packed 2 bits per command,
+  four commands per byte, starting on a byte boundary
+- robot table: one fixed-width record per robot with its start ``x``, ``y``
+  (int32), heading (uint8), and the offset (uint64) and command count
+  (uint32) of its packed instructions
+
+The robot table comes last so a mission can be converted in one pass over
+its robots, with the header patched once the counts are known.
+"""
+import argparse
+import io
+import mmap
+import struct
+from typing import BinaryIO, Iterable, Iterator, Optional, Union
+
+from src.domain.robot.packed_instructions import PackedInstructions
+from src.domain.robot.value_objects import HEADING_NAMES, Orientation, Position
+from src.domain.workspace.entity import WorkSpace
+from src.domain.workspace.obstacle_map import ObstacleMap
+from src.infrastructure.file_input_reader import FileInputReader
+from src.infrastructure.stream_text_robot_repository import StreamTextRobotRepository
+from src.infrastructure.stream_text_work_space_repository import (
+    StreamTextWorkSpaceRepository,
+)
+
+MAGIC = b"RBM1"
+HEADER = struct.Struct("<4siiIIQ")
+OBSTACLE_RECORD = struct.Struct("<iiii")
+ROBOT_RECORD = struct.Struct("<iiB3xQI")
+
+# Bytes of packed instructions decoded at once while iterating robots
+DECODE_BLOCK_SIZE = 1 << 16
+
+_INT32 = range(-(1 << 31), 1 << 31)
+_UINT32 = range(1 << 32)
+
+
+def _check_range(value: int, allowed: range, name: str):
+    if value not in allowed:
+        raise ValueError(
+            f"{name} {value} does not fit in a binary mission "
+            f"({allowed.start} to {allowed.stop - 1})"
+        )
+
+
+def encode_instructions(instructions: Union[str, PackedInstructions]) -> bytes:
+    if not isinstance(instructions, PackedInstructions):
+        instructions = PackedInstructions.pack(instructions)
+    return instructions.data
+
+
+def decode_instructions(packed: Union[bytes, memoryview], count: int) -> str:
+    return str(PackedInstructions(packed, count))
+
+
+def write_binary_mission(
+    workspace: WorkSpace,
+    robots: Iterable[tuple[Position, Orientation, Union[str, PackedInstructions]]],
+    output: BinaryIO,
+) -> int:
+    """Write a mission to a seekable binary stream; returns the robot count.
+
+    Instructions are validated here, so a compiled mission only holds
+    ``L``, ``R`` and ``M`` commands, and every number is checked against
+    the width of its field.
+    """
+    _check_range(workspace.max_x, _INT32, "Workspace max_x")
+    _check_range(workspace.max_y, _INT32, "Workspace max_y")
+    # Obstacles lie inside the workspace, so they fit whenever it does
+    rectangles = workspace.obstacles.rectangles if workspace.obstacles else []
+    start = output.tell()
+    output.write(b"\0" * HEADER.size)
+    for rectangle in rectangles:
+        output.write(OBSTACLE_RECORD.pack(*rectangle))
+
+    instruction_start = output.tell()
+    robot_table = bytearray()
+    robot_count = 0
+    for position, orientation, instructions in robots:
+        _check_range(position.x, _INT32, f"Robot {robot_count} x")
+        _check_range(position.y, _INT32, f"Robot {robot_count} y")
+        _check_range(
+            len(instructions), _UINT32, f"Robot {robot_count} instruction count"
+        )
+        packed = encode_instructions(instructions)
+        robot_table += ROBOT_RECORD.pack(
+            position.x,
+            position.y,
+            orientation.heading,
+            output.tell() - instruction_start,
+            len(instructions),
+        )
+        output.write(packed)
+        robot_count += 1
+
+    robot_table_offset = output.tell() - start
+    output.write(robot_table)
+    end = output.tell()
+    output.seek(start)
+    output.write(
+        HEADER.pack(
+            MAGIC,
+            workspace.max_x,
+            workspace.max_y,
+            len(rectangles),
+            robot_count,
+            robot_table_offset,
+        )
+    )
+    output.seek(end)
+    return robot_count
+
+
+def convert_text_mission(text_path: str, binary_path: str) -> int:
+    """Compile a text mission file into the binary format."""
+    with FileInputReader().open_input(text_path) as input_stream:
+        workspace = StreamTextWorkSpaceRepository(input_stream=input_stream).get_workspace()
+        robots = StreamTextRobotRepository(input_stream=input_stream).iter_robots()
+        with open(binary_path, "wb") as output:
+            return write_binary_mission(workspace, robots, output)
+
+
+class BinaryMission:
+    """Compiled mission read straight from a buffer, typically a memory
+    mapped file, and shared by the binary repositories.
+
+    Nothing is parsed up front beyond the header; robots are decoded one at
+    a time as they are iterated. With ``pack_instructions`` the instructions
+    are handed out as ``PackedInstructions`` straight from the file instead
+    of being decoded into strings.
+    """
+
+    def __init__(
+        self,
+        buffer: Union[bytes, mmap.mmap, BinaryIO],
+        pack_instructions: bool = False,
+    ):
+        if isinstance(buffer, io.BytesIO):
+            # FileInputReader.map_input hands back a BytesIO for empty files
+            buffer = buffer.getvalue()
+        if len(buffer) < HEADER.size or buffer[:len(MAGIC)] != MAGIC:
+            raise ValueError("Input is not a compiled binary mission")
+        self.buffer = buffer
+        self.pack_instructions = pack_instructions
+        (
+            _,
+            self.max_x,
+            self.max_y,
+            self.obstacle_count,
+            self.robot_count,
+            self.robot_table_offset,
+        ) = HEADER.unpack_from(buffer)
+        self.instruction_start = HEADER.size + self.obstacle_count * OBSTACLE_RECORD.size
+        if not (
+            self.instruction_start
+            <= self.robot_table_offset
+            <= self.robot_table_offset + self.robot_count * ROBOT_RECORD.size
+            <= len(buffer)
+        ):
+            raise ValueError(
+                "Compiled binary mission is truncated or corrupt: its obstacle "
+                "and robot tables do not fit in the input"
+            )
+        self._workspace: Optional[WorkSpace] = None
+
+    def get_workspace(self) -> WorkSpace:
+        if self._workspace is None:
+            obstacles = ObstacleMap(
+                OBSTACLE_RECORD.iter_unpack(
+                    self.buffer[HEADER.size:self.instruction_start]
+                )
+            )
+            self._workspace = WorkSpace(
+                max_x=self.max_x, max_y=self.max_y, obstacles=obstacles
+            )
+        return self._workspace
+
+    def iter_robots(
+        self,
+    ) -> Iterator[tuple[Position, Orientation, Union[str, PackedInstructions]]]:
+        if self.robot_count == 0:
+            raise ValueError(
+                "Input must contain at least 3 lines: "
+                "workspace dimensions and at least one robot configuration"
+            )
+        view = memoryview(self.buffer)
+        robot_table = view[
+            self.robot_table_offset:
+            self.robot_table_offset + self.robot_count * ROBOT_RECORD.size
+        ]
+        instruction_area = view[self.instruction_start:self.robot_table_offset]
+        orientations = [Orientation(name) for name in HEADING_NAMES]
+        # Strings are decoded a block at a time, which is much cheaper than a
+        # separate decode for each of many short robots
+        decoded, decoded_start, decoded_end = "", 0, 0
+        # Robots before this offset are decoded one at a time, once a block
+        # holding them failed to decode
+        corrupt_end = 0
+        try:
+            for index, (x, y, heading, offset, count) in enumerate(
+                ROBOT_RECORD.iter_unpack(robot_table)
+            ):
+                end = offset + (count + 3) // 4
+                try:
+                    if heading >= len(orientations):
+                        raise ValueError(f"Invalid heading code {heading}")
+                    if end > len(instruction_area):
+                        raise ValueError(
+                            f"Instructions at offset {offset} run past the "
+                            "instruction area"
+                        )
+                    if self.pack_instructions:
+                        instructions = PackedInstructions(
+                            instruction_area[offset:end], count
+                        )
+                    else:
+                        if offset < decoded_start or end > decoded_end:
+                            decoded, decoded_start, decoded_end, corrupt_end = (
+                                self._decode_block(
+                                    instruction_area, offset, end, count, corrupt_end
+                                )
+                            )
+                        start = 4 * (offset - decoded_start)
+                        instructions = decoded[start:start + count]
+                except ValueError as error:
+                    raise ValueError(f"Robot record {index}: {error}") from error
+                yield Position(x, y), orientations[heading], instructions
+        finally:
+            # A memory mapped buffer cannot be closed while views are alive
+            instruction_area.release()
+            robot_table.release()
+            view.release()
+
+    def _decode_block(
+        self,
+        instruction_area: memoryview,
+        offset: int,
+        end: int,
+        count: int,
+        corrupt_end: int,
+    ) -> tuple[str, int, int, int]:
+        """Decode the instructions from ``offset`` on, returning them with
+        the byte range they cover and the updated ``corrupt_end``."""
+        if offset >= corrupt_end:
+            block_end = min(
+                max(end, offset + DECODE_BLOCK_SIZE), len(instruction_area)
+            )
+            try:
+                decoded = decode_instructions(
+                    instruction_area[offset:block_end], 4 * (block_end - offset)
+                )
+                return decoded, offset, block_end, corrupt_end
+            except ValueError:
+                corrupt_end = block_end
+        # Decoding this robot alone tells whether it is the corrupt one
+        decoded = decode_instructions(instruction_area[offset:end], count)
+        return decoded, offset, end, corrupt_end
+
+
+def main(argv: Optional[list[str]] = None):
+    parser = argparse.ArgumentParser(
+        description="Compile a text mission file into the binary mission format"
+    )
+    parser.add_argument("text_path")
+    parser.add_argument("binary_path")
+    arguments = parser.parse_args(argv)
+    robot_count = convert_text_mission(arguments.text_path, arguments.binary_path)
+    print(f"Compiled {robot_count} robots into {arguments.binary_path}")
+
+
+if __name__ == "__main__":
+    main()
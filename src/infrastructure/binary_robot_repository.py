@@ -0,0 +1,29 @@
+from typing import Iterator
+
+from src.application.repository.robot_repository import RobotRepository
+from src.domain.robot.value_objects import Position, Orientation
+from src.infrastructure.binary_mission import BinaryMission
+
+
+class BinaryRobotRepository(RobotRepository):
+    """Robot repository over a compiled binary mission.
+
+    Robots are decoded lazily from the fixed-width robot table, so
+    ``iter_robots`` should be preferred over the list accessors for large
+    missions.
+    """
+
+    def __init__(self, mission: BinaryMission):
+        self.mission = mission
+
+    def iter_robots(self) -> Iterator[tuple[Position, Orientation, str]]:
+        return self.mission.iter_robots()
+
+    def get_robot_position_list(self) -> list[Position]:
+        return [position for position, _, _ in self.iter_robots()]
+
+    def get_robot_orientation_list(self) -> list[Orientation]:
+        return [orientation for _, orientation, _ in self.iter_robots()]
+
+    def get_robot_instruction_list(self) -> list[str]:
+        return [instructions for _, _, instructions in self.iter_robots()]
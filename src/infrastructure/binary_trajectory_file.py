@@ -0,0 +1,90 @@
+"""Compact binary store for robot trajectories.
+
+Layout, all little-endian: the magic ``b"RTJ1"``, then one block per robot
+made of its index and pose count (uint32) followed by the ``x`` column and
+the ``y`` column (int32) and the heading column (int8). A block is read
+whole, so trajectories stream back one robot at a time.
+"""
+import struct
+import sys
+from array import array
+from typing import BinaryIO, Iterator
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised only without numpy
+    np = None
+
+from src.application.repository.trajectory_writer import TrajectoryWriter
+from src.domain.robot.trajectory import Trajectory
+
+MAGIC = b"RTJ1"
+BLOCK_HEADER = struct.Struct("<II")
+
+_NEEDS_BYTESWAP = sys.byteorder != "little"
+
+
+def _column_bytes(column: array) -> bytes:
+    if _NEEDS_BYTESWAP and column.itemsize > 1:
+        column = array(column.typecode, column)
+        column.byteswap()
+    return column.tobytes()
+
+
+def _read_column(stream: BinaryIO, typecode: str, count: int) -> array:
+    column = array(typecode)
+    data = stream.read(count * column.itemsize)
+    if len(data) != count * column.itemsize:
+        raise ValueError("Truncated trajectory file")
+    column.frombytes(data)
+    if _NEEDS_BYTESWAP and column.itemsize > 1:
+        column.byteswap()
+    return column
+
+
+class BinaryTrajectoryWriter(TrajectoryWriter):
+
+    def __init__(self, stream: BinaryIO):
+        self.stream = stream
+        self.stream.write(MAGIC)
+
+    def write(self, robot_index: int, trajectory: Trajectory):
+        self.stream.write(BLOCK_HEADER.pack(robot_index, len(trajectory)))
+        self.stream.write(_column_bytes(trajectory.xs))
+        self.stream.write(_column_bytes(trajectory.ys))
+        self.stream.write(_column_bytes(trajectory.headings))
+
+    def flush(self):
+        self.stream.flush()
+
+
+def iter_trajectories(stream: BinaryIO) -> Iterator[tuple[int, Trajectory]]:
+    """Yield ``(robot_index, trajectory)`` for every block in the stream."""
+    if stream.read(len(MAGIC)) != MAGIC:
+        raise ValueError("Not a trajectory file")
+    while True:
+        header = stream.read(BLOCK_HEADER.size)
+        if not header:
+            return
+        if len(header) != BLOCK_HEADER.size:
+            raise ValueError("Truncated trajectory file")
+        robot_index, count = BLOCK_HEADER.unpack(header)
+        trajectory = Trajectory()
+        trajectory.xs = _read_column(stream, "i", count)
+        trajectory.ys = _read_column(stream, "i", count)
+        trajectory.headings = _read_column(stream, "b", count)
+        yield robot_index, trajectory
+
+
+def save_trajectory_npy(trajectory: Trajectory, stream: BinaryIO):
+    """Write one trajectory as a NumPy record array with ``x``, ``y`` and
+    ``heading`` fields, readable with ``numpy.load``."""
+    if np is None:
+        raise ImportError("Saving trajectories as NPY requires numpy to be installed")
+    records = np.empty(
+        len(trajectory), dtype=[("x", "<i4"), ("y", "<i4"), ("heading", "i1")]
+    )
+    records["x"] = np.frombuffer(trajectory.xs, dtype=np.int32)
+    records["y"] = np.frombuffer(trajectory.ys, dtype=np.int32)
+    records["heading"] = np.frombuffer(trajectory.headings, dtype=np.int8)
+    np.save(stream, records)
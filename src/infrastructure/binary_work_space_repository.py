@@ -0,0 +1,11 @@
+from src.domain.workspace.entity import WorkSpace
+from src.application.repository.work_space_repository import WorkSpaceRepository
+from src.infrastructure.binary_mission import BinaryMission
+
+
+class BinaryWorkSpaceRepository(WorkSpaceRepository):
+    def __init__(self, mission: BinaryMission):
+        self.mission = mission
+
+    def get_workspace(self) -> WorkSpace:
+        return self.mission.get_workspace()
@@ -0,0 +1,202 @@
+"""Checkpoint store kept in three files next to each other.
+
+``<path>`` is a small JSON document replaced atomically on every save: the
+number of completed robots, the progress of the robot after them, the
+fingerprint of the mission so far and the committed sizes of the other two
+files. ``<path>.states`` holds one 9-byte ``x y heading`` record per
+completed robot, little-endian, with heading -1 for a robot that failed,
+whose details are one JSON line in ``<path>.failures``. Both files are
+appended and synced before the JSON document that commits them, so bytes
+past the committed sizes after a crash are dropped on load.
+"""
+import json
+import os
+import struct
+from typing import Iterator, Optional
+
+from src.application.repository.checkpoint_store import (
+    CheckpointStore,
+    FinalState,
+    FleetCheckpoint,
+    RobotProgress,
+)
+from src.domain.robot.robot_failure import RobotFailure
+from src.domain.robot.value_objects import HEADING_NAMES, Orientation, Position
+
+CHECKPOINT_VERSION = 1
+STATE_RECORD = struct.Struct("<iib")
+_FAILED_HEADING = -1
+
+# Records read back at once when restoring final states
+_READ_BLOCK_RECORDS = 1 << 16
+
+
+def write_atomically(path: str, data: bytes):
+    """Replace ``path`` with ``data`` so readers see the old or the new
+    content, never a partial write."""
+    temporary_path = f"{path}.tmp"
+    with open(temporary_path, "wb") as temporary_file:
+        temporary_file.write(data)
+        temporary_file.flush()
+        os.fsync(temporary_file.fileno())
+    os.replace(temporary_path, path)
+
+
+def _check_committed(side_file, committed_size: int):
+    # Opened for appending, so the position is the size of the file
+    if side_file.tell() < committed_size:
+        raise ValueError(
+            f"Checkpoint file {side_file.name} is shorter than its committed "
+            f"{committed_size} bytes"
+        )
+
+
+def _truncate_committed(path: str, committed_size: int):
+    """Drop what a save that never committed appended to ``path``."""
+    try:
+        side_file = open(path, "r+b")
+    except FileNotFoundError:
+        if committed_size:
+            raise ValueError(f"Checkpoint file {path} is missing") from None
+        side_file = open(path, "w+b")
+    with side_file:
+        side_file.seek(0, os.SEEK_END)
+        _check_committed(side_file, committed_size)
+        side_file.truncate(committed_size)
+
+
+def _append_committed(path: str, committed_size: int, data: bytes) -> int:
+    """Append ``data`` to ``path`` after its committed part, sync it and
+    return the size to commit next."""
+    with open(path, "ab") as side_file:
+        _check_committed(side_file, committed_size)
+        # Anything past the committed size belongs to no checkpoint
+        side_file.truncate(committed_size)
+        if data:
+            side_file.write(data)
+            side_file.flush()
+            os.fsync(side_file.fileno())
+    return committed_size + len(data)
+
+
+def _encode_progress(progress: Optional[RobotProgress]) -> Optional[list]:
+    if progress is None:
+        return None
+    return [
+        progress.step,
+        progress.position.x,
+        progress.position.y,
+        progress.orientation.current_orientation,
+    ]
+
+
+def _decode_progress(values: Optional[list]) -> Optional[RobotProgress]:
+    if values is None:
+        return None
+    step, x, y, heading = values
+    return RobotProgress(step, Position(x, y), Orientation(heading))
+
+
+class FileCheckpointStore(CheckpointStore):
+
+    def __init__(self, path: str):
+        self.path = path
+        self.states_path = f"{path}.states"
+        self.failures_path = f"{path}.failures"
+        self._states_size = 0
+        self._failures_size = 0
+
+    def load(self) -> Optional[FleetCheckpoint]:
+        try:
+            with open(self.path, "rb") as checkpoint_file:
+                document = json.loads(checkpoint_file.read())
+        except FileNotFoundError:
+            self._states_size = 0
+            self._failures_size = 0
+            return None
+        if document.get("version") != CHECKPOINT_VERSION:
+            raise ValueError(f"Unsupported checkpoint version in {self.path}")
+        self._states_size = document["states_size"]
+        self._failures_size = document["failures_size"]
+        _truncate_committed(self.states_path, self._states_size)
+        _truncate_committed(self.failures_path, self._failures_size)
+        return FleetCheckpoint(
+            completed_robots=document["completed_robots"],
+            in_progress=_decode_progress(document["in_progress"]),
+            fingerprint=bytes.fromhex(document["fingerprint"]),
+        )
+
+    def iter_final_states(self) -> Iterator[FinalState]:
+        orientations = [Orientation(name) for name in HEADING_NAMES]
+        remaining = self._states_size
+        if not remaining:
+            return
+        with open(self.states_path, "rb") as states_file, open(
+            self.failures_path, "rb"
+        ) as failures_file:
+            while remaining:
+                block = states_file.read(
+                    min(remaining, _READ_BLOCK_RECORDS * STATE_RECORD.size)
+                )
+                if not block:
+                    raise ValueError(f"Truncated checkpoint states in {self.states_path}")
+                remaining -= len(block)
+                for x, y, heading in STATE_RECORD.iter_unpack(block):
+                    if heading != _FAILED_HEADING:
+                        yield Position(x, y), orientations[heading]
+                        continue
+                    line = failures_file.readline()
+                    if not line:
+                        raise ValueError(
+                            f"Truncated checkpoint failures in {self.failures_path}"
+                        )
+                    robot_index, step, heading_name, reason = json.loads(line)
+                    yield RobotFailure(
+                        robot_index, step, Position(x, y), Orientation(heading_name), reason
+                    )
+
+    def save(self, checkpoint: FleetCheckpoint, new_final_states: list[FinalState]):
+        records = bytearray()
+        failures = bytearray()
+        for final_state in new_final_states:
+            if isinstance(final_state, RobotFailure):
+                records += STATE_RECORD.pack(
+                    final_state.position.x, final_state.position.y, _FAILED_HEADING
+                )
+                failures += json.dumps(
+                    [
+                        final_state.robot_index,
+                        final_state.step,
+                        final_state.orientation.current_orientation,
+                        final_state.reason,
+                    ]
+                ).encode() + b"\n"
+            else:
+                position, orientation = final_state
+                records += STATE_RECORD.pack(position.x, position.y, orientation.heading)
+        self._states_size = _append_committed(self.states_path, self._states_size, records)
+        self._failures_size = _append_committed(
+            self.failures_path, self._failures_size, failures
+        )
+        write_atomically(
+            self.path,
+            json.dumps(
+                {
+                    "version": CHECKPOINT_VERSION,
+                    "completed_robots": checkpoint.completed_robots,
+                    "in_progress": _encode_progress(checkpoint.in_progress),
+                    "fingerprint": checkpoint.fingerprint.hex(),
+                    "states_size": self._states_size,
+                    "failures_size": self._failures_size,
+                }
+            ).encode(),
+        )
+
+    def clear(self):
+        for path in (self.path, self.states_path, self.failures_path):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+        self._states_size = 0
+        self._failures_size = 0
@@ -1,10 +1,35 @@
+import io
+import mmap
+from typing import BinaryIO, TextIO, Union
+
+
 class FileInputReader:
     def get_input(self, file_path: str) -> str:
         try:
             with open(file_path, "r") as file:
                 return file.read()
         except FileNotFoundError:
-            raise FileNotFoundError(
-                f"Input file '{file_path}' not found. "
-                "Please create it with the required input format."
-            )
\ No newline at end of file
+            raise self._input_not_found(file_path)
+
+    def open_input(self, file_path: str) -> TextIO:
+        try:
+            return open(file_path, "r")
+        except FileNotFoundError:
+            raise self._input_not_found(file_path)
+
+    def map_input(self, file_path: str) -> Union[mmap.mmap, BinaryIO]:
+        try:
+            with open(file_path, "rb") as file:
+                try:
+                    return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+                except ValueError:
+                    # Empty files cannot be mapped
+                    return io.BytesIO()
+        except FileNotFoundError:
+            raise self._input_not_found(file_path)
+
+    def _input_not_found(self, file_path: str) -> FileNotFoundError:
+        return FileNotFoundError(
+            f"Input file '{file_path}' not found. "
+            "Please create it with the required input format."
+        )
@@ -0,0 +1,231 @@
+"""Long-running mission server over localhost TCP or a Unix socket.
+
+Clients send a mission in the text input format, ended by a line reading
+``END`` or by closing their side of the connection. The server streams one
+final pose per line as robots finish, followed by ``END``, or by an
+``ERROR <message>`` line when the mission fails. A connection can carry any
+number of missions in turn; input that cannot be read, such as invalid UTF-8
+or a line over the limit, is answered with ``ERROR`` and closes it.
+"""
+import argparse
+import asyncio
+import multiprocessing
+import os
+import queue
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Optional
+
+from src.infrastructure.stream_output_writer import StreamOutputWriter
+from src.infrastructure.text_mission_runner import build_robot_service
+
+END_OF_MISSION = "END"
+
+# Pose lines per chunk handed from a worker to the connection, and chunks
+# a worker may run ahead of a slow client
+STREAM_BATCH_LINES = 1024
+STREAM_MAX_CHUNKS = 16
+
+# Bounds of the back-off, in seconds, while a connection waits for a chunk
+STREAM_POLL_MIN = 0.001
+STREAM_POLL_MAX = 0.05
+
+
+class _ChunkQueueStream:
+    """Text stream that hands each write to a bounded queue, giving up once
+    the connection it feeds is gone."""
+
+    def __init__(self, chunks, cancelled):
+        self.chunks = chunks
+        self.cancelled = cancelled
+
+    def put(self, chunk: Optional[str]) -> bool:
+        """Queue ``chunk``, or return ``False`` once nobody reads any more."""
+        while not self.cancelled.is_set():
+            try:
+                self.chunks.put(chunk, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def write(self, text: str):
+        if not self.put(text):
+            raise ConnectionAbortedError("The client went away")
+
+    def flush(self):
+        pass
+
+
+def stream_mission(input_text: str, chunks, cancelled) -> int:
+    """Run a mission, putting its pose lines on ``chunks`` in batches as
+    robots finish and ``None`` once done, and return the robot count."""
+    stream = _ChunkQueueStream(chunks, cancelled)
+    try:
+        return build_robot_service(input_text).write_final_states(
+            StreamOutputWriter(stream, buffer_size=STREAM_BATCH_LINES)
+        )
+    finally:
+        stream.put(None)
+
+
+async def _next_chunk(chunks) -> Optional[str]:
+    # Polled rather than awaited in a thread, so connections waiting on slow
+    # missions never hold the threads other connections need
+    delay = STREAM_POLL_MIN
+    while True:
+        try:
+            return chunks.get_nowait()
+        except queue.Empty:
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, STREAM_POLL_MAX)
+
+
+class MissionServer:
+    """Accepts missions from many concurrent clients.
+
+    Simulation runs on ``executor``, a process pool by default, so the event
+    loop keeps serving other clients while a heavy mission is computed.
+    """
+
+    def __init__(
+        self,
+        executor: Optional[Executor] = None,
+        max_workers: Optional[int] = None,
+        line_limit: int = 1 << 24,
+    ):
+        # Spawned workers do not inherit the sockets of open connections,
+        # which forked ones would keep open after the server closes them
+        context = multiprocessing.get_context("spawn")
+        self._owns_executor = executor is None
+        self.executor = (
+            executor
+            if executor is not None
+            else ProcessPoolExecutor(max_workers, mp_context=context)
+        )
+        self.line_limit = line_limit
+        self.missions_served = 0
+        # Worker processes need proxies to reach the queues of a connection
+        self._manager = (
+            context.Manager()
+            if isinstance(self.executor, ProcessPoolExecutor)
+            else None
+        )
+
+    def _open_channel(self):
+        if self._manager is not None:
+            return self._manager.Queue(STREAM_MAX_CHUNKS), self._manager.Event()
+        return queue.Queue(STREAM_MAX_CHUNKS), threading.Event()
+
+    async def _read_mission(self, reader: asyncio.StreamReader) -> Optional[str]:
+        lines = []
+        while True:
+            line = await reader.readline()
+            if not line:
+                break
+            line = line.decode().rstrip("\r\n")
+            if line.strip() == END_OF_MISSION:
+                break
+            lines.append(line)
+        if not lines and reader.at_eof():
+            return None
+        return "\n".join(lines)
+
+    async def _stream_mission(self, input_text: str, writer: asyncio.StreamWriter):
+        loop = asyncio.get_running_loop()
+        chunks, cancelled = self._open_channel()
+        result = loop.run_in_executor(
+            self.executor, stream_mission, input_text, chunks, cancelled
+        )
+        try:
+            # Each chunk is sent, and drained, while the worker goes on
+            while (chunk := await _next_chunk(chunks)) is not None:
+                writer.write(chunk.encode())
+                await writer.drain()
+        except BaseException:
+            cancelled.set()
+            if not result.cancel():
+                result.exception()
+            raise
+        try:
+            await result
+        except ValueError as e:
+            # Poses already sent belong to the robots before the failure
+            writer.write(f"ERROR {e}\n".encode())
+        else:
+            writer.write(f"{END_OF_MISSION}\n".encode())
+            self.missions_served += 1
+        await writer.drain()
+
+    async def handle_client(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ):
+        try:
+            while True:
+                try:
+                    input_text = await self._read_mission(reader)
+                except (UnicodeDecodeError, asyncio.LimitOverrunError, ValueError) as e:
+                    # The rest of the input cannot be trusted to line up
+                    writer.write(f"ERROR {e}\n".encode())
+                    await writer.drain()
+                    break
+                if input_text is None:
+                    break
+                await self._stream_mission(input_text, writer)
+        except ConnectionError:
+            # The client went away
+            pass
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    async def start_tcp(self, host: str = "127.0.0.1", port: int = 0) -> asyncio.Server:
+        return await asyncio.start_server(
+            self.handle_client, host=host, port=port, limit=self.line_limit
+        )
+
+    async def start_unix(self, path: str) -> asyncio.Server:
+        return await asyncio.start_unix_server(
+            self.handle_client, path=path, limit=self.line_limit
+        )
+
+    def close(self):
+        if self._owns_executor:
+            self.executor.shutdown(cancel_futures=True)
+        if self._manager is not None:
+            self._manager.shutdown()
+
+
+async def serve(server: MissionServer, host: str, port: int, unix_path: Optional[str]):
+    if unix_path is not None:
+        listener = await server.start_unix(unix_path)
+    else:
+        listener = await server.start_tcp(host, port)
+    addresses = ", ".join(str(sock.getsockname()) for sock in listener.sockets)
+    print(f"Serving missions on {addresses}", flush=True)
+    async with listener:
+        await listener.serve_forever()
+
+
+def main(argv: Optional[list[str]] = None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--unix", dest="unix_path", help="Listen on a Unix socket instead")
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    arguments = parser.parse_args(argv)
+
+    server = MissionServer(max_workers=arguments.workers)
+    try:
+        asyncio.run(serve(server, arguments.host, arguments.port, arguments.unix_path))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+from typing import Iterable, Iterator
+
+from src.application.repository.robot_repository import RobotRepository
+from src.application.services.batch_path_planner import BatchPathPlanner, PlanRequest
+from src.domain.robot.value_objects import Orientation, Position
+
+
+class PlannedRobotRepository(RobotRepository):
+    """Robots at their start poses carrying planned instructions, ready to be
+    simulated by ``RobotService``."""
+
+    def __init__(self, robots: list[tuple[Position, Orientation, str]]):
+        self.robots = robots
+
+    @classmethod
+    def plan(
+        cls, planner: BatchPathPlanner, requests: Iterable[PlanRequest]
+    ) -> "PlannedRobotRepository":
+        requests = list(requests)
+        return cls(
+            [
+                (start, start_orientation, path)
+                for (start, start_orientation, _, _), path in zip(
+                    requests, planner.plan_all(requests)
+                )
+            ]
+        )
+
+    def get_robot_position_list(self) -> list[Position]:
+        return [position for position, _, _ in self.robots]
+
+    def get_robot_orientation_list(self) -> list[Orientation]:
+        return [orientation for _, orientation, _ in self.robots]
+
+    def get_robot_instruction_list(self) -> list[str]:
+        return [instructions for _, _, instructions in self.robots]
+
+    def iter_robots(self) -> Iterator[tuple[Position, Orientation, str]]:
+        return iter(self.robots)
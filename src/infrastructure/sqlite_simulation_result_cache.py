@@ -0,0 +1,128 @@
+import sqlite3
+from typing import Optional
+
+from src.application.repository.simulation_result_cache import SimulationResultCache
+from src.domain.robot.value_objects import HEADING_NAMES, Orientation, Position
+
+
+class SqliteSimulationResultCache(SimulationResultCache):
+    """Result cache persisted in a SQLite file.
+
+    New results and the use of cached ones are buffered and written in one
+    transaction every ``batch_size`` robots and on ``flush``, so a run only
+    pays a point lookup per robot. Each flush then evicts the least
+    recently used results beyond ``max_rows``; ``None`` keeps them all.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        batch_size: int = 10_000,
+        max_rows: Optional[int] = 1_000_000,
+    ):
+        self.path = path
+        self.batch_size = batch_size
+        self.max_rows = max_rows
+        self.hits = 0
+        self.misses = 0
+        self._pending: dict[bytes, tuple[int, int, int, int]] = {}
+        self._used: dict[bytes, int] = {}
+        self._connection = sqlite3.connect(path)
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS results ("
+            "fingerprint BLOB PRIMARY KEY, x INTEGER, y INTEGER, heading INTEGER,"
+            " used INTEGER NOT NULL DEFAULT 0"
+            ") WITHOUT ROWID"
+        )
+        columns = [
+            row[1] for row in self._connection.execute("PRAGMA table_info(results)")
+        ]
+        if "used" not in columns:
+            # Caches written before eviction count as least recently used
+            self._connection.execute(
+                "ALTER TABLE results ADD COLUMN used INTEGER NOT NULL DEFAULT 0"
+            )
+        self._connection.execute(
+            "CREATE INDEX IF NOT EXISTS results_used ON results (used)"
+        )
+        self._connection.commit()
+        # Every lookup hit and new result takes the next tick of this clock
+        (self._clock,) = self._connection.execute(
+            "SELECT COALESCE(MAX(used), 0) FROM results"
+        ).fetchone()
+        self._orientations = [Orientation(name) for name in HEADING_NAMES]
+
+    def __len__(self) -> int:
+        (count,) = self._connection.execute("SELECT COUNT(*) FROM results").fetchone()
+        return count + len(self._pending)
+
+    def get(self, fingerprint: bytes) -> Optional[tuple[Position, Orientation]]:
+        row = self._pending.get(fingerprint)
+        if row is None:
+            row = self._connection.execute(
+                "SELECT x, y, heading FROM results WHERE fingerprint = ?",
+                (fingerprint,),
+            ).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        x, y, heading = row[:3]
+        self._clock += 1
+        if fingerprint in self._pending:
+            self._pending[fingerprint] = (x, y, heading, self._clock)
+        else:
+            self._used[fingerprint] = self._clock
+            if len(self._used) >= self.batch_size:
+                self.flush()
+        return Position(x, y), self._orientations[heading]
+
+    def put(self, fingerprint: bytes, position: Position, orientation: Orientation):
+        self._clock += 1
+        self._pending[fingerprint] = (
+            position.x, position.y, orientation.heading, self._clock
+        )
+        if len(self._pending) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        if not self._pending and not self._used:
+            return
+        with self._connection:
+            self._connection.executemany(
+                "UPDATE results SET used = ? WHERE fingerprint = ?",
+                ((used, fingerprint) for fingerprint, used in self._used.items()),
+            )
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?)",
+                ((fingerprint, *row) for fingerprint, row in self._pending.items()),
+            )
+        self._pending.clear()
+        self._used.clear()
+        if self.max_rows is not None:
+            self.prune(self.max_rows)
+
+    def prune(self, max_rows: int) -> int:
+        """Delete the least recently used results beyond ``max_rows`` and
+        return how many were deleted. Results not flushed yet are kept."""
+        (count,) = self._connection.execute("SELECT COUNT(*) FROM results").fetchone()
+        if count <= max_rows:
+            return 0
+        with self._connection:
+            self._connection.execute(
+                "DELETE FROM results WHERE fingerprint IN ("
+                "SELECT fingerprint FROM results ORDER BY used LIMIT ?"
+                ")",
+                (count - max_rows,),
+            )
+        return count - max_rows
+
+    def close(self):
+        self.flush()
+        self._connection.close()
+
+    def __enter__(self) -> "SqliteSimulationResultCache":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
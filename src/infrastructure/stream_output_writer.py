@@ -0,0 +1,27 @@
+from typing import TextIO
+
+from src.application.repository.output_writer import OutputWriter
+
+
+class StreamOutputWriter(OutputWriter):
+    """Writes lines to a text stream in buffered batches of ``buffer_size``
+    lines, flushing the stream after each batch so readers see results as
+    soon as they are written.
+    """
+
+    def __init__(self, output_stream: TextIO, buffer_size: int = 1024):
+        self.output_stream = output_stream
+        self.buffer_size = buffer_size
+        self._buffer: list[str] = []
+
+    def write_line(self, line: str):
+        self._buffer.append(line)
+        if len(self._buffer) >= self.buffer_size:
+            self.flush()
+
+    def flush(self):
+        if self._buffer:
+            self._buffer.append("")
+            self.output_stream.write("\n".join(self._buffer))
+            self._buffer.clear()
+        self.output_stream.flush()
@@ -0,0 +1,102 @@
+from itertools import chain, islice
+from typing import IO, Iterator
+
+from src.application.repository.robot_repository import RobotRepository
+from src.domain.robot.value_objects import Position, Orientation
+from src.infrastructure.text_mission_document import (
+    parse_obstacle_header,
+    parse_robot_record,
+)
+
+
+def iter_input_lines(input_stream: IO) -> Iterator[str]:
+    """Yield the lines of ``input_stream`` one at a time, from the start.
+
+    ``input_stream`` may be a text stream or a bytes source such as a memory
+    mapped file, in which case each line is decoded on its own.
+    Leading and trailing blank lines are dropped, matching what
+    ``input_text.strip().split("\\n")`` does for the in-memory repositories.
+    Blank lines in the middle of the stream are only counted, never stored.
+    """
+    input_stream.seek(0)
+    pending_blank_lines = 0
+    seen_content = False
+    while True:
+        line = input_stream.readline()
+        if not line:
+            break
+        if line.isspace():
+            if seen_content:
+                pending_blank_lines += 1
+            continue
+        if isinstance(line, bytes):
+            line = line.decode()
+        line = line.rstrip("\r\n")
+        for _ in range(pending_blank_lines):
+            yield ""
+        pending_blank_lines = 0
+        seen_content = True
+        yield line
+
+
+def read_mission_header(lines: Iterator[str]) -> tuple[str, list[str], Iterator[str]]:
+    """Split the workspace line and any obstacle section off ``lines``.
+
+    Returns the workspace line, the obstacle lines and an iterator over the
+    remaining robot lines.
+    """
+    workspace_line = next(lines, "")
+    next_line = next(lines, None)
+    if next_line is None:
+        return workspace_line, [], lines
+    obstacle_count = parse_obstacle_header(next_line)
+    if obstacle_count is None:
+        return workspace_line, [], chain((next_line,), lines)
+    obstacle_lines = list(islice(lines, obstacle_count))
+    if len(obstacle_lines) < obstacle_count:
+        raise ValueError(
+            "Invalid input format. Ensure the input is correctly formatted."
+        )
+    return workspace_line, obstacle_lines, lines
+
+
+class StreamTextRobotRepository(RobotRepository):
+    """Robot repository that parses robots lazily from an open input stream
+    or memory mapped input file.
+
+    Only the robot being handed out is held in memory, so the list accessors
+    should be avoided for large inputs in favour of ``iter_robots``.
+    """
+
+    def __init__(self, input_stream: IO):
+        self.input_stream = input_stream
+
+    def iter_robots(self) -> Iterator[tuple[Position, Orientation, str]]:
+        _, _, lines = read_mission_header(iter_input_lines(self.input_stream))
+
+        robot_count = 0
+        for position_line in lines:
+            instruction_line = next(lines, None)
+            if instruction_line is None:
+                raise ValueError(
+                    "Invalid input format. Ensure the input is correctly formatted."
+                )
+            yield parse_robot_record(
+                position_line=position_line, instruction_line=instruction_line
+            )
+            robot_count += 1
+
+        if robot_count == 0:
+            raise ValueError(
+                "Input must contain at least 3 lines: "
+                "workspace dimensions and at least one robot configuration"
+            )
+
+    def get_robot_position_list(self) -> list[Position]:
+        return [position for position, _, _ in self.iter_robots()]
+
+    def get_robot_orientation_list(self) -> list[Orientation]:
+        return [orientation for _, orientation, _ in self.iter_robots()]
+
+    def get_robot_instruction_list(self) -> list[str]:
+        return [instructions for _, _, instructions in self.iter_robots()]
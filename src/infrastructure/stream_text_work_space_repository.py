@@ -0,0 +1,20 @@
+from typing import IO
+
+from src.domain.workspace.entity import WorkSpace
+from src.application.repository.work_space_repository import WorkSpaceRepository
+from src.infrastructure.stream_text_robot_repository import (
+    iter_input_lines,
+    read_mission_header,
+)
+from src.infrastructure.text_mission_document import parse_workspace_line
+
+
+class StreamTextWorkSpaceRepository(WorkSpaceRepository):
+    def __init__(self, input_stream: IO):
+        self.input_stream = input_stream
+
+    def get_workspace(self) -> WorkSpace:
+        workspace_line, obstacle_lines, _ = read_mission_header(
+            iter_input_lines(self.input_stream)
+        )
+        return parse_workspace_line(workspace_line, obstacle_lines=obstacle_lines)
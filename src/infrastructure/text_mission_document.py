@@ -0,0 +1,135 @@
+from typing import Iterable, Optional
+
+from src.domain.robot.packed_instructions import Instructions, PackedInstructions
+from src.domain.robot.value_objects import Position, Orientation
+from src.domain.workspace.entity import WorkSpace
+from src.domain.workspace.obstacle_map import ObstacleMap, Rectangle
+
+RobotLists = tuple[list[Position], list[Orientation], list[Instructions]]
+
+# Optional section right after the workspace line: an 'OBSTACLES N' header
+# followed by N lines, each a blocked cell 'X Y' or a rectangle 'X1 Y1 X2 Y2'
+OBSTACLE_SECTION_HEADER = "OBSTACLES"
+
+
+def parse_obstacle_header(line: str) -> Optional[int]:
+    """Number of obstacle lines announced by ``line``, or ``None`` when the
+    line does not open an obstacle section."""
+    fields = line.split()
+    if not fields or fields[0] != OBSTACLE_SECTION_HEADER:
+        return None
+    if len(fields) != 2 or not fields[1].isdigit():
+        raise ValueError(
+            f"Obstacle section header must be specified as "
+            f"'{OBSTACLE_SECTION_HEADER} N'"
+        )
+    return int(fields[1])
+
+
+def parse_obstacle_line(obstacle_line: str) -> Rectangle:
+    obstacle_fields = obstacle_line.split()
+    if len(obstacle_fields) == 2:
+        x, y = int(obstacle_fields[0]), int(obstacle_fields[1])
+        return x, y, x, y
+    if len(obstacle_fields) == 4:
+        x1, y1, x2, y2 = (int(field) for field in obstacle_fields)
+        return x1, y1, x2, y2
+    raise ValueError("Obstacles must be specified as 'X Y' or 'X1 Y1 X2 Y2'")
+
+
+def parse_workspace_line(
+    workspace_line: str, obstacle_lines: Iterable[str] = ()
+) -> WorkSpace:
+    workspace_fields = workspace_line.split()
+    if len(workspace_fields) != 2:
+        raise ValueError("Workspace dimensions must be specified as 'X Y'")
+    workspace_x, workspace_y = int(workspace_fields[0]), int(workspace_fields[1])
+    obstacles = ObstacleMap(parse_obstacle_line(line) for line in obstacle_lines)
+    return WorkSpace(max_x=workspace_x, max_y=workspace_y, obstacles=obstacles)
+
+
+def parse_robot_record(
+    position_line: str, instruction_line: str
+) -> tuple[Position, Orientation, str]:
+    try:
+        position_fields = position_line.split()
+        position_x = int(position_fields[0])
+        position_y = int(position_fields[1])
+        orientation = position_fields[2]
+    except IndexError as e:
+        raise ValueError(
+            "Invalid input format. Ensure the input is correctly formatted."
+        ) from e
+    return Position(position_x, position_y), Orientation(orientation), instruction_line
+
+
+class TextMissionDocument:
+    """Mission input text split into lines once and shared by the text
+    repositories, so each section is parsed and validated a single time.
+
+    With ``pack_instructions`` every instruction line is validated and kept
+    as ``PackedInstructions``, at a quarter of the memory of a string.
+    """
+
+    def __init__(self, input_text: str, pack_instructions: bool = False):
+        self.lines = input_text.strip().split("\n")
+        self.pack_instructions = pack_instructions
+        self._robot_start: Optional[int] = None
+        self._workspace: Optional[WorkSpace] = None
+        self._robots: Optional[RobotLists] = None
+
+    def _get_robot_start(self) -> int:
+        # Index of the first robot line, past any obstacle section
+        if self._robot_start is None:
+            obstacle_count = None
+            if len(self.lines) > 1:
+                obstacle_count = parse_obstacle_header(self.lines[1])
+            robot_start = 1 if obstacle_count is None else obstacle_count + 2
+            if robot_start > len(self.lines):
+                raise ValueError(
+                    "Invalid input format. Ensure the input is correctly formatted."
+                )
+            self._robot_start = robot_start
+        return self._robot_start
+
+    def get_workspace(self) -> WorkSpace:
+        if self._workspace is None:
+            self._workspace = parse_workspace_line(
+                self.lines[0], obstacle_lines=self.lines[2:self._get_robot_start()]
+            )
+        return self._workspace
+
+    def get_robots(self) -> RobotLists:
+        if self._robots is None:
+            self._robots = self._parse_robots()
+            # Robot lines are no longer needed once parsed
+            del self.lines[self._get_robot_start():]
+        return self._robots
+
+    def _parse_robots(self) -> RobotLists:
+        try:
+            robot_start = self._get_robot_start()
+            if len(self.lines) - robot_start < 2:
+                raise ValueError(
+                    "Input must contain at least 3 lines: "
+                    "workspace dimensions and at least one robot configuration"
+                )
+            position_list = []
+            orientation_list = []
+            instruction_list = []
+
+            for i in range(robot_start, len(self.lines), 2):
+                position, orientation, instructions = parse_robot_record(
+                    position_line=self.lines[i], instruction_line=self.lines[i + 1]
+                )
+                if self.pack_instructions:
+                    instructions = PackedInstructions.pack(instructions)
+                position_list.append(position)
+                orientation_list.append(orientation)
+                instruction_list.append(instructions)
+
+            return position_list, orientation_list, instruction_list
+        except IndexError as e:
+            raise ValueError(
+                "Invalid input format. Ensure the input is correctly formatted."
+            ) from e
@@ -0,0 +1,21 @@
+"""Runs missions given as text in the input format, for the entry points
+that receive whole missions at once: the batch CLI and the mission server."""
+from src.application.services.robot_service import RobotService
+from src.application.services.work_space import WorkSpaceService
+from src.infrastructure.text_mission_document import TextMissionDocument
+from src.infrastructure.text_robot_repository import TextRobotRepository
+from src.infrastructure.text_work_space_repository import TextWorkSpaceRepository
+
+
+def build_robot_service(input_text: str) -> RobotService:
+    document = TextMissionDocument(input_text=input_text)
+    return RobotService(
+        robot_repository=TextRobotRepository(document=document),
+        workspace_service=WorkSpaceService(
+            workspace_repository=TextWorkSpaceRepository(document=document)
+        ),
+    )
+
+
+def run_mission(input_text: str) -> str:
+    return build_robot_service(input_text).process_instructions()
@@ -22,9 +22,8 @@ class TestMainIntegration:
         ],
     )
     @patch("builtins.open", new_callable=mock_open)
-    @patch("builtins.print")
     def test_main_integration_with_sample_input(
-        self, mock_print: Mock, mock_file: Mock, input_text: str, expected_output: str
+        self, mock_file: Mock, input_text: str, expected_output: str, capsys
     ):
         # Arrange
         mock_file.return_value.read.return_value = input_text
@@ -32,7 +31,7 @@ class TestMainIntegration:
         main()
         # Assert
         mock_file.assert_called_once_with("input.txt", "r")
-        mock_print.assert_called_once_with(expected_output)
+        assert capsys.readouterr().out == expected_output + "\n"
 
     @pytest.mark.parametrize(
         "input_text",
@@ -0,0 +1,152 @@
+from unittest.mock import Mock
+
+import pytest
+
+from src.application.services.batch_path_planner import BatchPathPlanner
+from src.application.services.path_planner import PathPlanner
+from src.application.services.work_space import WorkSpaceService
+from src.domain.robot.value_objects import Orientation, Position
+from src.domain.workspace.entity import WorkSpace
+from src.domain.workspace.obstacle_map import ObstacleMap
+
+
+class TestBatchPathPlanner:
+
+    def setup_method(self):
+        self.workspace = WorkSpace(6, 6, ObstacleMap([(2, 0, 2, 4), (4, 2, 6, 2)]))
+        self.workspace_service = Mock(spec=WorkSpaceService)
+        self.workspace_service.get_workspace.return_value = self.workspace
+
+    def pose(self, x: int, y: int, heading: str) -> tuple[Position, Orientation]:
+        return Position(x, y), Orientation(heading)
+
+    @pytest.mark.parametrize(
+        "requests,expected_floods",
+        [
+            pytest.param(
+                [
+                    (*start, *goal)
+                    for start in [(0, 0, "N"), (1, 3, "E"), (3, 0, "W")]
+                    for goal in [(6, 6, "N"), (5, 0, "S")]
+                ],
+                2,
+                id="flood_per_goal",
+            ),
+            pytest.param(
+                [
+                    (0, 0, "N", *goal)
+                    for goal in [(6, 6, "N"), (5, 0, "S"), (0, 6, "W")]
+                ],
+                1,
+                id="flood_per_start",
+            ),
+        ],
+    )
+    def test_plan_all_matches_single_queries_with_shared_floods(
+        self, requests, expected_floods
+    ):
+        # Arrange
+        requests = [
+            (*self.pose(sx, sy, sh), *self.pose(gx, gy, gh))
+            for sx, sy, sh, gx, gy, gh in requests
+        ]
+        batch_planner = BatchPathPlanner(workspace_service=self.workspace_service)
+        planner = PathPlanner(workspace_service=self.workspace_service)
+
+        # Act
+        paths = batch_planner.plan_all(requests)
+
+        # Assert
+        assert [len(path) for path in paths] == [
+            len(planner.plan(*request)) for request in requests
+        ]
+        assert batch_planner.floods == expected_floods
+
+    def test_plan_all_searches_each_request_on_large_workspaces(self):
+        # Arrange
+        requests = [
+            (*self.pose(0, 0, "N"), *self.pose(6, 6, "E")),
+            (*self.pose(3, 0, "W"), *self.pose(6, 6, "E")),
+        ]
+        batch_planner = BatchPathPlanner(
+            workspace_service=self.workspace_service, max_field_cells=0
+        )
+        planner = PathPlanner(workspace_service=self.workspace_service)
+
+        # Act
+        paths = batch_planner.plan_all(requests)
+
+        # Assert
+        assert [len(path) for path in paths] == [
+            len(planner.plan(*request)) for request in requests
+        ]
+        assert batch_planner.floods == 0
+        assert batch_planner.searches == 2
+
+    def test_plan_all_stops_searching_at_first_unreachable_request(self):
+        # Arrange
+        self.workspace_service.get_workspace.return_value = WorkSpace(
+            99, 99, ObstacleMap([(50, 0, 50, 99)])
+        )
+        unreachable = (*self.pose(0, 0, "N"), *self.pose(99, 99, "N"))
+        batch_planner = BatchPathPlanner(
+            workspace_service=self.workspace_service,
+            max_field_cells=0,
+            max_search_states=1000,
+        )
+
+        # Act & Assert
+        with pytest.raises(ValueError, match="Request 0: No path from 0 0 N"):
+            batch_planner.plan_all([unreachable] * 5)
+        assert batch_planner.searches == 1
+
+    def test_plan_all_searches_repeated_pairs_once(self):
+        # Arrange
+        request = (*self.pose(0, 0, "N"), *self.pose(6, 6, "E"))
+        batch_planner = BatchPathPlanner(
+            workspace_service=self.workspace_service, max_field_cells=0
+        )
+
+        # Act
+        paths = batch_planner.plan_all([request] * 3)
+
+        # Assert
+        assert len(set(paths)) == 1
+        assert batch_planner.searches == 1
+
+    @pytest.mark.parametrize(
+        "request_,message",
+        [
+            pytest.param(
+                (Position(2, 0), Orientation("N"), Position(0, 0), Orientation("N")),
+                "Request 1: Start position .* is not a free cell",
+                id="start_blocked",
+            ),
+            pytest.param(
+                (Position(0, 0), Orientation("N"), Position(7, 0), Orientation("N")),
+                "Request 1: Goal position .* is not a free cell",
+                id="goal_out_of_bounds",
+            ),
+        ],
+    )
+    def test_plan_all_invalid_requests_raise_value_error(self, request_, message):
+        # Arrange
+        batch_planner = BatchPathPlanner(workspace_service=self.workspace_service)
+        valid_request = (Position(0, 0), Orientation("N"), Position(1, 1), Orientation("E"))
+
+        # Act & Assert
+        with pytest.raises(ValueError, match=message):
+            batch_planner.plan_all([valid_request, request_])
+
+    def test_plan_all_unreachable_goal_raises_value_error(self):
+        # Arrange
+        self.workspace_service.get_workspace.return_value = WorkSpace(
+            2, 2, ObstacleMap([(1, 0, 1, 2)])
+        )
+        batch_planner = BatchPathPlanner(workspace_service=self.workspace_service)
+
+        # Act & Assert
+        with pytest.raises(ValueError, match="Request 0: Goal 2 0 N is unreachable from 0 0 N"):
+            batch_planner.plan_all(
+                [(Position(0, 0), Orientation("N"), Position(2, 0), Orientation("N"))]
+            )
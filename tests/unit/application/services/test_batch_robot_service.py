@@ -0,0 +1,179 @@
+import random
+
+import pytest
+from unittest.mock import Mock
+
+pytest.importorskip("numpy")
+
+from src.application.repository.robot_repository import RobotRepository
+from src.application.services.batch_robot_service import BatchRobotService
+from src.application.services.robot_service import RobotService
+from src.application.services.work_space import WorkSpaceService
+from src.domain.robot.value_objects import Position, Orientation
+from src.domain.workspace.entity import WorkSpace
+from src.domain.workspace.obstacle_map import ObstacleMap
+
+
+class TestBatchRobotService:
+
+    def _build_service(self, service_class, robots, workspace):
+        robot_repository = Mock(spec=RobotRepository)
+        robot_repository.iter_robots.side_effect = lambda: iter(robots)
+        workspace_service = Mock(spec=WorkSpaceService)
+        workspace_service.get_workspace.return_value = workspace
+        return service_class(
+            robot_repository=robot_repository, workspace_service=workspace_service
+        )
+
+    def _run(self, service_class, robots, workspace):
+        service = self._build_service(service_class, robots, workspace)
+        try:
+            return service.process_instructions()
+        except ValueError as error:
+            return f"ValueError: {error}"
+
+    def test_process_instructions_sample_mission(self):
+        # Arrange
+        robots = [
+            (Position(1, 2), Orientation("N"), "LMLMLMLMM"),
+            (Position(3, 3), Orientation("E"), "MMRMMRMRRM"),
+        ]
+
+        # Act
+        result = self._run(BatchRobotService, robots, WorkSpace(5, 5))
+
+        # Assert
+        assert result == "1 3 N\n5 1 E"
+
+    @pytest.mark.parametrize(
+        "robots,expected_error",
+        [
+            pytest.param(
+                [
+                    (Position(0, 0), Orientation("N"), "MMMMMMMM"),
+                    (Position(6, 0), Orientation("N"), "M"),
+                ],
+                "Position Position(x=0, y=6) is out of workspace bounds",
+                id="earliest_robot_error_wins_over_later_initial_error",
+            ),
+            pytest.param(
+                [
+                    (Position(0, 0), Orientation("N"), "M"),
+                    (Position(6, 0), Orientation("N"), "M"),
+                    (Position(0, 0), Orientation("S"), "M"),
+                ],
+                "Initial position Position(x=6, y=0) is out of workspace bounds",
+                id="initial_position_out_of_bounds",
+            ),
+            pytest.param(
+                [(Position(0, 0), Orientation("N"), "MMXM")],
+                "Invalid instruction: X",
+                id="invalid_instruction",
+            ),
+        ],
+    )
+    def test_process_instructions_raises_first_robot_error(
+        self, robots, expected_error
+    ):
+        # Act & Assert
+        service = self._build_service(BatchRobotService, robots, WorkSpace(5, 5))
+        with pytest.raises(ValueError) as exc_info:
+            service.process_instructions()
+        assert str(exc_info.value) == expected_error
+
+    def test_process_instructions_reports_robot_error_before_later_parse_error(self):
+        # Arrange
+        def iter_robots():
+            yield Position(0, 0), Orientation("S"), "M"
+            raise ValueError("Invalid input format.")
+
+        service = self._build_service(BatchRobotService, [], WorkSpace(5, 5))
+        service.robot_repository.iter_robots.side_effect = iter_robots
+
+        # Act & Assert
+        with pytest.raises(ValueError) as exc_info:
+            service.process_instructions()
+        assert str(exc_info.value) == (
+            "Position Position(x=0, y=-1) is out of workspace bounds"
+        )
+
+    @pytest.mark.parametrize("seed", range(25))
+    def test_process_instructions_matches_sequential_service(self, seed):
+        # Arrange
+        rng = random.Random(seed)
+        workspace = WorkSpace(rng.randint(1, 6), rng.randint(1, 6))
+        robots = []
+        for _ in range(rng.randint(1, 8)):
+            commands = "LRMMM" + ("X" if rng.random() < 0.1 else "")
+            robots.append(
+                (
+                    Position(rng.randint(0, workspace.max_x), rng.randint(0, workspace.max_y)),
+                    Orientation(rng.choice("NESW")),
+                    "".join(rng.choice(commands) for _ in range(rng.randint(0, 15))),
+                )
+            )
+
+        # Act
+        expected = self._run(RobotService, robots, workspace)
+        result = self._run(BatchRobotService, robots, workspace)
+
+        # Assert
+        assert result == expected
+
+    @pytest.mark.parametrize("seed", range(25))
+    def test_process_instructions_matches_sequential_service_with_obstacles(self, seed):
+        # Arrange
+        rng = random.Random(seed)
+        max_x, max_y = rng.randint(2, 8), rng.randint(2, 8)
+        obstacles = ObstacleMap(
+            (x, y, min(x + rng.randint(0, 2), max_x), y)
+            for x, y in (
+                (rng.randint(0, max_x), rng.randint(0, max_y))
+                for _ in range(rng.randint(1, 4))
+            )
+        )
+        workspace = WorkSpace(max_x, max_y, obstacles=obstacles)
+        robots = [
+            (
+                Position(rng.randint(0, max_x), rng.randint(0, max_y)),
+                Orientation(rng.choice("NESW")),
+                "".join(rng.choice("LRMMM") for _ in range(rng.randint(0, 15))),
+            )
+            for _ in range(rng.randint(1, 8))
+        ]
+
+        # Act
+        expected = self._run(RobotService, robots, workspace)
+        result = self._run(BatchRobotService, robots, workspace)
+
+        # Assert
+        assert result == expected
+
+    @pytest.mark.parametrize("seed", range(25))
+    def test_process_instructions_matches_sequential_service_with_zones(self, seed):
+        # Arrange
+        rng = random.Random(seed)
+        max_x, max_y = rng.randint(3, 9), rng.randint(3, 9)
+        obstacles = ObstacleMap(
+            (x, y, min(x + rng.randint(0, 3), max_x), min(y + rng.randint(0, 3), max_y))
+            for x, y in (
+                (rng.randint(0, max_x), rng.randint(0, max_y))
+                for _ in range(rng.randint(1, 3))
+            )
+        )
+        workspace = WorkSpace(max_x, max_y, obstacles=obstacles)
+        robots = [
+            (
+                Position(rng.randint(0, max_x), rng.randint(0, max_y)),
+                Orientation(rng.choice("NESW")),
+                "".join(rng.choice("LRMMM") for _ in range(rng.randint(0, 20))),
+            )
+            for _ in range(rng.randint(1, 10))
+        ]
+
+        # Act
+        expected = self._run(RobotService, robots, workspace)
+        result = self._run(BatchRobotService, robots, workspace)
+
+        # Assert
+        assert result == expected
@@ -0,0 +1,53 @@
+import pytest
+from unittest.mock import Mock
+
+from src.application.repository.robot_repository import RobotRepository
+from src.application.repository.simulation_result_cache import SimulationResultCache
+from src.application.services.cached_robot_service import CachedRobotService
+from src.application.services.work_space import WorkSpaceService
+from src.domain.robot.value_objects import Position, Orientation
+from src.domain.workspace.entity import WorkSpace
+
+
+class TestCachedRobotService:
+
+    def test_process_instructions_reuses_cached_results(self):
+        # Arrange
+        workspace_service = Mock(spec=WorkSpaceService)
+        workspace_service.get_workspace.return_value = WorkSpace(5, 5)
+        robot_repository = Mock(spec=RobotRepository)
+        robot_repository.iter_robots.return_value = iter(
+            [
+                (Position(1, 2), Orientation("N"), "LMLMLMLMM"),
+                (Position(3, 3), Orientation("E"), "MMRMMRMRRM"),
+            ]
+        )
+        result_cache = Mock(spec=SimulationResultCache)
+        # The first robot was simulated by an earlier run
+        result_cache.get.side_effect = [(Position(4, 4), Orientation("W")), None]
+        service = CachedRobotService(
+            robot_repository=robot_repository,
+            workspace_service=workspace_service,
+            result_cache=result_cache,
+        )
+
+        # Act
+        result = service.process_instructions()
+
+        # Assert
+        assert result == "4 4 W\n5 1 E"
+        fingerprint = result_cache.get.call_args_list[1].args[0]
+        result_cache.put.assert_called_once_with(
+            fingerprint, Position(5, 1), Orientation("E")
+        )
+        result_cache.flush.assert_called_once()
+
+    def test_parking_robots_cannot_be_combined_with_result_cache(self):
+        # Act & Assert
+        with pytest.raises(ValueError, match="cannot be parked when caching results"):
+            CachedRobotService(
+                robot_repository=Mock(spec=RobotRepository),
+                workspace_service=Mock(spec=WorkSpaceService),
+                park_finished_robots=True,
+                result_cache=Mock(spec=SimulationResultCache),
+            )
@@ -0,0 +1,163 @@
+import pytest
+from unittest.mock import Mock
+
+from src.application.repository.checkpoint_store import (
+    CheckpointStore,
+    FleetCheckpoint,
+    RobotProgress,
+)
+from src.application.repository.robot_repository import RobotRepository
+from src.application.services.checkpointed_robot_service import (
+    CheckpointedRobotService,
+)
+from src.application.services.simulation_fingerprint import (
+    extend_fingerprint,
+    fingerprint_robot,
+    fingerprint_workspace,
+)
+from src.application.services.work_space import WorkSpaceService
+from src.domain.robot.value_objects import Position, Orientation
+from src.domain.workspace.entity import WorkSpace
+
+
+def mission_fingerprint(workspace, robots):
+    workspace_fingerprint = fingerprint_workspace(workspace)
+    fingerprint = workspace_fingerprint
+    for robot in robots:
+        fingerprint = extend_fingerprint(
+            fingerprint, fingerprint_robot(workspace_fingerprint, *robot)
+        )
+    return fingerprint
+
+
+class TestCheckpointedRobotService:
+
+    def test_process_instructions_resumes_robot_from_saved_progress(self):
+        # Arrange
+        workspace_service = Mock(spec=WorkSpaceService)
+        workspace_service.get_workspace.return_value = WorkSpace(9, 9)
+        robots = [
+            (Position(1, 2), Orientation("N"), "LMLMLMLMM"),
+            (Position(0, 0), Orientation("N"), "MMMMMMMMRM"),
+        ]
+        fingerprint = mission_fingerprint(WorkSpace(9, 9), robots)
+        robot_repository = Mock(spec=RobotRepository)
+        robot_repository.iter_robots.return_value = iter(robots)
+        checkpoint_store = Mock(spec=CheckpointStore)
+        checkpoint_store.load.return_value = FleetCheckpoint(
+            1, RobotProgress(8, Position(5, 5), Orientation("N")), fingerprint
+        )
+        checkpoint_store.iter_final_states.return_value = iter(
+            [(Position(1, 3), Orientation("N"))]
+        )
+        service = CheckpointedRobotService(
+            robot_repository=robot_repository,
+            workspace_service=workspace_service,
+            checkpoint_store=checkpoint_store,
+            checkpoint_steps=4,
+        )
+
+        # Act
+        result = service.process_instructions()
+
+        # Assert
+        # Only the last two commands run, from the saved pose
+        assert result == "1 3 N\n6 5 E"
+        checkpoint_store.save.assert_called_once_with(
+            FleetCheckpoint(2, fingerprint=fingerprint),
+            [(Position(6, 5), Orientation("E"))],
+        )
+
+    @pytest.mark.parametrize(
+        "robots",
+        [
+            pytest.param(
+                [(Position(1, 2), Orientation("N"), "LMLMLMLM")],
+                id="changed_completed_robot",
+            ),
+            pytest.param(
+                [
+                    (Position(1, 2), Orientation("N"), "LMLMLMLMM"),
+                    (Position(0, 1), Orientation("N"), "MMMMMMMMRM"),
+                ],
+                id="changed_robot_in_progress",
+            ),
+            pytest.param([], id="missing_robots"),
+        ],
+    )
+    def test_process_instructions_rejects_checkpoint_of_other_mission(self, robots):
+        # Arrange
+        workspace_service = Mock(spec=WorkSpaceService)
+        workspace_service.get_workspace.return_value = WorkSpace(9, 9)
+        robot_repository = Mock(spec=RobotRepository)
+        robot_repository.iter_robots.return_value = iter(robots)
+        checkpoint_store = Mock(spec=CheckpointStore)
+        checkpoint_store.load.return_value = FleetCheckpoint(
+            1,
+            RobotProgress(8, Position(5, 5), Orientation("N")),
+            mission_fingerprint(
+                WorkSpace(9, 9),
+                [
+                    (Position(1, 2), Orientation("N"), "LMLMLMLMM"),
+                    (Position(0, 0), Orientation("N"), "MMMMMMMMRM"),
+                ],
+            ),
+        )
+        checkpoint_store.iter_final_states.return_value = iter(
+            [(Position(1, 3), Orientation("N"))]
+        )
+        service = CheckpointedRobotService(
+            robot_repository=robot_repository,
+            workspace_service=workspace_service,
+            checkpoint_store=checkpoint_store,
+            checkpoint_steps=4,
+        )
+
+        # Act & Assert
+        with pytest.raises(ValueError, match="does not match this mission"):
+            service.process_instructions()
+        checkpoint_store.save.assert_not_called()
+
+    def test_process_instructions_saves_progress_of_long_robots(self):
+        # Arrange
+        workspace_service = Mock(spec=WorkSpaceService)
+        workspace_service.get_workspace.return_value = WorkSpace(9, 9)
+        robots = [(Position(0, 0), Orientation("N"), "MMMMMMMMRM")]
+        fingerprint = mission_fingerprint(WorkSpace(9, 9), robots)
+        robot_repository = Mock(spec=RobotRepository)
+        robot_repository.iter_robots.return_value = iter(robots)
+        checkpoint_store = Mock(spec=CheckpointStore)
+        checkpoint_store.load.return_value = None
+        checkpoint_store.iter_final_states.return_value = iter([])
+        service = CheckpointedRobotService(
+            robot_repository=robot_repository,
+            workspace_service=workspace_service,
+            checkpoint_store=checkpoint_store,
+            checkpoint_interval=0.0,
+            checkpoint_steps=4,
+        )
+
+        # Act
+        result = service.process_instructions()
+
+        # Assert
+        assert result == "1 8 E"
+        assert [c.args for c in checkpoint_store.save.call_args_list] == [
+            (
+                FleetCheckpoint(
+                    0, RobotProgress(4, Position(0, 4), Orientation("N")), fingerprint
+                ),
+                [],
+            ),
+            (
+                FleetCheckpoint(
+                    0, RobotProgress(8, Position(0, 8), Orientation("N")), fingerprint
+                ),
+                [],
+            ),
+            (
+                FleetCheckpoint(1, fingerprint=fingerprint),
+                [(Position(1, 8), Orientation("E"))],
+            ),
+            (FleetCheckpoint(1, fingerprint=fingerprint), []),
+        ]
@@ -0,0 +1,73 @@
+from unittest.mock import Mock
+
+from src.application.repository.checkpoint_store import (
+    CheckpointStore,
+    FleetCheckpoint,
+    RobotProgress,
+)
+from src.application.services.fleet_checkpointer import FleetCheckpointer
+from src.application.services.simulation_fingerprint import extend_fingerprint
+from src.domain.robot.value_objects import Orientation, Position
+
+
+class TestFleetCheckpointer:
+
+    def test_saves_only_when_interval_has_passed(self):
+        # Arrange
+        now = [0.0]
+        store = Mock(spec=CheckpointStore)
+        checkpointer = FleetCheckpointer(
+            store, completed_robots=3, interval=10.0, clock=lambda: now[0]
+        )
+        first = (Position(1, 1), Orientation("N"))
+        second = (Position(2, 2), Orientation("E"))
+
+        # Act
+        checkpointer.complete(first)
+        now[0] = 10.0
+        checkpointer.complete(second)
+        now[0] = 15.0
+        checkpointer.progress(RobotProgress(8, Position(0, 8), Orientation("N")))
+
+        # Assert
+        store.save.assert_called_once_with(FleetCheckpoint(5), [first, second])
+        assert checkpointer.saves == 1
+
+    def test_save_keeps_progress_of_unfinished_robot(self):
+        # Arrange
+        store = Mock(spec=CheckpointStore)
+        checkpointer = FleetCheckpointer(store, interval=60.0)
+        progress = RobotProgress(4, Position(0, 4), Orientation("N"))
+        checkpointer.progress(progress)
+
+        # Act
+        checkpointer.save()
+
+        # Assert
+        store.save.assert_called_once_with(FleetCheckpoint(0, progress), [])
+
+    def test_fingerprint_covers_robot_in_progress_only_while_it_runs(self):
+        # Arrange
+        store = Mock(spec=CheckpointStore)
+        checkpointer = FleetCheckpointer(store, fingerprint=b"w", interval=60.0)
+        first, second = b"a", b"b"
+        progress = RobotProgress(4, Position(0, 4), Orientation("N"))
+        final_state = (Position(1, 1), Orientation("N"))
+
+        # Act
+        checkpointer.start(first)
+        checkpointer.complete(final_state)
+        checkpointer.start(second)
+        checkpointer.save()
+        checkpointer.progress(progress)
+        checkpointer.save()
+
+        # Assert
+        completed = extend_fingerprint(b"w", first)
+        assert [c.args for c in store.save.call_args_list] == [
+            (FleetCheckpoint(1, fingerprint=completed), [final_state]),
+            (
+                FleetCheckpoint(1, progress, extend_fingerprint(completed, second)),
+                [],
+            ),
+        ]
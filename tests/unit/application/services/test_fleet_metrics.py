@@ -0,0 +1,153 @@
+import pytest
+from unittest.mock import Mock, patch
+
+from src.application.repository.robot_repository import RobotRepository
+from src.application.repository.simulation_result_cache import SimulationResultCache
+from src.application.services.cached_robot_service import CachedRobotService
+from src.application.services.fleet_metrics import FleetMetrics, InstrumentedWorkSpace
+from src.application.services.robot_error_table import RobotErrorTable
+from src.application.services.robot_service import RobotService
+from src.application.services.work_space import WorkSpaceService
+from src.domain.robot.value_objects import Position, Orientation
+from src.domain.workspace.entity import WorkSpace
+
+
+class TestFleetMetrics:
+
+    def _build_service(self, robots, metrics, service_class=RobotService, **options):
+        robot_repository = Mock(spec=RobotRepository)
+        robot_repository.iter_robots.return_value = iter(robots)
+        workspace_service = Mock(spec=WorkSpaceService)
+        workspace_service.get_workspace.return_value = WorkSpace(5, 5)
+        return service_class(
+            robot_repository=robot_repository,
+            workspace_service=workspace_service,
+            metrics=metrics,
+            **options,
+        )
+
+    def test_process_instructions_collects_counters_and_stage_timings(self):
+        # Arrange
+        metrics = FleetMetrics()
+        service = self._build_service(
+            [
+                (Position(1, 2), Orientation("N"), "LMLMLMLMM"),
+                (Position(3, 3), Orientation("E"), "MMRMMRMRRM"),
+            ],
+            metrics,
+        )
+
+        # Act
+        result = service.process_instructions()
+
+        # Assert
+        assert result == "1 3 N\n5 1 E"
+        report = metrics.to_report()
+        assert report["counters"]["robots_processed"] == 2
+        assert report["counters"]["moves"] == 5 + 6
+        assert report["counters"]["turns"] == 4 + 4
+        assert report["counters"]["steps_executed"] == 19
+        assert report["counters"]["bounds_checks"] >= 2
+        assert set(report["stage_seconds"]) == {
+            "parse", "simulate", "bounds_check", "format"
+        }
+
+    def test_failed_robot_is_not_counted(self):
+        # Arrange
+        metrics = FleetMetrics()
+        service = self._build_service(
+            [(Position(0, 0), Orientation("S"), "M")], metrics
+        )
+
+        # Act & Assert
+        with pytest.raises(ValueError):
+            service.process_instructions()
+        assert metrics.counters["robots_processed"] == 0
+        assert metrics.stage_seconds["simulate"] > 0
+
+    def test_result_cache_hit_executes_no_instructions(self):
+        # Arrange
+        metrics = FleetMetrics()
+        result_cache = Mock(spec=SimulationResultCache)
+        result_cache.get.return_value = (Position(1, 3), Orientation("N"))
+        service = self._build_service(
+            [(Position(1, 2), Orientation("N"), "LMLMLMLMM")],
+            metrics,
+            service_class=CachedRobotService,
+            result_cache=result_cache,
+        )
+
+        # Act
+        result = service.process_instructions()
+
+        # Assert
+        assert result == "1 3 N"
+        assert metrics.counters["robots_processed"] == 1
+        assert metrics.counters["result_cache_hits"] == 1
+        assert metrics.counters["steps_executed"] == 0
+        assert metrics.counters["moves"] == 0
+
+    def test_fail_soft_robot_counts_commands_run_before_failing(self):
+        # Arrange
+        metrics = FleetMetrics()
+        service = self._build_service(
+            [(Position(0, 0), Orientation("N"), "MLLMMR")],
+            metrics,
+            error_table=RobotErrorTable(),
+        )
+
+        # Act
+        service.process_instructions()
+
+        # Assert
+        assert metrics.counters["robots_processed"] == 0
+        assert metrics.counters["steps_executed"] == 4
+        assert metrics.counters["moves"] == 2
+        assert metrics.counters["turns"] == 2
+
+    def test_time_stage_leaves_out_excluded_nested_stages(self):
+        # Arrange
+        metrics = FleetMetrics()
+
+        # Act
+        with patch(
+            "src.application.services.fleet_metrics.time.perf_counter",
+            side_effect=[0.0, 3.0],
+        ):
+            with metrics.time_stage("simulate", exclude=("bounds_check",)):
+                metrics.add_time("bounds_check", 1.0)
+
+        # Assert
+        assert metrics.stage_seconds == {"bounds_check": 1.0, "simulate": 2.0}
+
+    def test_to_prometheus_exports_counters_and_stages(self):
+        # Arrange
+        metrics = FleetMetrics()
+        metrics.record_robot("LMR")
+        metrics.add_time("parse", 0.5)
+
+        # Act
+        text = metrics.to_prometheus()
+
+        # Assert
+        assert "# TYPE robot_fleet_robots_processed_total counter\n" in text
+        assert "robot_fleet_robots_processed_total 1\n" in text
+        assert "robot_fleet_turns_total 2\n" in text
+        assert 'robot_fleet_stage_seconds_total{stage="parse"} 0.5\n' in text
+
+    def test_instrumented_workspace_delegates_and_counts(self):
+        # Arrange
+        metrics = FleetMetrics()
+        workspace = InstrumentedWorkSpace(WorkSpace(5, 5), metrics)
+
+        # Act
+        results = [
+            workspace.is_position_valid(Position(6, 0)),
+            workspace.is_segment_valid(Position(0, 1), Position(0, 5)),
+            workspace.is_area_valid(Position(0, 0), Position(5, 5)),
+        ]
+
+        # Assert
+        assert results == [False, True, True]
+        assert workspace.max_x == 5
+        assert metrics.counters["bounds_checks"] == 3
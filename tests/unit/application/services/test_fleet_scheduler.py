@@ -0,0 +1,184 @@
+import random
+
+import pytest
+from unittest.mock import Mock
+
+from src.application.repository.robot_repository import RobotRepository
+from src.application.services.fleet_scheduler import ConflictPolicy, FleetScheduler
+from src.application.services.robot_service import RobotService
+from src.application.services.work_space import WorkSpaceService
+from src.domain.robot.value_objects import Position, Orientation
+from src.domain.workspace.entity import WorkSpace
+
+
+class TestFleetScheduler:
+
+    def _build_scheduler(self, robots, workspace, **kwargs):
+        robot_repository = Mock(spec=RobotRepository)
+        robot_repository.iter_robots.side_effect = lambda: iter(robots)
+        workspace_service = Mock(spec=WorkSpaceService)
+        workspace_service.get_workspace.return_value = workspace
+        return FleetScheduler(
+            robot_repository=robot_repository,
+            workspace_service=workspace_service,
+            **kwargs,
+        )
+
+    def test_process_instructions_matches_robot_service_for_apart_robots(self):
+        # Arrange
+        rng = random.Random(13)
+        workspace = WorkSpace(60, 60)
+        robots = [
+            (
+                Position(10 * column + 5, 10 * row + 5),
+                Orientation(rng.choice("NESW")),
+                "".join(rng.choice("LRM") for _ in range(rng.randint(0, 8))),
+            )
+            for row in range(5)
+            for column in range(5)
+        ]
+        robot_repository = Mock(spec=RobotRepository)
+        robot_repository.iter_robots.side_effect = lambda: iter(robots)
+        workspace_service = Mock(spec=WorkSpaceService)
+        workspace_service.get_workspace.return_value = workspace
+        expected = RobotService(
+            robot_repository=robot_repository, workspace_service=workspace_service
+        ).process_instructions()
+
+        # Act
+        result = self._build_scheduler(robots, workspace).process_instructions()
+
+        # Assert
+        assert result == expected
+        assert not workspace.occupied_cells
+
+    @pytest.mark.parametrize(
+        "conflict_policy, expected_output",
+        [
+            pytest.param(ConflictPolicy.BLOCK, "2 1 E\n1 1 S", id="block_waits"),
+            pytest.param(ConflictPolicy.SKIP, "2 1 E\n1 2 S", id="skip_drops_move"),
+        ],
+    )
+    def test_cell_conflict_is_won_by_lowest_index(self, conflict_policy, expected_output):
+        # Arrange
+        robots = [
+            (Position(0, 1), Orientation("E"), "MM"),
+            (Position(1, 2), Orientation("S"), "M"),
+        ]
+        scheduler = self._build_scheduler(
+            robots, WorkSpace(5, 5), conflict_policy=conflict_policy
+        )
+
+        # Act
+        result = scheduler.process_instructions()
+
+        # Assert
+        assert result == expected_output
+        assert scheduler.tick_count == 2
+
+    def test_cell_conflict_fails_with_fail_policy(self):
+        # Arrange
+        robots = [
+            (Position(0, 1), Orientation("E"), "MM"),
+            (Position(1, 2), Orientation("S"), "M"),
+        ]
+        scheduler = self._build_scheduler(
+            robots, WorkSpace(5, 5), conflict_policy=ConflictPolicy.FAIL
+        )
+
+        # Act & Assert
+        with pytest.raises(
+            ValueError,
+            match=r"Robot at index 1 collides with another robot at "
+                  r"Position\(x=1, y=1\) on tick 0",
+        ):
+            scheduler.process_instructions()
+
+    def test_swap_conflict_blocks_both_robots(self):
+        # Arrange
+        robots = [
+            (Position(0, 0), Orientation("E"), "M"),
+            (Position(1, 0), Orientation("W"), "M"),
+        ]
+        scheduler = self._build_scheduler(
+            robots, WorkSpace(5, 5), conflict_policy=ConflictPolicy.SKIP
+        )
+
+        # Act
+        result = scheduler.process_instructions()
+
+        # Assert
+        assert result == "0 0 E\n1 0 W"
+
+    def test_swap_conflict_deadlocks_with_block_policy(self):
+        # Arrange
+        robots = [
+            (Position(0, 0), Orientation("E"), "M"),
+            (Position(1, 0), Orientation("W"), "M"),
+        ]
+        scheduler = self._build_scheduler(robots, WorkSpace(5, 5))
+
+        # Act & Assert
+        with pytest.raises(
+            ValueError, match=r"Robots at indexes \[0, 1\] are deadlocked on tick 0"
+        ):
+            scheduler.process_instructions()
+
+    def test_robot_waits_behind_turning_robot(self):
+        # Arrange
+        robots = [
+            (Position(0, 0), Orientation("E"), "MM"),
+            (Position(1, 0), Orientation("E"), "LM"),
+        ]
+        scheduler = self._build_scheduler(robots, WorkSpace(5, 5))
+
+        # Act
+        result = scheduler.process_instructions()
+
+        # Assert
+        assert result == "2 0 E\n1 1 N"
+        assert scheduler.tick_count == 3
+
+    def test_robots_follow_each_other_and_rotate(self):
+        # Arrange
+        robots = [
+            (Position(0, 0), Orientation("N"), "M"),
+            (Position(0, 1), Orientation("E"), "M"),
+            (Position(1, 1), Orientation("S"), "M"),
+            (Position(1, 0), Orientation("W"), "M"),
+            (Position(3, 0), Orientation("E"), "M"),
+            (Position(2, 0), Orientation("E"), "M"),
+        ]
+        scheduler = self._build_scheduler(
+            robots, WorkSpace(5, 5), conflict_policy=ConflictPolicy.FAIL
+        )
+
+        # Act
+        result = scheduler.process_instructions()
+
+        # Assert
+        assert result == "0 1 N\n1 1 E\n1 0 S\n0 0 W\n4 0 E\n3 0 E"
+
+    def test_out_of_bounds_move_raises(self):
+        # Arrange
+        robots = [(Position(0, 0), Orientation("S"), "M")]
+        scheduler = self._build_scheduler(robots, WorkSpace(5, 5))
+
+        # Act & Assert
+        with pytest.raises(ValueError, match="out of workspace bounds"):
+            scheduler.process_instructions()
+
+    def test_shared_initial_position_raises(self):
+        # Arrange
+        robots = [
+            (Position(1, 1), Orientation("N"), "M"),
+            (Position(1, 1), Orientation("E"), "M"),
+        ]
+        scheduler = self._build_scheduler(robots, WorkSpace(5, 5))
+
+        # Act & Assert
+        with pytest.raises(
+            ValueError,
+            match=r"Initial position Position\(x=1, y=1\) is occupied by another robot",
+        ):
+            scheduler.process_instructions()
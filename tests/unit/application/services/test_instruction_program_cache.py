@@ -0,0 +1,87 @@
+import pytest
+from src.application.services.instruction_program_cache import InstructionProgramCache
+from src.domain.robot.instruction_program import InstructionProgram
+
+
+class TestInstructionProgramCache:
+
+    def test_get_compiles_once_per_instruction_string(self):
+        # Arrange
+        cache = InstructionProgramCache()
+
+        # Act
+        first_program, first_effect = cache.get("MMRMMRMRRM")
+        second_program, second_effect = cache.get("MMRMMRMRRM")
+
+        # Assert
+        assert first_program == InstructionProgram.compile("MMRMMRMRRM")
+        assert second_program is first_program
+        assert second_effect is first_effect
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_get_evicts_least_recently_used_entry(self):
+        # Arrange
+        cache = InstructionProgramCache(maxsize=2)
+        cache.get("M")
+        cache.get("L")
+        cache.get("M")
+
+        # Act
+        cache.get("R")
+        cache.get("M")
+        cache.get("L")
+
+        # Assert
+        assert len(cache) == 2
+        assert cache.evictions == 2
+        assert (cache.hits, cache.misses) == (2, 4)
+
+    @pytest.mark.parametrize(
+        "maxsize,max_instruction_length,instructions",
+        [
+            pytest.param(0, None, "M", id="zero_maxsize_disables_caching"),
+            pytest.param(8, 3, "MMMM", id="instructions_longer_than_limit"),
+        ],
+    )
+    def test_get_skips_caching(self, maxsize, max_instruction_length, instructions):
+        # Arrange
+        cache = InstructionProgramCache(
+            maxsize=maxsize, max_instruction_length=max_instruction_length
+        )
+
+        # Act
+        cache.get(instructions)
+        cache.get(instructions)
+
+        # Assert
+        assert len(cache) == 0
+        assert (cache.hits, cache.misses) == (0, 2)
+
+    @pytest.mark.parametrize(
+        "min_instruction_length,instructions,expected",
+        [
+            pytest.param(32, "M" * 31, False, id="shorter_than_limit"),
+            pytest.param(32, "M" * 32, True, id="at_limit"),
+            pytest.param(0, "", True, id="zero_compiles_everything"),
+        ],
+    )
+    def test_compiles(self, min_instruction_length, instructions, expected):
+        # Arrange
+        cache = InstructionProgramCache(min_instruction_length=min_instruction_length)
+
+        # Act & Assert
+        assert cache.compiles(instructions) is expected
+
+    def test_clear_resets_entries_and_counters(self):
+        # Arrange
+        cache = InstructionProgramCache(maxsize=1)
+        cache.get("M")
+        cache.get("M")
+        cache.get("L")
+
+        # Act
+        cache.clear()
+
+        # Assert
+        assert len(cache) == 0
+        assert (cache.hits, cache.misses, cache.evictions) == (0, 0, 0)
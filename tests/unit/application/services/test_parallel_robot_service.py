@@ -0,0 +1,83 @@
+import random
+
+import pytest
+from unittest.mock import Mock
+
+from src.application.repository.robot_repository import RobotRepository
+from src.application.services.parallel_robot_service import ParallelRobotService
+from src.application.services.robot_service import RobotService
+from src.application.services.work_space import WorkSpaceService
+from src.domain.robot.value_objects import Position, Orientation
+from src.domain.workspace.entity import WorkSpace
+
+
+class TestParallelRobotService:
+
+    def _build_service(self, robots, workspace, **kwargs):
+        robot_repository = Mock(spec=RobotRepository)
+        robot_repository.iter_robots.side_effect = lambda: iter(robots)
+        workspace_service = Mock(spec=WorkSpaceService)
+        workspace_service.get_workspace.return_value = workspace
+        if kwargs:
+            return ParallelRobotService(
+                robot_repository=robot_repository,
+                workspace_service=workspace_service,
+                **kwargs,
+            )
+        return RobotService(
+            robot_repository=robot_repository, workspace_service=workspace_service
+        )
+
+    def test_process_instructions_keeps_input_order(self):
+        # Arrange
+        rng = random.Random(7)
+        workspace = WorkSpace(20, 20)
+        robots = [
+            (
+                Position(rng.randint(5, 15), rng.randint(5, 15)),
+                Orientation(rng.choice("NESW")),
+                "".join(rng.choice("LRM") for _ in range(rng.randint(0, 8))),
+            )
+            for _ in range(200)
+        ]
+
+        # Act
+        expected = self._build_service(robots, workspace).process_instructions()
+        result = self._build_service(
+            robots, workspace, max_workers=2, chunk_size=7
+        ).process_instructions()
+
+        # Assert
+        assert result == expected
+
+    def test_process_instructions_raises_first_failing_robot(self):
+        # Arrange
+        robots = [(Position(1, 1), Orientation("N"), "M")] * 20 + [
+            (Position(0, 0), Orientation("S"), "M"),
+            (Position(9, 9), Orientation("N"), "M"),
+        ]
+        service = self._build_service(
+            robots, WorkSpace(5, 5), max_workers=2, chunk_size=3
+        )
+
+        # Act & Assert
+        with pytest.raises(ValueError) as exc_info:
+            service.process_instructions()
+        assert str(exc_info.value) == (
+            "Position Position(x=0, y=-1) is out of workspace bounds"
+        )
+
+    def test_process_instructions_reports_robot_error_before_later_parse_error(self):
+        # Arrange
+        def iter_robots():
+            yield Position(0, 0), Orientation("S"), "M"
+            yield Position(1, 1), Orientation("N"), "M"
+            raise ValueError("Invalid input format.")
+
+        service = self._build_service([], WorkSpace(5, 5), max_workers=1, chunk_size=5)
+        service.robot_repository.iter_robots.side_effect = iter_robots
+
+        # Act & Assert
+        with pytest.raises(ValueError) as exc_info:
+            service.process_instructions()
+        assert "out of workspace bounds" in str(exc_info.value)
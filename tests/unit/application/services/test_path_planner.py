@@ -0,0 +1,211 @@
+from unittest.mock import Mock
+
+import pytest
+
+from src.application.services.path_planner import PathPlanner, search_path
+from src.application.services.work_space import WorkSpaceService
+from src.domain.robot.entity import Robot
+from src.domain.robot.value_objects import Orientation, Position
+from src.domain.workspace.entity import WorkSpace
+from src.domain.workspace.obstacle_map import ObstacleMap
+
+
+def make_planner(workspace: WorkSpace, **kwargs) -> PathPlanner:
+    workspace_service = Mock(spec=WorkSpaceService)
+    workspace_service.get_workspace.return_value = workspace
+    return PathPlanner(workspace_service=workspace_service, **kwargs)
+
+
+def replay(path: str, position: Position, orientation: Orientation, workspace):
+    robot = Robot(position, orientation)
+    robot.execute_instructions(path, workspace)
+    return robot.get_state()
+
+
+class TestPathPlanner:
+
+    @pytest.mark.parametrize(
+        "start,start_heading,goal,goal_heading,expected",
+        [
+            pytest.param((1, 1), "N", (1, 1), "N", "", id="already_there"),
+            pytest.param((1, 1), "N", (1, 4), "N", "MMM", id="straight_ahead"),
+            pytest.param((1, 1), "N", (1, 1), "W", "L", id="turn_only"),
+            pytest.param((1, 1), "N", (1, 1), "S", "LL", id="turn_around"),
+            pytest.param((0, 0), "E", (2, 2), "N", "MMLMM", id="corner"),
+        ],
+    )
+    @pytest.mark.parametrize("max_field_cells", [1 << 20, 0], ids=["field", "a_star"])
+    def test_plan_returns_shortest_instruction_string(
+        self, start, start_heading, goal, goal_heading, expected, max_field_cells
+    ):
+        # Arrange
+        planner = make_planner(WorkSpace(5, 5), max_field_cells=max_field_cells)
+
+        # Act
+        path = planner.plan(
+            Position(*start), Orientation(start_heading),
+            Position(*goal), Orientation(goal_heading),
+        )
+
+        # Assert
+        assert len(path) == len(expected)
+        assert replay(
+            path, Position(*start), Orientation(start_heading), WorkSpace(5, 5)
+        ) == (Position(*goal), Orientation(goal_heading))
+
+    @pytest.mark.parametrize("max_field_cells", [1 << 20, 0], ids=["field", "a_star"])
+    def test_plan_routes_around_obstacles(self, max_field_cells):
+        # Arrange
+        workspace = WorkSpace(4, 4, ObstacleMap([(0, 2, 3, 2)]))
+        planner = make_planner(workspace, max_field_cells=max_field_cells)
+
+        # Act
+        path = planner.plan(
+            Position(0, 0), Orientation("N"), Position(0, 4), Orientation("N")
+        )
+
+        # Assert
+        # Over to the gap in column 4, up and back: 12 moves and 4 turns
+        assert len(path) == 16
+        assert replay(path, Position(0, 0), Orientation("N"), workspace) == (
+            Position(0, 4),
+            Orientation("N"),
+        )
+
+    def test_plan_avoids_occupied_cells(self):
+        # Arrange
+        workspace = WorkSpace(2, 2)
+        workspace.occupy(Position(0, 1))
+        planner = make_planner(workspace)
+
+        # Act
+        path = planner.plan(
+            Position(0, 0), Orientation("N"), Position(0, 2), Orientation("N")
+        )
+
+        # Assert
+        assert "M" in path
+        assert replay(path, Position(0, 0), Orientation("N"), workspace) == (
+            Position(0, 2),
+            Orientation("N"),
+        )
+
+    def test_plan_reuses_distance_field_of_goal(self):
+        # Arrange
+        planner = make_planner(WorkSpace(5, 5))
+        goal, goal_orientation = Position(4, 4), Orientation("E")
+
+        # Act
+        planner.plan(Position(0, 0), Orientation("N"), goal, goal_orientation)
+        planner.plan(Position(3, 1), Orientation("S"), goal, goal_orientation)
+        planner.plan(Position(0, 0), Orientation("N"), goal, Orientation("W"))
+
+        # Assert
+        assert (planner.hits, planner.misses) == (1, 2)
+
+    def test_distance_fields_are_evicted_least_recently_used_first(self):
+        # Arrange
+        planner = make_planner(WorkSpace(3, 3), maxsize=1)
+        start, orientation = Position(0, 0), Orientation("N")
+
+        # Act
+        planner.plan(start, orientation, Position(1, 1), orientation)
+        planner.plan(start, orientation, Position(2, 2), orientation)
+        planner.plan(start, orientation, Position(1, 1), orientation)
+
+        # Assert
+        assert (planner.hits, planner.misses) == (0, 3)
+
+    @pytest.mark.parametrize(
+        "start,goal,message",
+        [
+            pytest.param(
+                Position(9, 0), Position(0, 0), "Start position .* is not a free cell",
+                id="start_out_of_bounds",
+            ),
+            pytest.param(
+                Position(0, 0), Position(1, 1), "Goal position .* is not a free cell",
+                id="goal_blocked",
+            ),
+            pytest.param(
+                Position(0, 0), Position(2, 2), "Goal 2 2 N is unreachable from 0 0 N",
+                id="walled_off",
+            ),
+        ],
+    )
+    @pytest.mark.parametrize("max_field_cells", [1 << 20, 0], ids=["field", "a_star"])
+    def test_plan_invalid_queries_raise_value_error(
+        self, start, goal, message, max_field_cells
+    ):
+        # Arrange
+        workspace = WorkSpace(2, 2, ObstacleMap([(1, 0, 1, 2), (0, 1, 0, 1)]))
+        planner = make_planner(workspace, max_field_cells=max_field_cells)
+
+        # Act & Assert
+        with pytest.raises(ValueError, match=message):
+            planner.plan(start, Orientation("N"), goal, Orientation("N"))
+
+    def test_clear_reads_workspace_again(self):
+        # Arrange
+        workspace = WorkSpace(2, 2)
+        planner = make_planner(workspace)
+        planner.plan(Position(0, 0), Orientation("N"), Position(0, 2), Orientation("N"))
+        workspace.occupy(Position(0, 1))
+
+        # Act
+        planner.clear()
+        path = planner.plan(
+            Position(0, 0), Orientation("N"), Position(0, 2), Orientation("N")
+        )
+
+        # Assert
+        assert path != "MM"
+        assert planner.workspace_service.get_workspace.call_count == 2
+
+    @pytest.mark.parametrize(
+        "start,goal",
+        [
+            pytest.param(Position(0, 0), Position(500, 500), id="goal_boxed_in"),
+            pytest.param(Position(500, 500), Position(0, 0), id="start_boxed_in"),
+        ],
+    )
+    def test_search_path_finds_pocketed_pose_unreachable_without_searching(
+        self, start, goal
+    ):
+        # Arrange
+        ring = ObstacleMap(
+            [(499, 499, 501, 499), (499, 501, 501, 501), (499, 500, 499, 500),
+             (501, 500, 501, 500)]
+        )
+        workspace = WorkSpace(999, 999, ring)
+
+        # Act
+        path = search_path(
+            workspace, start, Orientation("N"), goal, Orientation("N"), max_expansions=0
+        )
+
+        # Assert
+        assert path is None
+
+    def test_search_path_crosses_open_workspace_along_one_path(self):
+        # Act
+        path = search_path(
+            WorkSpace(1999, 1999),
+            Position(0, 0),
+            Orientation("N"),
+            Position(1999, 1999),
+            Orientation("N"),
+            max_expansions=10_000,
+        )
+
+        # Assert
+        assert len(path) == 2 * 1999 + 2
+
+    def test_plan_gives_up_after_max_search_states(self):
+        # Arrange
+        workspace = WorkSpace(99, 99, ObstacleMap([(50, 0, 50, 99)]))
+        planner = make_planner(workspace, max_field_cells=0, max_search_states=1000)
+
+        # Act & Assert
+        with pytest.raises(ValueError, match="found within 1000 search states"):
+            planner.plan(Position(0, 0), Orientation("N"), Position(99, 99), Orientation("N"))
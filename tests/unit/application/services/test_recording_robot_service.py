@@ -0,0 +1,57 @@
+import pytest
+from unittest.mock import Mock
+
+from src.application.repository.robot_repository import RobotRepository
+from src.application.repository.trajectory_writer import TrajectoryWriter
+from src.application.services.recording_robot_service import RecordingRobotService
+from src.application.services.work_space import WorkSpaceService
+from src.domain.robot.value_objects import Position, Orientation
+from src.domain.workspace.entity import WorkSpace
+
+
+class TestRecordingRobotService:
+
+    def test_process_instructions_records_trajectories(self):
+        # Arrange
+        workspace_service = Mock(spec=WorkSpaceService)
+        workspace_service.get_workspace.return_value = WorkSpace(5, 5)
+        robot_repository = Mock(spec=RobotRepository)
+        robot_repository.iter_robots.return_value = iter(
+            [
+                (Position(1, 2), Orientation("N"), "LM"),
+                (Position(3, 3), Orientation("E"), "MMM"),
+            ]
+        )
+        recorded = []
+        trajectory_writer = Mock(spec=TrajectoryWriter)
+        trajectory_writer.write.side_effect = lambda index, trajectory: recorded.append(
+            (index, list(trajectory))
+        )
+        service = RecordingRobotService(
+            robot_repository=robot_repository,
+            workspace_service=workspace_service,
+            trajectory_writer=trajectory_writer,
+        )
+
+        # Act & Assert
+        with pytest.raises(ValueError, match="out of workspace bounds"):
+            service.process_instructions()
+        assert recorded == [
+            (
+                0,
+                [
+                    (Position(1, 2), Orientation("N")),
+                    (Position(1, 2), Orientation("W")),
+                    (Position(0, 2), Orientation("W")),
+                ],
+            ),
+            (
+                1,
+                [
+                    (Position(3, 3), Orientation("E")),
+                    (Position(4, 3), Orientation("E")),
+                    (Position(5, 3), Orientation("E")),
+                ],
+            ),
+        ]
+        trajectory_writer.flush.assert_called_once()
@@ -0,0 +1,50 @@
+from src.application.services.robot_error_table import RobotErrorTable
+from src.domain.robot.robot_failure import RobotFailure
+from src.domain.robot.value_objects import Orientation, Position
+
+
+class TestRobotErrorTable:
+
+    def setup_method(self):
+        self.failures = [
+            RobotFailure(
+                robot_index=1,
+                step=0,
+                position=Position(9, 9),
+                orientation=Orientation("N"),
+                reason="Initial position Position(x=9, y=9) is out of workspace bounds",
+            ),
+            RobotFailure(
+                robot_index=4,
+                step=7,
+                position=Position(0, 5),
+                orientation=Orientation("W"),
+                reason="Position Position(x=-1, y=5) is out of workspace bounds",
+            ),
+        ]
+
+    def test_failures_round_trip_through_columns(self):
+        # Arrange
+        table = RobotErrorTable()
+
+        # Act
+        for failure in self.failures:
+            table.record(failure)
+
+        # Assert
+        assert len(table) == 2
+        assert list(table) == self.failures
+        assert table.failed_indexes() == [1, 4]
+
+    def test_format_lines_lists_index_step_pose_and_reason(self):
+        # Arrange
+        table = RobotErrorTable()
+        table.record(self.failures[1])
+
+        # Act
+        lines = list(table.format_lines())
+
+        # Assert
+        assert lines == [
+            "4 7 0 5 W Position Position(x=-1, y=5) is out of workspace bounds"
+        ]
@@ -2,9 +2,15 @@ from src.application.services.work_space import WorkSpaceService
 from src.domain.workspace.entity import WorkSpace
 import pytest
 from unittest.mock import Mock, patch
-from src.application.services.robot_service import RobotService
+from src.application.services.robot_error_table import RobotErrorTable
+from src.application.services.robot_service import RobotService, locate_failure
+from src.application.services.instruction_program_cache import InstructionProgramCache
 from src.application.repository.robot_repository import RobotRepository
+from src.application.repository.output_writer import OutputWriter
+from src.domain.robot.packed_instructions import PackedInstructions
+from src.domain.robot.robot_failure import RobotFailure
 from src.domain.robot.value_objects import Position, Orientation
+from src.domain.workspace.obstacle_map import ObstacleMap
 
 
 class TestRobotInstructionService:
@@ -27,31 +33,27 @@ class TestRobotInstructionService:
             ),
         ],
     )
-    def test_parse_robot_position_orientation_handles_multiple_elements(
+    def test_format_final_states_handles_multiple_elements(
         self, positions_data, orientations_data, expected_output
     ):
         # Arrange
-        position_list = []
-        orientation_list = []
+        final_states = []
 
         for i in range(len(positions_data)):
             position = Mock(spec=Position)
             position.x = positions_data[i][0]
             position.y = positions_data[i][1]
-            position_list.append(position)
 
             orientation = Mock(spec=Orientation)
             orientation.current_orientation = orientations_data[i]
-            orientation_list.append(orientation)
+            final_states.append((position, orientation))
 
         # Act
         service = RobotService(
             robot_repository=Mock(spec=RobotRepository),
             workspace_service=self.workspace_service,
         )
-        result = service._parse_robot_position_orientation(
-            position_list=position_list, orientation_list=orientation_list
-        )
+        result = service._format_final_states(final_states)
 
         # Assert
         assert result == expected_output
@@ -76,12 +78,12 @@ class TestRobotInstructionService:
             ),
         ],
     )
-    @patch.object(RobotService, "_parse_robot_position_orientation")
+    @patch.object(RobotService, "_format_final_states")
     @patch("src.application.services.robot_service.Robot")
     def test_process_instructions_multiple_robots(
         self,
         mock_robot_class,
-        mock_parse_method,
+        mock_format_method,
         expected_positions,
         expected_orientations,
     ):
@@ -91,14 +93,14 @@ class TestRobotInstructionService:
         num_robots = len(expected_positions)
 
         # Create dynamic mock lists based on number of robots
-        instructions_list = [Mock(spec=str) for _ in range(num_robots)]
+        instructions_list = ["LMR" for _ in range(num_robots)]
         positions_list = [Mock(spec=Position) for _ in range(num_robots)]
         orientations_list = [Mock(spec=Orientation) for _ in range(num_robots)]
 
         robot_repository = Mock(spec=RobotRepository)
-        robot_repository.get_robot_instruction_list.return_value = instructions_list
-        robot_repository.get_robot_position_list.return_value = positions_list
-        robot_repository.get_robot_orientation_list.return_value = orientations_list
+        robot_repository.iter_robots.return_value = iter(
+            zip(positions_list, orientations_list, instructions_list)
+        )
 
         # Mock robot behavior
         mock_robot = Mock()
@@ -118,7 +120,7 @@ class TestRobotInstructionService:
 
         mock_robot.get_state.side_effect = final_states
         mock_result = Mock()
-        mock_parse_method.return_value = mock_result
+        mock_format_method.return_value = mock_result
 
         # Act
         service = RobotService(
@@ -139,11 +141,9 @@ class TestRobotInstructionService:
         self.workspace.is_position_valid.return_value = False
 
         robot_repository = Mock(spec=RobotRepository)
-        robot_repository.get_robot_instruction_list.return_value = ["L"]
-        robot_repository.get_robot_position_list.return_value = [Mock(spec=Position)]
-        robot_repository.get_robot_orientation_list.return_value = [
-            Mock(spec=Orientation)
-        ]
+        robot_repository.iter_robots.return_value = iter(
+            [(Mock(spec=Position), Mock(spec=Orientation), "L")]
+        )
 
         # Act & Assert
         with pytest.raises(ValueError):
@@ -153,3 +153,271 @@ class TestRobotInstructionService:
             )
             service.process_instructions()
         mock_robot.execute_instructions.assert_not_called()
+        mock_robot.execute_program.assert_not_called()
+
+    def test_process_instructions_reuses_cached_programs(self):
+        # Arrange
+        workspace_service = Mock(spec=WorkSpaceService)
+        workspace_service.get_workspace.return_value = WorkSpace(5, 5)
+        robot_repository = Mock(spec=RobotRepository)
+        robot_repository.iter_robots.return_value = iter(
+            [
+                (Position(1, 2), Orientation("N"), "MMRMMRMRRM"),
+                (Position(2, 3), Orientation("E"), "MMRMMRMRRM"),
+                (Position(3, 3), Orientation("E"), "MMRMMRMRRM"),
+            ]
+        )
+        program_cache = InstructionProgramCache(min_instruction_length=0)
+
+        # Act
+        service = RobotService(
+            robot_repository=robot_repository,
+            workspace_service=workspace_service,
+            program_cache=program_cache,
+        )
+        result = service.process_instructions()
+
+        # Assert
+        assert result == "3 4 N\n4 1 E\n5 1 E"
+        assert (program_cache.hits, program_cache.misses) == (2, 1)
+
+    def test_process_instructions_steps_short_instructions_without_compiling(self):
+        # Arrange
+        workspace_service = Mock(spec=WorkSpaceService)
+        workspace_service.get_workspace.return_value = WorkSpace(5, 5)
+        robot_repository = Mock(spec=RobotRepository)
+        robot_repository.iter_robots.return_value = iter(
+            [
+                (Position(1, 2), Orientation("N"), "LMLMLMLMM"),
+                (Position(0, 0), Orientation("N"), "MMMMMRMMMMMRMMMMMRMMMMMRMMMMMRMM"),
+            ]
+        )
+        program_cache = InstructionProgramCache()
+
+        # Act
+        service = RobotService(
+            robot_repository=robot_repository,
+            workspace_service=workspace_service,
+            program_cache=program_cache,
+        )
+        result = service.process_instructions()
+
+        # Assert
+        assert result == "1 3 N\n2 5 E"
+        assert (program_cache.hits, program_cache.misses) == (0, 1)
+
+    def test_write_final_states_streams_lines_and_flushes_on_error(self):
+        # Arrange
+        workspace_service = Mock(spec=WorkSpaceService)
+        workspace_service.get_workspace.return_value = WorkSpace(5, 5)
+        robot_repository = Mock(spec=RobotRepository)
+        robot_repository.iter_robots.return_value = iter(
+            [
+                (Position(1, 2), Orientation("N"), "LMLMLMLMM"),
+                (Position(3, 3), Orientation("E"), "MMRMMRMRRM"),
+                (Position(0, 0), Orientation("S"), "M"),
+            ]
+        )
+        output_writer = Mock(spec=OutputWriter)
+        service = RobotService(
+            robot_repository=robot_repository, workspace_service=workspace_service
+        )
+
+        # Act & Assert
+        with pytest.raises(ValueError):
+            service.write_final_states(output_writer=output_writer)
+        assert [c.args for c in output_writer.write_line.call_args_list] == [
+            ("1 3 N",),
+            ("5 1 E",),
+        ]
+        output_writer.flush.assert_called_once()
+
+    def test_iter_final_states_is_lazy(self):
+        # Arrange
+        def iter_robots():
+            yield Position(1, 2), Orientation("N"), "M"
+            raise AssertionError("second robot should not be read yet")
+
+        robot_repository = Mock(spec=RobotRepository)
+        robot_repository.iter_robots.side_effect = iter_robots
+        self.workspace.is_position_valid.return_value = True
+        self.workspace.is_area_valid.return_value = True
+        service = RobotService(
+            robot_repository=robot_repository, workspace_service=self.workspace_service
+        )
+
+        # Act
+        position, orientation = next(service.iter_final_states())
+
+        # Assert
+        assert position == Position(1, 3)
+        assert orientation == Orientation("N")
+
+    @pytest.mark.parametrize(
+        "robots,expected",
+        [
+            pytest.param(
+                [
+                    (Position(1, 2), Orientation("N"), "LMLMLMLMM"),
+                    (Position(1, 0), Orientation("N"), "MMM"),
+                ],
+                "ValueError: Position Position(x=1, y=3) is occupied by another robot",
+                id="moving_into_parked_robot",
+            ),
+            pytest.param(
+                [
+                    (Position(1, 2), Orientation("N"), "M"),
+                    (Position(1, 3), Orientation("E"), "M"),
+                ],
+                "ValueError: Initial position Position(x=1, y=3) "
+                "is occupied by another robot",
+                id="starting_on_parked_robot",
+            ),
+            pytest.param(
+                [
+                    (Position(1, 2), Orientation("N"), "M"),
+                    (Position(1, 0), Orientation("N"), "MRMLMM"),
+                ],
+                "1 3 N\n2 3 N",
+                id="driving_around_parked_robot",
+            ),
+        ],
+    )
+    def test_process_instructions_with_parked_robots(self, robots, expected):
+        # Arrange
+        workspace = WorkSpace(5, 5)
+        workspace_service = Mock(spec=WorkSpaceService)
+        workspace_service.get_workspace.return_value = workspace
+        robot_repository = Mock(spec=RobotRepository)
+        robot_repository.iter_robots.return_value = iter(robots)
+        service = RobotService(
+            robot_repository=robot_repository,
+            workspace_service=workspace_service,
+            park_finished_robots=True,
+        )
+
+        # Act
+        try:
+            result = service.process_instructions()
+        except ValueError as error:
+            result = f"ValueError: {error}"
+
+        # Assert
+        assert result == expected
+        assert not workspace.occupied_cells
+
+    @pytest.mark.parametrize("park_finished_robots", [False, True])
+    def test_process_instructions_fail_soft_reports_failures_in_place(
+        self, park_finished_robots
+    ):
+        # Arrange
+        workspace_service = Mock(spec=WorkSpaceService)
+        workspace_service.get_workspace.return_value = WorkSpace(5, 5)
+        robot_repository = Mock(spec=RobotRepository)
+        robot_repository.iter_robots.return_value = iter(
+            [
+                (Position(1, 2), Orientation("N"), "LMLMLMLMM"),
+                (Position(6, 6), Orientation("N"), "M"),
+                (Position(0, 0), Orientation("N"), "MMRMX"),
+                (Position(3, 3), Orientation("E"), "MMRMMRMRRMMMM"),
+                (Position(3, 3), Orientation("E"), "MMRMMRMRRM"),
+            ]
+        )
+        error_table = RobotErrorTable()
+        service = RobotService(
+            robot_repository=robot_repository,
+            workspace_service=workspace_service,
+            park_finished_robots=park_finished_robots,
+            error_table=error_table,
+        )
+
+        # Act
+        result = service.process_instructions()
+
+        # Assert
+        assert result.splitlines() == [
+            "1 3 N",
+            f"ERROR Initial position {Position(6, 6)} is out of workspace bounds",
+            "ERROR Invalid instruction: X",
+            f"ERROR Position {Position(6, 1)} is out of workspace bounds",
+            "5 1 E",
+        ]
+        assert list(error_table) == [
+            RobotFailure(
+                1, 0, Position(6, 6), Orientation("N"),
+                f"Initial position {Position(6, 6)} is out of workspace bounds",
+            ),
+            RobotFailure(
+                2, 5, Position(1, 2), Orientation("E"), "Invalid instruction: X"
+            ),
+            RobotFailure(
+                3, 11, Position(5, 1), Orientation("E"),
+                f"Position {Position(6, 1)} is out of workspace bounds",
+            ),
+        ]
+
+    def test_write_final_states_fail_soft_writes_error_lines(self):
+        # Arrange
+        workspace_service = Mock(spec=WorkSpaceService)
+        workspace_service.get_workspace.return_value = WorkSpace(2, 2)
+        robot_repository = Mock(spec=RobotRepository)
+        robot_repository.iter_robots.return_value = iter(
+            [
+                (Position(0, 0), Orientation("N"), "MMM"),
+                (Position(0, 0), Orientation("E"), "MM"),
+            ]
+        )
+        output_writer = Mock(spec=OutputWriter)
+        service = RobotService(
+            robot_repository=robot_repository,
+            workspace_service=workspace_service,
+            error_table=RobotErrorTable(),
+        )
+
+        # Act
+        robot_count = service.write_final_states(output_writer)
+
+        # Assert
+        assert robot_count == 2
+        assert [c.args[0] for c in output_writer.write_line.call_args_list] == [
+            f"ERROR Position {Position(0, 3)} is out of workspace bounds",
+            "2 0 E",
+        ]
+        assert service.error_table.failed_indexes() == [0]
+
+
+class TestLocateFailure:
+
+    @pytest.mark.parametrize(
+        "instructions,obstacles,expected_step,expected_pose",
+        [
+            pytest.param(
+                "LRMMRMMMMMMM", [], 9, (Position(5, 4), "E"), id="leaves_workspace"
+            ),
+            pytest.param(
+                PackedInstructions.pack("LRMMRMMMMMMM"), [], 9, (Position(5, 4), "E"),
+                id="packed_instructions_leave_workspace",
+            ),
+            pytest.param(
+                "MMRMMMMMMM", [(4, 4, 4, 4)], 5, (Position(3, 4), "E"),
+                id="obstacle_before_the_edge",
+            ),
+        ],
+    )
+    def test_locate_failure_finds_failing_step_and_pose(
+        self, instructions, obstacles, expected_step, expected_pose
+    ):
+        # Arrange
+        workspace = WorkSpace(5, 5, obstacles=ObstacleMap(obstacles))
+
+        # Act
+        failure = locate_failure(
+            7, Position(2, 2), Orientation("N"), instructions, workspace, "reason",
+            InstructionProgramCache(),
+        )
+
+        # Assert
+        expected_position, expected_heading = expected_pose
+        assert failure == RobotFailure(
+            7, expected_step, expected_position, Orientation(expected_heading), "reason"
+        )
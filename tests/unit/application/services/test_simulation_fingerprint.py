@@ -0,0 +1,93 @@
+import pytest
+
+from src.application.services.simulation_fingerprint import (
+    extend_fingerprint,
+    fingerprint_robot,
+    fingerprint_workspace,
+)
+from src.domain.robot.packed_instructions import PackedInstructions
+from src.domain.robot.value_objects import Position, Orientation
+from src.domain.workspace.entity import WorkSpace
+from src.domain.workspace.obstacle_map import ObstacleMap
+
+
+class TestSimulationFingerprint:
+
+    def setup_method(self):
+        self.workspace_fingerprint = fingerprint_workspace(WorkSpace(5, 5))
+        self.fingerprint = fingerprint_robot(
+            self.workspace_fingerprint, Position(1, 2), Orientation("N"), "LMLMLMLMM"
+        )
+
+    def test_fingerprint_is_stable(self):
+        # Act
+        fingerprint = fingerprint_robot(
+            fingerprint_workspace(WorkSpace(5, 5)),
+            Position(1, 2),
+            Orientation("N"),
+            "LMLMLMLMM",
+        )
+
+        # Assert
+        assert fingerprint == self.fingerprint
+        assert len(fingerprint) == 16
+
+    def test_packed_instructions_share_the_string_fingerprint(self):
+        # Act
+        fingerprint = fingerprint_robot(
+            self.workspace_fingerprint,
+            Position(1, 2),
+            Orientation("N"),
+            PackedInstructions.pack("LMLMLMLMM"),
+        )
+
+        # Assert
+        assert fingerprint == self.fingerprint
+
+    @pytest.mark.parametrize(
+        "workspace,position,orientation,instructions",
+        [
+            pytest.param(WorkSpace(5, 6), Position(1, 2), "N", "LMLMLMLMM", id="grid_size"),
+            pytest.param(
+                WorkSpace(5, 5, obstacles=ObstacleMap([(4, 4, 4, 4)])),
+                Position(1, 2),
+                "N",
+                "LMLMLMLMM",
+                id="obstacles",
+            ),
+            pytest.param(WorkSpace(5, 5), Position(2, 1), "N", "LMLMLMLMM", id="position"),
+            pytest.param(WorkSpace(5, 5), Position(1, 2), "E", "LMLMLMLMM", id="orientation"),
+            pytest.param(WorkSpace(5, 5), Position(1, 2), "N", "LMLMLMLM", id="instructions"),
+        ],
+    )
+    def test_fingerprint_changes_with_any_input(
+        self, workspace, position, orientation, instructions
+    ):
+        # Act
+        fingerprint = fingerprint_robot(
+            fingerprint_workspace(workspace),
+            position,
+            Orientation(orientation),
+            instructions,
+        )
+
+        # Assert
+        assert fingerprint != self.fingerprint
+
+    def test_extended_fingerprint_depends_on_robot_order(self):
+        # Arrange
+        other = fingerprint_robot(
+            self.workspace_fingerprint, Position(3, 3), Orientation("E"), "MMRMMRMRRM"
+        )
+
+        # Act
+        in_order = extend_fingerprint(
+            extend_fingerprint(self.workspace_fingerprint, self.fingerprint), other
+        )
+        swapped = extend_fingerprint(
+            extend_fingerprint(self.workspace_fingerprint, other), self.fingerprint
+        )
+
+        # Assert
+        assert in_order != swapped
+        assert len(in_order) == 16
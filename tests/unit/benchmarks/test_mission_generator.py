@@ -0,0 +1,64 @@
+import pytest
+
+from benchmarks.mission_generator import MissionParameters, generate_mission
+from benchmarks.run_benchmarks import run_scenario
+from src.application.services.robot_service import RobotService
+from src.application.services.work_space import WorkSpaceService
+from src.infrastructure.text_mission_document import TextMissionDocument
+from src.infrastructure.text_robot_repository import TextRobotRepository
+from src.infrastructure.text_work_space_repository import TextWorkSpaceRepository
+
+
+class TestMissionGenerator:
+
+    @pytest.mark.parametrize(
+        "parameters",
+        [
+            pytest.param(
+                MissionParameters(
+                    robot_count=50, instruction_length=40, grid_size=3, turn_ratio=0.1
+                ),
+                id="small_grid_move_heavy",
+            ),
+            pytest.param(
+                MissionParameters(
+                    robot_count=5, instruction_length=200, grid_size=50,
+                    turn_ratio=0.9, seed=3,
+                ),
+                id="turn_heavy",
+            ),
+        ],
+    )
+    def test_generate_mission_is_deterministic_and_stays_in_bounds(self, parameters):
+        # Act
+        input_text = generate_mission(parameters)
+        document = TextMissionDocument(input_text=input_text)
+        robot_service = RobotService(
+            robot_repository=TextRobotRepository(document=document),
+            workspace_service=WorkSpaceService(
+                workspace_repository=TextWorkSpaceRepository(document=document)
+            ),
+        )
+
+        # Assert
+        assert input_text == generate_mission(parameters)
+        assert len(input_text.split("\n")) == 1 + 2 * parameters.robot_count
+        assert len(robot_service.process_instructions().split("\n")) == (
+            parameters.robot_count
+        )
+
+    def test_run_scenario_reports_every_stage(self):
+        # Arrange
+        parameters = MissionParameters(
+            robot_count=3, instruction_length=10, grid_size=5, turn_ratio=0.3
+        )
+
+        # Act
+        result = run_scenario(parameters, repeat=1)
+
+        # Assert
+        assert set(result["stages"]) == {
+            "read", "parse", "simulate_instructions", "simulate_program",
+            "format", "pipeline",
+        }
+        assert all(stage["repeat"] == 1 for stage in result["stages"].values())
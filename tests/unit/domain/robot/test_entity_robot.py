@@ -3,7 +3,14 @@ import pytest
 from unittest.mock import Mock
 
 from src.domain.robot.entity import Robot
+from src.domain.robot.instruction_program import (
+    InstructionEffect,
+    InstructionProgram,
+)
+from src.domain.robot.packed_instructions import PackedInstructions
+from src.domain.robot.trajectory import Trajectory
 from src.domain.robot.value_objects import Position, Orientation
+from src.domain.workspace.obstacle_map import ObstacleMap
 
 
 class TestRobot:
@@ -60,6 +67,8 @@ class TestRobot:
         next_position = Mock(spec=Position)
         self.initial_position.move.return_value = next_position
         self.workspace.is_position_valid.return_value = False
+        self.workspace.is_blocked.return_value = False
+        self.workspace.is_occupied.return_value = False
 
         # Act & Assert
         with pytest.raises(ValueError) as exc_info:
@@ -70,6 +79,39 @@ class TestRobot:
             == f"Position {next_position} is out of workspace bounds"
         )
 
+    def test_move_forward_into_occupied_cell_raises_value_error(self):
+        # Arrange
+        next_position = Mock(spec=Position)
+        self.initial_position.move.return_value = next_position
+        self.workspace.is_position_valid.return_value = False
+        self.workspace.is_blocked.return_value = False
+        self.workspace.is_occupied.return_value = True
+
+        # Act & Assert
+        with pytest.raises(ValueError) as exc_info:
+            self.robot._move_forward(self.workspace)
+
+        assert (
+            str(exc_info.value)
+            == f"Position {next_position} is occupied by another robot"
+        )
+
+    def test_move_forward_into_obstacle_raises_value_error(self):
+        # Arrange
+        next_position = Mock(spec=Position)
+        self.initial_position.move.return_value = next_position
+        self.workspace.is_position_valid.return_value = False
+        self.workspace.is_blocked.return_value = True
+
+        # Act & Assert
+        with pytest.raises(ValueError) as exc_info:
+            self.robot._move_forward(self.workspace)
+
+        assert (
+            str(exc_info.value)
+            == f"Position {next_position} is blocked by an obstacle"
+        )
+
     @pytest.mark.parametrize(
         "command,expected_method",
         [
@@ -155,6 +197,175 @@ class TestRobot:
         self.robot._turn_right.assert_not_called()
         self.robot._move_forward.assert_not_called()
 
+    def test_execute_instructions_iterates_packed_instructions(self):
+        # Arrange
+        calls = []
+        for method in ("_turn_left", "_turn_right", "_move_forward"):
+            setattr(
+                self.robot,
+                method,
+                Mock(side_effect=lambda *args, method=method: calls.append(method)),
+            )
+
+        # Act
+        self.robot.execute_instructions(
+            PackedInstructions.pack("MRLM"), self.workspace
+        )
+
+        # Assert
+        assert calls == ["_move_forward", "_turn_right", "_turn_left", "_move_forward"]
+
+    @pytest.mark.parametrize(
+        "instructions",
+        [
+            pytest.param("MRMLM", id="string"),
+            pytest.param(PackedInstructions.pack("MRMLM"), id="packed"),
+        ],
+    )
+    def test_execute_instructions_records_pose_after_every_command(
+        self, instructions
+    ):
+        # Arrange
+        robot = Robot(Position(0, 0), Orientation("N"))
+        trajectory = Trajectory()
+
+        # Act
+        robot.execute_instructions(instructions, WorkSpace(5, 5), trajectory=trajectory)
+
+        # Assert
+        assert list(trajectory) == [
+            (Position(0, 1), Orientation("N")),
+            (Position(0, 1), Orientation("E")),
+            (Position(1, 1), Orientation("E")),
+            (Position(1, 1), Orientation("N")),
+            (Position(1, 2), Orientation("N")),
+        ]
+
+    def test_execute_instructions_keeps_recorded_path_up_to_failure(self):
+        # Arrange
+        robot = Robot(Position(0, 0), Orientation("N"))
+        trajectory = Trajectory()
+
+        # Act & Assert
+        with pytest.raises(ValueError, match="out of workspace bounds"):
+            robot.execute_instructions("MMM", WorkSpace(1, 1), trajectory=trajectory)
+        assert list(trajectory) == [(Position(0, 1), Orientation("N"))]
+
+    def test_move_forward_steps_checks_segment_once(self):
+        # Arrange
+        first_position = Mock(spec=Position)
+        last_position = Mock(spec=Position)
+        self.initial_position.move.side_effect = [first_position, last_position]
+        self.workspace.is_segment_valid.return_value = True
+        self.robot._move_forward = Mock()
+
+        # Act
+        self.robot._move_forward_steps(5, self.workspace)
+
+        # Assert
+        self.workspace.is_segment_valid.assert_called_once_with(
+            first_position, last_position
+        )
+        self.robot._move_forward.assert_not_called()
+        assert self.robot.position == last_position
+
+    def test_move_forward_steps_replays_invalid_segment_step_by_step(self):
+        # Arrange
+        self.initial_position.move.return_value = Mock(spec=Position)
+        self.workspace.is_segment_valid.return_value = False
+        self.robot._move_forward = Mock(side_effect=[None, ValueError("out")])
+
+        # Act & Assert
+        with pytest.raises(ValueError):
+            self.robot._move_forward_steps(5, self.workspace)
+        assert self.robot._move_forward.call_count == 2
+
+    def test_execute_program_runs_segments_in_order(self):
+        # Arrange
+        rotated_orientation = Mock(spec=Orientation)
+        self.initial_orientation.rotate.return_value = rotated_orientation
+        self.robot._move_forward_steps = Mock()
+        program = InstructionProgram(segments=((0, 3), (1, 0), (3, 2)))
+
+        # Act
+        self.robot.execute_program(program, self.workspace)
+
+        # Assert
+        assert [c.args for c in self.robot._move_forward_steps.call_args_list] == [
+            (3, self.workspace),
+            (2, self.workspace),
+        ]
+        self.initial_orientation.rotate.assert_called_once_with(1)
+        rotated_orientation.rotate.assert_called_once_with(3)
+
+    def test_execute_program_raises_invalid_instruction_after_segments(self):
+        # Arrange
+        self.robot._move_forward_steps = Mock()
+        program = InstructionProgram(segments=((0, 1),), invalid_instruction="X")
+
+        # Act & Assert
+        with pytest.raises(ValueError) as exc_info:
+            self.robot.execute_program(program, self.workspace)
+        self.robot._move_forward_steps.assert_called_once()
+        assert str(exc_info.value) == "Invalid instruction: X"
+
+    def test_execute_program_jumps_to_final_pose_when_path_is_inside_workspace(self):
+        # Arrange
+        robot = Robot(Position(1, 2), Orientation("N"))
+        program = InstructionProgram.compile("LMLMLMLMM")
+        robot._move_forward_steps = Mock()
+
+        # Act
+        robot.execute_program(program, WorkSpace(5, 5), InstructionEffect.of(program))
+
+        # Assert
+        robot._move_forward_steps.assert_not_called()
+        assert robot.get_state() == (Position(1, 3), Orientation("N"))
+
+    def test_execute_program_falls_back_to_segments_when_path_leaves_workspace(self):
+        # Arrange
+        robot = Robot(Position(0, 0), Orientation("N"))
+        program = InstructionProgram.compile("MMM")
+
+        # Act & Assert
+        with pytest.raises(ValueError) as exc_info:
+            robot.execute_program(program, WorkSpace(2, 2), InstructionEffect.of(program))
+        assert str(exc_info.value) == (
+            f"Position {Position(0, 3)} is out of workspace bounds"
+        )
+        assert robot.get_state() == (Position(0, 2), Orientation("N"))
+
+    def test_execute_program_rejects_path_leaving_workspace_without_stepping(self):
+        # Arrange
+        robot = Robot(Position(0, 0), Orientation("E"))
+        program = InstructionProgram.compile("MMLMMR" * 1000)
+        robot._move_forward_steps = Mock()
+
+        # Act & Assert
+        with pytest.raises(ValueError) as exc_info:
+            robot.execute_program(
+                program, WorkSpace(10, 10), InstructionEffect.of(program)
+            )
+        robot._move_forward_steps.assert_not_called()
+        assert str(exc_info.value) == (
+            f"Position {Position(11, 10)} is out of workspace bounds"
+        )
+        assert robot.get_state() == (Position(10, 10), Orientation("E"))
+
+    def test_execute_program_replays_when_obstacle_may_stop_robot_first(self):
+        # Arrange
+        robot = Robot(Position(0, 0), Orientation("N"))
+        program = InstructionProgram.compile("MMMM")
+        workspace = WorkSpace(2, 2, ObstacleMap([(0, 2, 0, 2)]))
+
+        # Act & Assert
+        with pytest.raises(ValueError) as exc_info:
+            robot.execute_program(program, workspace, InstructionEffect.of(program))
+        assert str(exc_info.value) == (
+            f"Position {Position(0, 2)} is blocked by an obstacle"
+        )
+        assert robot.get_state() == (Position(0, 1), Orientation("N"))
+
     def test_get_state_returns_current_position_and_orientation(self):
         # Act
         position, orientation = self.robot.get_state()
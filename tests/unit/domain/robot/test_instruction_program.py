@@ -0,0 +1,174 @@
+import random
+
+import pytest
+from src.domain.robot.entity import Robot
+from src.domain.robot.instruction_program import (
+    InstructionEffect,
+    InstructionProgram,
+    PathEnvelope,
+)
+from src.domain.robot.packed_instructions import PackedInstructions
+from src.domain.robot.value_objects import Position, Orientation
+from src.domain.workspace.entity import WorkSpace
+
+
+class TestInstructionProgram:
+
+    @pytest.mark.parametrize(
+        "instructions,expected_segments,expected_invalid",
+        [
+            pytest.param("", (), None, id="empty_instructions"),
+            pytest.param("MMMM", ((0, 4),), None, id="single_straight_run"),
+            pytest.param("RRR", ((3, 0),), None, id="turns_only"),
+            pytest.param("LMM", ((3, 2),), None, id="left_turn_is_three_right_turns"),
+            pytest.param("LRM", ((0, 1),), None, id="opposite_turns_cancel"),
+            pytest.param("LRLR", (), None, id="turns_without_net_rotation_are_dropped"),
+            pytest.param(
+                "MMRMMRMRRM",
+                ((0, 2), (1, 2), (1, 1), (2, 1)),
+                None,
+                id="sample_mission_instructions",
+            ),
+            pytest.param("MMXLM", ((0, 2),), "X", id="stops_at_invalid_instruction"),
+            pytest.param(" ", (), " ", id="whitespace_is_invalid"),
+        ],
+    )
+    def test_compile_folds_runs_into_segments(
+        self, instructions, expected_segments, expected_invalid
+    ):
+        # Act
+        program = InstructionProgram.compile(instructions)
+
+        # Assert
+        assert program.segments == expected_segments
+        assert program.invalid_instruction == expected_invalid
+
+    def test_compile_long_instructions_yields_one_segment_per_run(self):
+        # Act
+        program = InstructionProgram.compile("M" * 10**6 + "R" + "M" * 10**6)
+
+        # Assert
+        assert program.segments == ((0, 10**6), (1, 10**6))
+
+    @pytest.mark.parametrize("seed", range(40))
+    def test_program_matches_step_by_step_execution(self, seed):
+        # Arrange
+        rng = random.Random(seed)
+        workspace = WorkSpace(max_x=rng.randint(1, 8), max_y=rng.randint(1, 8))
+        start = Position(rng.randint(0, workspace.max_x), rng.randint(0, workspace.max_y))
+        orientation = Orientation(rng.choice("NESW"))
+        instructions = "".join(rng.choice("LRMMMM") for _ in range(rng.randint(0, 40)))
+        if seed % 5 == 0:
+            instructions += "X"
+        for _ in range(seed % 4):
+            workspace.occupy(
+                Position(rng.randint(0, workspace.max_x), rng.randint(0, workspace.max_y))
+            )
+
+        def run(execute):
+            robot = Robot(position=start, orientation=orientation)
+            try:
+                execute(robot)
+            except ValueError as error:
+                return str(error), robot.get_state()
+            return None, robot.get_state()
+
+        program = InstructionProgram.compile(instructions)
+
+        # Act
+        expected = run(lambda robot: robot.execute_instructions(instructions, workspace))
+        result = run(lambda robot: robot.execute_program(program, workspace))
+        result_with_effect = run(
+            lambda robot: robot.execute_program(
+                program, workspace, effect=InstructionEffect.of(program)
+            )
+        )
+
+        # Assert
+        assert result == expected
+        assert result_with_effect == expected
+        if program.invalid_instruction is None:
+            packed = PackedInstructions.pack(instructions)
+            assert InstructionProgram.compile(packed) == program
+            assert run(lambda robot: robot.execute_instructions(packed, workspace)) == expected
+
+
+class TestInstructionEffect:
+
+    @pytest.mark.parametrize(
+        "orientation,expected_displacement,expected_bounding_box",
+        [
+            pytest.param("N", (2, 0), (0, 2, 0, 2), id="starting_north"),
+            pytest.param("E", (0, -2), (0, 2, -2, 0), id="starting_east"),
+            pytest.param("S", (-2, 0), (-2, 0, -2, 0), id="starting_south"),
+            pytest.param("W", (0, 2), (-2, 0, 0, 2), id="starting_west"),
+        ],
+    )
+    def test_of_describes_path_for_each_starting_heading(
+        self, orientation, expected_displacement, expected_bounding_box
+    ):
+        # Arrange
+        program = InstructionProgram.compile("MMRMMRMM")
+
+        # Act
+        effect = InstructionEffect.of(program)
+
+        # Assert
+        assert effect.quarter_turns == 2
+        assert effect.displacement(Orientation(orientation)) == expected_displacement
+        assert effect.bounding_box(Orientation(orientation)) == expected_bounding_box
+
+    def test_envelope_is_built_on_first_use(self):
+        # Arrange
+        program = InstructionProgram.compile("MMRMM")
+        effect = InstructionEffect.of(program)
+
+        # Act
+        envelope = effect.envelope
+
+        # Assert
+        assert envelope == PathEnvelope.of(program)
+        assert effect.envelope is envelope
+
+
+class TestPathEnvelope:
+
+    @pytest.mark.parametrize(
+        "position,orientation,expected",
+        [
+            pytest.param(
+                Position(1, 1), "N",
+                (Position(3, 3), "E", Position(4, 3), Position(1, 1), Position(3, 3), 4),
+                id="leaves_on_second_run",
+            ),
+            pytest.param(
+                Position(0, 3), "E",
+                (Position(0, 0), "W", Position(-1, 0), Position(0, 0), Position(2, 3), 7),
+                id="leaves_on_last_run",
+            ),
+            pytest.param(
+                Position(0, 2), "W",
+                (Position(0, 2), "W", Position(-1, 2), Position(0, 2), Position(0, 2), 0),
+                id="leaves_on_first_step",
+            ),
+            pytest.param(Position(0, 1), "N", None, id="stays_inside"),
+        ],
+    )
+    def test_first_exit_finds_first_step_outside_box(self, position, orientation, expected):
+        # Arrange
+        # North: up 2, right 3, down 3 from the start
+        envelope = PathEnvelope.of(InstructionProgram.compile("MMRMMMRMMM"))
+
+        # Act
+        path_exit = envelope.first_exit(
+            position, Orientation(orientation), Position(0, 0), Position(3, 3)
+        )
+
+        # Assert
+        if expected is None:
+            assert path_exit is None
+        else:
+            last, heading, next_position, lower_left, upper_right, moves = expected
+            assert path_exit == (
+                last, Orientation(heading), next_position, lower_left, upper_right, moves
+            )
@@ -0,0 +1,114 @@
+import pickle
+
+import pytest
+
+from src.domain.robot.packed_instructions import (
+    MOVE,
+    TURN_LEFT,
+    TURN_RIGHT,
+    PackedInstructions,
+)
+
+
+class TestPackedInstructions:
+
+    @pytest.mark.parametrize(
+        "instructions",
+        [
+            pytest.param("", id="empty"),
+            pytest.param("M", id="single_command"),
+            pytest.param("LRMM", id="one_full_byte"),
+            pytest.param("MMRMMRMRRM", id="partial_last_byte"),
+            pytest.param("LMRMM" * 1000, id="unpacked_as_one_integer"),
+            pytest.param("MRL" * 100_000, id="iterated_in_blocks"),
+        ],
+    )
+    def test_pack_round_trip(self, instructions):
+        # Act
+        packed = PackedInstructions.pack(instructions)
+
+        # Assert
+        assert len(packed) == len(instructions)
+        assert len(packed.data) == (len(instructions) + 3) // 4
+        assert str(packed) == instructions
+        assert list(packed) == ["LRM".index(command) for command in instructions]
+
+    def test_iteration_yields_command_codes(self):
+        # Act
+        codes = list(PackedInstructions.pack("LRM"))
+
+        # Assert
+        assert codes == [TURN_LEFT, TURN_RIGHT, MOVE]
+
+    def test_pack_rejects_invalid_instruction(self):
+        # Act & Assert
+        with pytest.raises(ValueError, match="Invalid instruction: X"):
+            PackedInstructions.pack("MMXM")
+
+    def test_constructor_rejects_data_of_wrong_length(self):
+        # Act & Assert
+        with pytest.raises(ValueError, match="need 1 bytes, got 2"):
+            PackedInstructions(b"\x00\x00", 3)
+
+    @pytest.mark.parametrize(
+        "data,length,message",
+        [
+            pytest.param(b"\x00\x30", 8, "code 3 at command 6", id="code_3"),
+            pytest.param(b"\x00\x30", 6, "have padding bits set", id="padding"),
+        ],
+    )
+    def test_constructor_rejects_corrupt_bytes(self, data, length, message):
+        # Act & Assert
+        with pytest.raises(ValueError, match=message):
+            PackedInstructions(data, length)
+
+    @pytest.mark.parametrize(
+        "command,expected",
+        [
+            pytest.param("M", 6, id="moves"),
+            pytest.param("L", 0, id="left_turns"),
+            pytest.param("R", 4, id="right_turns"),
+            pytest.param("X", 0, id="unknown_command"),
+        ],
+    )
+    def test_count(self, command, expected):
+        # Act & Assert
+        assert PackedInstructions.pack("MMRMMRMRRM").count(command) == expected
+
+    def test_equality_hash_and_pickle(self):
+        # Arrange
+        packed = PackedInstructions.pack("LMLMLMLMM")
+
+        # Act
+        restored = pickle.loads(pickle.dumps(packed))
+
+        # Assert
+        assert restored == packed
+        assert hash(restored) == hash(packed)
+        assert packed != PackedInstructions.pack("LMLMLMLM")
+        assert repr(packed) == "PackedInstructions.pack('LMLMLMLMM')"
+
+    @pytest.mark.parametrize(
+        "start,stop",
+        [
+            pytest.param(0, 8, id="byte_aligned"),
+            pytest.param(4, 10, id="aligned_start_partial_end"),
+            pytest.param(3, 11, id="unaligned_start"),
+            pytest.param(-5, None, id="negative_start"),
+            pytest.param(9, 2, id="empty"),
+        ],
+    )
+    def test_slicing_matches_string_slicing(self, start, stop):
+        # Arrange
+        instructions = "MMRMMRMRRMLM"
+
+        # Act
+        sliced = PackedInstructions.pack(instructions)[start:stop]
+
+        # Assert
+        assert sliced == PackedInstructions.pack(instructions[start:stop])
+
+    def test_indexing_is_not_supported(self):
+        # Act & Assert
+        with pytest.raises(TypeError):
+            PackedInstructions.pack("LRM")[0]
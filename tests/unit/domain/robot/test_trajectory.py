@@ -0,0 +1,59 @@
+from src.domain.robot.trajectory import StepCounter, Trajectory
+from src.domain.robot.value_objects import Orientation, Position
+
+
+class TestTrajectory:
+
+    def test_append_stores_poses_in_typed_columns(self):
+        # Arrange
+        trajectory = Trajectory()
+
+        # Act
+        trajectory.append(Position(1, 2), Orientation("N"))
+        trajectory.append(Position(1, 3), Orientation("W"))
+
+        # Assert
+        assert len(trajectory) == 2
+        assert list(trajectory.xs) == [1, 1]
+        assert list(trajectory.ys) == [2, 3]
+        assert list(trajectory.headings) == [0, 3]
+
+    def test_iteration_yields_positions_and_orientations(self):
+        # Arrange
+        trajectory = Trajectory()
+        trajectory.append(Position(0, 0), Orientation("E"))
+        trajectory.append(Position(1, 0), Orientation("S"))
+
+        # Act
+        poses = list(trajectory)
+
+        # Assert
+        assert poses == [
+            (Position(0, 0), Orientation("E")),
+            (Position(1, 0), Orientation("S")),
+        ]
+
+    def test_pose_costs_nine_bytes(self):
+        # Arrange
+        trajectory = Trajectory()
+
+        # Assert
+        assert (
+            trajectory.xs.itemsize + trajectory.ys.itemsize + trajectory.headings.itemsize
+            == 9
+        )
+
+
+class TestStepCounter:
+
+    def test_append_counts_poses_without_storing_them(self):
+        # Arrange
+        steps = StepCounter()
+
+        # Act
+        for _ in range(3):
+            steps.append(Position(0, 0), Orientation("N"))
+
+        # Assert
+        assert len(steps) == 3
+        assert not hasattr(steps, "xs")
@@ -1,3 +1,5 @@
+import pickle
+
 import pytest
 from src.domain.robot.value_objects import Position, Orientation
 
@@ -86,6 +88,23 @@ class TestOrientation:
         # Verify immutability - original should not change
         assert orientation.current_orientation == current
 
+    @pytest.mark.parametrize(
+        "current,quarter_turns,expected",
+        [
+            pytest.param("N", 0, "N", id="no_rotation_keeps_north"),
+            pytest.param("N", 1, "E", id="one_quarter_turn_from_north_faces_east"),
+            pytest.param("E", 2, "W", id="half_turn_from_east_faces_west"),
+            pytest.param("S", 3, "E", id="three_quarter_turns_from_south_face_east"),
+            pytest.param("W", 5, "N", id="rotation_wraps_around"),
+        ],
+    )
+    def test_rotate(self, current, quarter_turns, expected):
+        # Act
+        result = Orientation(current).rotate(quarter_turns)
+
+        # Assert
+        assert result == Orientation(expected)
+
     def test_orientation_is_frozen(self):
         # Arrange
         orientation = Orientation("N")
@@ -104,6 +123,26 @@ class TestOrientation:
         assert orientation1 == orientation2
         assert orientation1 != orientation3
 
+    @pytest.mark.parametrize(
+        "orientation,expected_heading",
+        [
+            pytest.param("N", 0, id="north_is_heading_0"),
+            pytest.param("E", 1, id="east_is_heading_1"),
+            pytest.param("S", 2, id="south_is_heading_2"),
+            pytest.param("W", 3, id="west_is_heading_3"),
+        ],
+    )
+    def test_orientation_is_interned_per_heading(self, orientation, expected_heading):
+        # Act
+        result = Orientation(orientation)
+
+        # Assert
+        assert result is Orientation(orientation)
+        assert result.heading == expected_heading
+        assert result.turn_left().turn_right() is result
+        assert pickle.loads(pickle.dumps(result)) is result
+        assert not hasattr(result, "__dict__")
+
 class TestPosition:
 
     @pytest.mark.parametrize(
@@ -150,6 +189,22 @@ class TestPosition:
         assert position.x == x
         assert position.y == y
 
+    @pytest.mark.parametrize(
+        "orientation,steps,expected_x,expected_y",
+        [
+            pytest.param("N", 3, 1, 4, id="move_three_steps_north"),
+            pytest.param("E", 4, 5, 1, id="move_four_steps_east"),
+            pytest.param("S", 1, 1, 0, id="move_one_step_south"),
+            pytest.param("W", 2, -1, 1, id="move_two_steps_west"),
+        ],
+    )
+    def test_move_several_steps(self, orientation, steps, expected_x, expected_y):
+        # Act
+        new_position = Position(1, 1).move(Orientation(orientation), steps)
+
+        # Assert
+        assert new_position == Position(expected_x, expected_y)
+
     def test_position_is_frozen(self):
         # Arrange
         position = Position(1, 1)
@@ -158,6 +213,15 @@ class TestPosition:
         with pytest.raises(AttributeError):
             position.x = 5
 
+    def test_position_slots_cannot_be_assigned(self):
+        # Arrange
+        position = Position(1, 1)
+
+        # Act & Assert
+        with pytest.raises(AttributeError, match="cannot assign to field '_x'"):
+            position._x = 5
+        assert position == Position(1, 1)
+
     def test_position_equality(self):
         # Arrange & Act
         position1 = Position(1, 1)
@@ -167,3 +231,17 @@ class TestPosition:
         # Assert
         assert position1 == position2
         assert position1 != position3
+
+    def test_position_is_compact_and_hashable(self):
+        # Arrange
+        position = Position(1, 2)
+
+        # Act
+        restored = pickle.loads(pickle.dumps(position))
+
+        # Assert
+        assert not hasattr(position, "__dict__")
+        assert restored == position
+        assert hash(restored) == hash(position)
+        assert repr(position) == "Position(x=1, y=2)"
+        assert position != (1, 2)
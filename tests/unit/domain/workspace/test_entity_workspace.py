@@ -2,6 +2,7 @@ import pytest
 from unittest.mock import Mock
 
 from src.domain.workspace.entity import WorkSpace
+from src.domain.workspace.obstacle_map import ObstacleMap
 from src.domain.robot.value_objects import Position
 
 
@@ -92,4 +93,165 @@ class TestWorkspace:
         result = workspace.is_position_valid(position)
 
         # Assert
-        assert result == expected
\ No newline at end of file
+        assert result == expected
+
+    @pytest.mark.parametrize(
+        "first,last,expected",
+        [
+            pytest.param((1, 0), (5, 0), True, id="segment_inside_workspace"),
+            pytest.param((1, 0), (6, 0), False, id="segment_leaving_workspace"),
+            pytest.param((-1, 0), (3, 0), False, id="segment_entering_workspace"),
+        ],
+    )
+    def test_is_segment_valid(self, first, last, expected):
+        # Arrange
+        workspace = WorkSpace(5, 5)
+
+        # Act
+        result = workspace.is_segment_valid(Position(*first), Position(*last))
+
+        # Assert
+        assert result == expected
+
+    @pytest.mark.parametrize(
+        "lower_left,upper_right,expected",
+        [
+            pytest.param((0, 0), (5, 5), True, id="whole_workspace"),
+            pytest.param((1, 2), (3, 4), True, id="area_inside_workspace"),
+            pytest.param((-1, 2), (3, 4), False, id="area_crossing_left_edge"),
+            pytest.param((1, 2), (3, 6), False, id="area_crossing_top_edge"),
+        ],
+    )
+    def test_is_area_valid(self, lower_left, upper_right, expected):
+        # Arrange
+        workspace = WorkSpace(5, 5)
+
+        # Act
+        result = workspace.is_area_valid(Position(*lower_left), Position(*upper_right))
+
+        # Assert
+        assert result == expected
+
+    def test_occupy_marks_cell_as_invalid(self):
+        # Arrange
+        workspace = WorkSpace(5, 5)
+
+        # Act
+        workspace.occupy(Position(2, 3))
+        workspace.occupy(Position(2, 3))
+
+        # Assert
+        assert workspace.is_occupied(Position(2, 3))
+        assert not workspace.is_position_valid(Position(2, 3))
+        assert workspace.is_position_valid(Position(3, 2))
+        assert workspace.occupied_cells == {(2, 3): True}
+
+    @pytest.mark.parametrize(
+        "first,last,expected",
+        [
+            pytest.param((0, 3), (5, 3), False, id="row_segment_crossing_parked_robot"),
+            pytest.param((5, 3), (3, 3), True, id="row_segment_stopping_before_robot"),
+            pytest.param((2, 0), (2, 5), False, id="column_segment_crossing_robot"),
+            pytest.param((2, 4), (2, 5), True, id="column_segment_after_robot"),
+            pytest.param((1, 0), (1, 5), True, id="neighbouring_column"),
+        ],
+    )
+    def test_is_segment_valid_with_occupied_cells(self, first, last, expected):
+        # Arrange
+        workspace = WorkSpace(5, 5)
+        workspace.occupy(Position(2, 3))
+
+        # Act
+        result = workspace.is_segment_valid(Position(*first), Position(*last))
+
+        # Assert
+        assert result == expected
+
+    @pytest.mark.parametrize(
+        "lower_left,upper_right,expected",
+        [
+            pytest.param((0, 0), (5, 5), False, id="area_containing_parked_robot"),
+            pytest.param((3, 0), (5, 5), True, id="area_right_of_parked_robot"),
+            pytest.param((0, 4), (5, 5), True, id="area_above_parked_robot"),
+            pytest.param((2, 3), (2, 3), False, id="single_parked_cell"),
+        ],
+    )
+    def test_is_area_valid_with_occupied_cells(self, lower_left, upper_right, expected):
+        # Arrange
+        workspace = WorkSpace(5, 5)
+        workspace.occupy(Position(2, 3))
+
+        # Act
+        result = workspace.is_area_valid(Position(*lower_left), Position(*upper_right))
+
+        # Assert
+        assert result == expected
+
+    def test_release_frees_cell_and_indexes(self):
+        # Arrange
+        workspace = WorkSpace(5, 5)
+        workspace.occupy(Position(2, 3), occupant="robot-1")
+        workspace.occupy(Position(4, 3), occupant="robot-2")
+
+        # Act
+        occupant = workspace.occupant_at(Position(2, 3))
+        workspace.release(Position(2, 3))
+        workspace.release(Position(2, 3))
+
+        # Assert
+        assert occupant == "robot-1"
+        assert workspace.occupant_at(Position(2, 3)) is None
+        assert workspace.is_segment_valid(Position(0, 3), Position(3, 3))
+        assert not workspace.is_segment_valid(Position(0, 3), Position(5, 3))
+
+    def test_empty_copy_keeps_layout_without_occupied_cells(self):
+        # Arrange
+        workspace = WorkSpace(4, 6)
+        workspace.occupy(Position(1, 1))
+
+        # Act
+        copy = workspace.empty_copy()
+
+        # Assert
+        assert (copy.max_x, copy.max_y) == (4, 6)
+        assert not copy.is_occupied(Position(1, 1))
+        assert workspace.is_occupied(Position(1, 1))
+
+    def test_obstacles_make_cells_invalid(self):
+        # Arrange
+        workspace = WorkSpace(5, 5, obstacles=ObstacleMap([(1, 1, 2, 3)]))
+
+        # Act & Assert
+        assert workspace.is_blocked(Position(2, 3))
+        assert not workspace.is_position_valid(Position(1, 2))
+        assert workspace.is_position_valid(Position(3, 2))
+        assert not workspace.is_segment_valid(Position(0, 2), Position(5, 2))
+        assert not workspace.is_segment_valid(Position(1, 0), Position(1, 5))
+        assert workspace.is_segment_valid(Position(3, 0), Position(3, 5))
+        assert not workspace.is_area_valid(Position(0, 0), Position(1, 1))
+        assert workspace.is_area_valid(Position(3, 0), Position(5, 5))
+
+    def test_empty_obstacle_map_is_dropped(self):
+        # Act
+        workspace = WorkSpace(5, 5, obstacles=ObstacleMap())
+
+        # Assert
+        assert workspace.obstacles is None
+        assert not workspace.is_blocked(Position(1, 1))
+
+    def test_obstacle_out_of_bounds_raises_error(self):
+        # Act & Assert
+        with pytest.raises(ValueError) as exc_info:
+            WorkSpace(5, 5, obstacles=ObstacleMap([(4, 4, 6, 4)]))
+
+        assert str(exc_info.value) == "Obstacle (4, 4, 6, 4) is out of workspace bounds"
+
+    def test_empty_copy_keeps_obstacles(self):
+        # Arrange
+        workspace = WorkSpace(5, 5, obstacles=ObstacleMap([(2, 2, 2, 2)]))
+
+        # Act
+        copy = workspace.empty_copy()
+
+        # Assert
+        assert copy.is_blocked(Position(2, 2))
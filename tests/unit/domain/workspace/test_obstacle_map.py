@@ -0,0 +1,99 @@
+import pytest
+
+from src.domain.workspace.obstacle_map import ObstacleMap
+
+
+class TestObstacleMap:
+
+    def setup_method(self):
+        # A pillar at (2, 2), a wall along row 5 and a zone overlapping it
+        self.obstacles = ObstacleMap([(2, 2, 2, 2), (0, 5, 3, 5), (3, 4, 4, 6)])
+
+    @pytest.mark.parametrize(
+        "x,y,expected",
+        [
+            pytest.param(2, 2, True, id="pillar"),
+            pytest.param(0, 5, True, id="start_of_wall"),
+            pytest.param(4, 5, True, id="wall_merged_with_zone"),
+            pytest.param(4, 6, True, id="corner_of_zone"),
+            pytest.param(5, 5, False, id="right_of_wall"),
+            pytest.param(1, 2, False, id="beside_pillar"),
+            pytest.param(0, 0, False, id="row_without_obstacles"),
+        ],
+    )
+    def test_is_blocked(self, x, y, expected):
+        # Act & Assert
+        assert self.obstacles.is_blocked(x, y) is expected
+
+    def test_overlapping_rectangles_are_merged_into_one_run(self):
+        # Act & Assert
+        assert self.obstacles._row_runs(5) == ([0], [4])
+        assert self.obstacles._column_runs(3) == ([4], [6])
+
+    def test_rows_with_the_same_runs_share_a_band(self):
+        # Act
+        band_starts, band_runs = self.obstacles.row_bands()
+
+        # Assert
+        assert band_starts == [2, 3, 4, 5, 6, 7]
+        assert band_runs == [([2], [2]), None, ([3], [4]), ([0], [4]), ([3], [4]), None]
+
+    @pytest.mark.parametrize(
+        "y,first_x,last_x,expected",
+        [
+            pytest.param(2, 0, 1, True, id="stops_before_pillar"),
+            pytest.param(2, 0, 4, False, id="crosses_pillar"),
+            pytest.param(2, 4, 0, False, id="crosses_pillar_backwards"),
+            pytest.param(5, 5, 9, True, id="beyond_wall"),
+            pytest.param(7, 0, 9, True, id="free_row"),
+        ],
+    )
+    def test_is_row_clear(self, y, first_x, last_x, expected):
+        # Act & Assert
+        assert self.obstacles.is_row_clear(y, first_x, last_x) is expected
+
+    @pytest.mark.parametrize(
+        "x,first_y,last_y,expected",
+        [
+            pytest.param(2, 3, 4, True, id="between_pillar_and_wall"),
+            pytest.param(2, 0, 9, False, id="through_pillar_and_wall"),
+            pytest.param(5, 0, 9, True, id="free_column"),
+        ],
+    )
+    def test_is_column_clear(self, x, first_y, last_y, expected):
+        # Act & Assert
+        assert self.obstacles.is_column_clear(x, first_y, last_y) is expected
+
+    @pytest.mark.parametrize(
+        "area,expected",
+        [
+            pytest.param((0, 0, 1, 4), True, id="left_of_pillar"),
+            pytest.param((0, 0, 2, 2), False, id="covers_pillar"),
+            pytest.param((5, 0, 9, 9), True, id="right_of_everything"),
+            pytest.param((0, 0, 9, 9), False, id="whole_grid"),
+        ],
+    )
+    def test_is_area_clear(self, area, expected):
+        # Act & Assert
+        assert self.obstacles.is_area_clear(*area) is expected
+
+    def test_empty_map_is_falsy(self):
+        # Act & Assert
+        assert not ObstacleMap()
+        assert self.obstacles
+
+    def test_large_zone_is_stored_as_one_band(self):
+        # Arrange
+        obstacles = ObstacleMap([(0, 0, 99_999, 99_999), (0, 50_000, 99_999, 50_000)])
+
+        # Act & Assert
+        assert obstacles.row_bands() == ([0, 100_000], [([0], [99_999]), None])
+        assert obstacles.column_bands() == ([0, 100_000], [([0], [99_999]), None])
+        assert obstacles.is_blocked(99_999, 50_000)
+        assert obstacles.is_row_clear(100_000, 0, 99_999)
+        assert not obstacles.is_area_clear(5, 5, 5, 5)
+
+    def test_equality_compares_blocked_cells(self):
+        # Act & Assert
+        assert ObstacleMap([(0, 0, 1, 1)]) == ObstacleMap([(0, 0, 1, 0), (1, 1, 0, 1)])
+        assert ObstacleMap([(0, 0, 1, 1)]) != ObstacleMap([(0, 0, 1, 0)])
@@ -0,0 +1,237 @@
+import json
+import multiprocessing
+import os
+
+import pytest
+
+from src.infrastructure import batch_mission_cli
+from src.infrastructure.batch_mission_cli import (
+    MissionResult,
+    collect_mission_paths,
+    main,
+    output_names,
+    run_mission_file,
+    run_missions,
+)
+
+SAMPLE_MISSION = "5 5\n1 2 N\nLMLMLMLMM\n3 3 E\nMMRMMRMRRM\n"
+
+
+class TestBatchMissionCli:
+
+    def setup_method(self):
+        self.missions = {
+            "a.txt": SAMPLE_MISSION,
+            "b.txt": "5 5\n0 0 S\nM\n",
+            "c.txt": "3 3\n1 1 E\nMM\n",
+        }
+
+    def _write_missions(self, directory):
+        directory.mkdir(exist_ok=True)
+        for name, text in self.missions.items():
+            (directory / name).write_text(text)
+        (directory / "notes.md").write_text("not a mission")
+        return directory
+
+    def test_collect_mission_paths_from_directory_glob_and_manifest(self, tmp_path):
+        # Arrange
+        missions = self._write_missions(tmp_path / "missions")
+        manifest = tmp_path / "manifest.lst"
+        manifest.write_text("# replay\nmissions/c.txt\n\nmissions/a.txt\n")
+
+        # Act
+        paths = collect_mission_paths(
+            [str(missions), str(missions / "[ab].txt"), f"@{manifest}"]
+        )
+
+        # Assert
+        assert paths == [
+            str(missions / "a.txt"),
+            str(missions / "b.txt"),
+            str(missions / "c.txt"),
+            str(missions / "a.txt"),
+            str(missions / "b.txt"),
+            str(tmp_path / "missions/c.txt"),
+            str(tmp_path / "missions/a.txt"),
+        ]
+
+    @pytest.mark.parametrize(
+        "name,expected_output,expected_error",
+        [
+            pytest.param("a.txt", "1 3 N\n5 1 E", None, id="valid_mission"),
+            pytest.param(
+                "b.txt",
+                None,
+                "Position Position(x=0, y=-1) is out of workspace bounds",
+                id="failing_mission",
+            ),
+            pytest.param("missing.txt", None, "not found", id="missing_file"),
+        ],
+    )
+    def test_run_mission_file(self, tmp_path, name, expected_output, expected_error):
+        # Arrange
+        self._write_missions(tmp_path)
+
+        # Act
+        result = run_mission_file(str(tmp_path / name))
+
+        # Assert
+        assert result.output == expected_output
+        if expected_error is None:
+            assert result.error is None
+        else:
+            assert expected_error in result.error
+
+    def test_run_missions_in_worker_pool_keeps_order(self, tmp_path):
+        # Arrange
+        self._write_missions(tmp_path)
+        paths = [str(tmp_path / name) for name in ("c.txt", "a.txt", "b.txt")] * 3
+
+        # Act
+        results = list(run_missions(paths, max_workers=2, chunk_size=2))
+
+        # Assert
+        assert [result.path for result in results] == paths
+        assert [result.output for result in results[:3]] == [
+            "3 1 E",
+            "1 3 N\n5 1 E",
+            None,
+        ]
+
+    @pytest.mark.skipif(
+        multiprocessing.get_start_method() != "fork",
+        reason="workers only see the patched runner when forked",
+    )
+    def test_run_missions_reports_mission_that_kills_its_worker(
+        self, tmp_path, monkeypatch
+    ):
+        # Arrange
+        self._write_missions(tmp_path)
+        (tmp_path / "crash.txt").write_text(SAMPLE_MISSION)
+        run_mission_file = batch_mission_cli.run_mission_file
+
+        def crash_on_marked_mission(path):
+            if path.endswith("crash.txt"):
+                os._exit(1)
+            return run_mission_file(path)
+
+        monkeypatch.setattr(batch_mission_cli, "run_mission_file", crash_on_marked_mission)
+        names = ["a.txt", "crash.txt", "c.txt", "a.txt", "b.txt", "c.txt"]
+        paths = [str(tmp_path / name) for name in names]
+
+        # Act
+        results = list(run_missions(paths, max_workers=2, chunk_size=2))
+
+        # Assert
+        assert [result.path for result in results] == paths
+        assert [result.output for result in results] == [
+            "1 3 N\n5 1 E", None, "3 1 E", "1 3 N\n5 1 E", None, "3 1 E",
+        ]
+        assert results[1].error == "The worker process running it died"
+
+    def test_main_writes_jsonl_and_reports_failures(self, tmp_path, capsys):
+        # Arrange
+        missions = self._write_missions(tmp_path / "missions")
+        jsonl_path = tmp_path / "results.jsonl"
+
+        # Act
+        exit_code = main([str(missions), "--jsonl", str(jsonl_path), "--workers", "1"])
+
+        # Assert
+        results = [
+            MissionResult(**json.loads(line))
+            for line in jsonl_path.read_text().splitlines()
+        ]
+        assert exit_code == 1
+        assert [result.output for result in results] == ["1 3 N\n5 1 E", None, "3 1 E"]
+        stderr = capsys.readouterr().err
+        assert f"FAILED {missions / 'b.txt'}: Position" in stderr
+        assert "Processed 3 missions (1 failed)" in stderr
+
+    def test_main_writes_one_file_per_mission(self, tmp_path):
+        # Arrange
+        del self.missions["b.txt"]
+        missions = self._write_missions(tmp_path / "missions")
+        output_dir = tmp_path / "results"
+
+        # Act
+        exit_code = main(
+            [str(missions / "*.txt"), "--output-dir", str(output_dir), "--workers", "1"]
+        )
+
+        # Assert
+        assert exit_code == 0
+        assert sorted(path.name for path in output_dir.iterdir()) == ["a.out", "c.out"]
+        assert (output_dir / "a.out").read_text() == "1 3 N\n5 1 E\n"
+
+    def test_main_mirrors_mission_directories_under_output_dir(self, tmp_path):
+        # Arrange
+        for directory in ("north", "south"):
+            (tmp_path / "missions" / directory).mkdir(parents=True)
+            (tmp_path / "missions" / directory / "m.txt").write_text(SAMPLE_MISSION)
+        output_dir = tmp_path / "results"
+
+        # Act
+        exit_code = main(
+            [
+                str(tmp_path / "missions" / "*" / "m.txt"),
+                "--output-dir", str(output_dir),
+                "--workers", "1",
+            ]
+        )
+
+        # Assert
+        assert exit_code == 0
+        assert (output_dir / "north" / "m.out").read_text() == "1 3 N\n5 1 E\n"
+        assert (output_dir / "south" / "m.out").read_text() == "1 3 N\n5 1 E\n"
+
+    def test_output_names_reject_missions_sharing_an_output(self, tmp_path):
+        # Arrange
+        paths = [str(tmp_path / "m.txt"), str(tmp_path / "m.mission")]
+
+        # Act & Assert
+        with pytest.raises(ValueError, match="would both write m.out"):
+            output_names(paths)
+
+    def test_main_fails_before_running_when_outputs_collide(self, tmp_path, capsys):
+        # Arrange
+        (tmp_path / "m.txt").write_text(SAMPLE_MISSION)
+        (tmp_path / "m.mission").write_text(SAMPLE_MISSION)
+        output_dir = tmp_path / "results"
+
+        # Act
+        with pytest.raises(SystemExit) as exc_info:
+            main(
+                [
+                    str(tmp_path / "m.txt"), str(tmp_path / "m.mission"),
+                    "--output-dir", str(output_dir),
+                ]
+            )
+
+        # Assert
+        assert exc_info.value.code == 2
+        assert "would both write m.out" in capsys.readouterr().err
+        assert not output_dir.exists()
+
+    @pytest.mark.parametrize(
+        "manifest,expected_error",
+        [
+            pytest.param("missing.lst", "not found", id="missing"),
+            pytest.param("directory", "Is a directory", id="unreadable"),
+        ],
+    )
+    def test_main_reports_unreadable_manifest(
+        self, tmp_path, capsys, manifest, expected_error
+    ):
+        # Arrange
+        (tmp_path / "directory").mkdir()
+
+        # Act
+        with pytest.raises(SystemExit) as exc_info:
+            main([f"@{tmp_path / manifest}"])
+
+        # Assert
+        assert exc_info.value.code == 2
+        stderr = capsys.readouterr().err
+        assert "cannot read manifest" in stderr
+        assert expected_error in stderr
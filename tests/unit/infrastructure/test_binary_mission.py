@@ -0,0 +1,222 @@
+import io
+
+import pytest
+
+from src.domain.robot.value_objects import Position, Orientation
+from src.domain.workspace.entity import WorkSpace
+from src.domain.workspace.obstacle_map import ObstacleMap
+from src.infrastructure.binary_mission import (
+    HEADER,
+    ROBOT_RECORD,
+    BinaryMission,
+    convert_text_mission,
+    decode_instructions,
+    encode_instructions,
+    main,
+    write_binary_mission,
+)
+from src.infrastructure.file_input_reader import FileInputReader
+
+
+class TestBinaryMission:
+
+    @pytest.mark.parametrize(
+        "instructions",
+        [
+            pytest.param("", id="empty"),
+            pytest.param("M", id="single_command"),
+            pytest.param("LRMM", id="one_full_byte"),
+            pytest.param("MMRMMRMRRM", id="partial_last_byte"),
+        ],
+    )
+    def test_encode_and_decode_round_trip(self, instructions):
+        # Act
+        packed = encode_instructions(instructions)
+
+        # Assert
+        assert len(packed) == (len(instructions) + 3) // 4
+        assert decode_instructions(packed, len(instructions)) == instructions
+
+    def test_encode_rejects_invalid_instruction(self):
+        # Act & Assert
+        with pytest.raises(ValueError, match="Invalid instruction: X"):
+            encode_instructions("MMXM")
+
+    def test_write_and_read_round_trip(self):
+        # Arrange
+        workspace = WorkSpace(5, 7, obstacles=ObstacleMap([(2, 2, 3, 2)]))
+        robots = [
+            (Position(1, 2), Orientation("N"), "LMLMLMLMM"),
+            (Position(3, 3), Orientation("W"), ""),
+            (Position(0, 0), Orientation("E"), "MMRMMRMRRM"),
+        ]
+        output = io.BytesIO()
+
+        # Act
+        robot_count = write_binary_mission(workspace, robots, output)
+        mission = BinaryMission(output.getvalue())
+
+        # Assert
+        assert robot_count == 3
+        loaded = mission.get_workspace()
+        assert (loaded.max_x, loaded.max_y) == (5, 7)
+        assert loaded.obstacles.rectangles == [(2, 2, 3, 2)]
+        assert list(mission.iter_robots()) == robots
+
+    @pytest.mark.parametrize(
+        "buffer",
+        [
+            pytest.param(b"", id="empty_buffer"),
+            pytest.param(io.BytesIO(), id="empty_mapped_file"),
+            pytest.param(b"5 5\n1 2 N\nLMLMLMLMM\n" * 3, id="text_mission"),
+        ],
+    )
+    def test_rejects_buffer_that_is_not_a_binary_mission(self, buffer):
+        # Act & Assert
+        with pytest.raises(ValueError, match="not a compiled binary mission"):
+            BinaryMission(buffer)
+
+    def test_iter_robots_raises_error_without_robots(self):
+        # Arrange
+        output = io.BytesIO()
+        write_binary_mission(WorkSpace(5, 5), [], output)
+
+        # Act & Assert
+        with pytest.raises(ValueError, match="at least one robot configuration"):
+            list(BinaryMission(output.getvalue()).iter_robots())
+
+    @pytest.mark.parametrize(
+        "workspace,robots,message",
+        [
+            pytest.param(
+                WorkSpace(1 << 31, 5), [], "Workspace max_x", id="workspace_too_wide"
+            ),
+            pytest.param(
+                WorkSpace(5, 5),
+                [
+                    (Position(1, 2), Orientation("N"), "M"),
+                    (Position(1, -(1 << 31) - 1), Orientation("N"), "M"),
+                ],
+                "Robot 1 y",
+                id="robot_too_low",
+            ),
+        ],
+    )
+    def test_write_rejects_values_that_do_not_fit(self, workspace, robots, message):
+        # Act & Assert
+        with pytest.raises(ValueError, match=f"{message} .* does not fit"):
+            write_binary_mission(workspace, robots, io.BytesIO())
+
+    @pytest.mark.parametrize(
+        "field,value,message",
+        [
+            pytest.param(8, b"\x07", "Invalid heading code 7", id="heading"),
+            pytest.param(
+                20,
+                b"\xff\x00",
+                "Instructions at offset 3 run past the instruction area",
+                id="count",
+            ),
+            pytest.param(
+                12,
+                b"\xff",
+                "Instructions at offset 255 run past the instruction area",
+                id="offset",
+            ),
+        ],
+    )
+    @pytest.mark.parametrize("pack_instructions", [False, True])
+    def test_iter_robots_reports_corrupt_robot_record(
+        self, field, value, message, pack_instructions
+    ):
+        # Arrange
+        output = io.BytesIO()
+        write_binary_mission(
+            WorkSpace(5, 5),
+            [
+                (Position(1, 2), Orientation("N"), "LMLMLMLMM"),
+                (Position(3, 3), Orientation("E"), "MMRMMRMRRM"),
+            ],
+            output,
+        )
+        buffer = bytearray(output.getvalue())
+        record = BinaryMission(bytes(buffer)).robot_table_offset + ROBOT_RECORD.size
+        buffer[record + field:record + field + len(value)] = value
+
+        # Act & Assert
+        with pytest.raises(ValueError, match=f"Robot record 1: {message}"):
+            list(BinaryMission(bytes(buffer), pack_instructions).iter_robots())
+
+    @pytest.mark.parametrize("pack_instructions", [False, True])
+    def test_iter_robots_reports_robot_with_corrupt_instructions(
+        self, pack_instructions
+    ):
+        # Arrange
+        output = io.BytesIO()
+        robots = [(Position(1, 2), Orientation("N"), "LMLM")] * 10
+        write_binary_mission(WorkSpace(5, 5), robots, output)
+        buffer = bytearray(output.getvalue())
+        mission = BinaryMission(bytes(buffer))
+        # Code 3 in the second command of robot 7
+        buffer[mission.instruction_start + 7] |= 0b1100
+
+        # Act
+        mission = BinaryMission(bytes(buffer), pack_instructions)
+        robots_read = []
+        with pytest.raises(
+            ValueError, match="Robot record 7: Invalid instruction code 3 at command 1"
+        ):
+            for robot in mission.iter_robots():
+                robots_read.append(robot)
+
+        # Assert
+        assert len(robots_read) == 7
+
+    def test_rejects_truncated_binary_mission(self):
+        # Arrange
+        output = io.BytesIO()
+        write_binary_mission(
+            WorkSpace(5, 5), [(Position(1, 2), Orientation("N"), "M")], output
+        )
+
+        # Act & Assert
+        with pytest.raises(ValueError, match="truncated or corrupt"):
+            BinaryMission(output.getvalue()[:-1])
+
+    def test_convert_text_mission_reads_back_through_memory_map(self, tmp_path):
+        # Arrange
+        text_path = tmp_path / "input.txt"
+        text_path.write_text("5 5\nOBSTACLES 1\n4 4\n1 2 N\nLMLMLMLMM\n3 3 E\nMMRMMRMRRM\n")
+        binary_path = tmp_path / "input.rbm"
+
+        # Act
+        robot_count = convert_text_mission(str(text_path), str(binary_path))
+        mapped = FileInputReader().map_input(str(binary_path))
+        try:
+            mission = BinaryMission(mapped)
+            robots = list(mission.iter_robots())
+            workspace = mission.get_workspace()
+        finally:
+            mapped.close()
+
+        # Assert
+        assert robot_count == 2
+        assert workspace.is_blocked(Position(4, 4))
+        assert robots == [
+            (Position(1, 2), Orientation("N"), "LMLMLMLMM"),
+            (Position(3, 3), Orientation("E"), "MMRMMRMRRM"),
+        ]
+        assert binary_path.stat().st_size == HEADER.size + 16 + 6 + 2 * 24
+
+    def test_main_compiles_mission(self, tmp_path, capsys):
+        # Arrange
+        text_path = tmp_path / "input.txt"
+        text_path.write_text("5 5\n1 2 N\nLMLMLMLMM\n")
+        binary_path = tmp_path / "input.rbm"
+
+        # Act
+        main([str(text_path), str(binary_path)])
+
+        # Assert
+        assert capsys.readouterr().out == f"Compiled 1 robots into {binary_path}\n"
+        assert binary_path.read_bytes().startswith(b"RBM1")
@@ -0,0 +1,73 @@
+import io
+
+from src.application.services.robot_service import RobotService
+from src.application.services.work_space import WorkSpaceService
+from src.domain.robot.packed_instructions import PackedInstructions
+from src.domain.robot.value_objects import Position, Orientation
+from src.domain.workspace.entity import WorkSpace
+from src.infrastructure.binary_mission import BinaryMission, write_binary_mission
+from src.infrastructure.binary_robot_repository import BinaryRobotRepository
+from src.infrastructure.binary_work_space_repository import BinaryWorkSpaceRepository
+
+
+class TestBinaryRobotRepository:
+
+    def setup_method(self):
+        output = io.BytesIO()
+        write_binary_mission(
+            WorkSpace(5, 5),
+            [
+                (Position(1, 2), Orientation("N"), "LMLMLMLMM"),
+                (Position(3, 3), Orientation("E"), "MMRMMRMRRM"),
+            ],
+            output,
+        )
+        self.mission = BinaryMission(output.getvalue())
+
+    def test_list_accessors(self):
+        # Arrange
+        repository = BinaryRobotRepository(mission=self.mission)
+
+        # Act & Assert
+        assert repository.get_robot_position_list() == [Position(1, 2), Position(3, 3)]
+        assert repository.get_robot_orientation_list() == [
+            Orientation("N"),
+            Orientation("E"),
+        ]
+        assert repository.get_robot_instruction_list() == ["LMLMLMLMM", "MMRMMRMRRM"]
+
+    def test_robot_service_runs_binary_mission(self):
+        # Arrange
+        robot_service = RobotService(
+            robot_repository=BinaryRobotRepository(mission=self.mission),
+            workspace_service=WorkSpaceService(
+                workspace_repository=BinaryWorkSpaceRepository(mission=self.mission)
+            ),
+        )
+
+        # Act
+        result = robot_service.process_instructions()
+
+        # Assert
+        assert result == "1 3 N\n5 1 E"
+
+    def test_robot_service_runs_packed_instructions_from_binary_mission(self):
+        # Arrange
+        mission = BinaryMission(self.mission.buffer, pack_instructions=True)
+        robot_repository = BinaryRobotRepository(mission=mission)
+        robot_service = RobotService(
+            robot_repository=robot_repository,
+            workspace_service=WorkSpaceService(
+                workspace_repository=BinaryWorkSpaceRepository(mission=mission)
+            ),
+        )
+
+        # Act
+        result = robot_service.process_instructions()
+
+        # Assert
+        assert robot_repository.get_robot_instruction_list() == [
+            PackedInstructions.pack("LMLMLMLMM"),
+            PackedInstructions.pack("MMRMMRMRRM"),
+        ]
+        assert result == "1 3 N\n5 1 E"
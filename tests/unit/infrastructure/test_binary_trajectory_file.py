@@ -0,0 +1,85 @@
+import io
+
+import numpy as np
+import pytest
+
+from src.domain.robot.trajectory import Trajectory
+from src.domain.robot.value_objects import Orientation, Position
+from src.infrastructure.binary_trajectory_file import (
+    BinaryTrajectoryWriter,
+    iter_trajectories,
+    save_trajectory_npy,
+)
+
+
+def make_trajectory(poses):
+    trajectory = Trajectory()
+    for x, y, heading in poses:
+        trajectory.append(Position(x, y), Orientation(heading))
+    return trajectory
+
+
+class TestBinaryTrajectoryFile:
+
+    def test_trajectories_stream_back_in_written_order(self):
+        # Arrange
+        stream = io.BytesIO()
+        writer = BinaryTrajectoryWriter(stream)
+        writer.write(0, make_trajectory([(1, 2, "N"), (1, 3, "N")]))
+        writer.write(2, make_trajectory([(-4, 70000, "W")]))
+        writer.flush()
+        stream.seek(0)
+
+        # Act
+        trajectories = [
+            (index, list(trajectory)) for index, trajectory in iter_trajectories(stream)
+        ]
+
+        # Assert
+        assert trajectories == [
+            (0, [(Position(1, 2), Orientation("N")), (Position(1, 3), Orientation("N"))]),
+            (2, [(Position(-4, 70000), Orientation("W"))]),
+        ]
+
+    def test_each_pose_takes_nine_bytes(self):
+        # Arrange
+        stream = io.BytesIO()
+        writer = BinaryTrajectoryWriter(stream)
+
+        # Act
+        writer.write(0, make_trajectory([(0, y, "N") for y in range(100)]))
+
+        # Assert
+        assert len(stream.getvalue()) == 4 + 8 + 100 * 9
+
+    @pytest.mark.parametrize(
+        "data,message",
+        [
+            pytest.param(b"RBM1", "Not a trajectory file", id="wrong_magic"),
+            pytest.param(b"RTJ1\x00\x00", "Truncated trajectory file", id="short_header"),
+            pytest.param(
+                b"RTJ1" + bytes(4) + b"\x02\x00\x00\x00" + bytes(8),
+                "Truncated trajectory file",
+                id="short_column",
+            ),
+        ],
+    )
+    def test_invalid_files_raise_value_error(self, data, message):
+        # Act & Assert
+        with pytest.raises(ValueError, match=message):
+            list(iter_trajectories(io.BytesIO(data)))
+
+    def test_save_trajectory_npy_writes_record_array(self):
+        # Arrange
+        stream = io.BytesIO()
+        trajectory = make_trajectory([(1, 2, "N"), (2, 2, "E")])
+
+        # Act
+        save_trajectory_npy(trajectory, stream)
+        stream.seek(0)
+        records = np.load(stream)
+
+        # Assert
+        assert records["x"].tolist() == [1, 2]
+        assert records["y"].tolist() == [2, 2]
+        assert records["heading"].tolist() == [0, 1]
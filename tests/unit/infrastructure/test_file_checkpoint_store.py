@@ -0,0 +1,204 @@
+import os
+from unittest.mock import Mock
+
+import pytest
+
+from src.application.repository.checkpoint_store import FleetCheckpoint, RobotProgress
+from src.application.repository.robot_repository import RobotRepository
+from src.application.services.checkpointed_robot_service import (
+    CheckpointedRobotService,
+)
+from src.application.services.robot_error_table import RobotErrorTable
+from src.application.services.work_space import WorkSpaceService
+from src.domain.robot.robot_failure import RobotFailure
+from src.domain.robot.value_objects import Orientation, Position
+from src.domain.workspace.entity import WorkSpace
+from src.infrastructure.file_checkpoint_store import FileCheckpointStore
+
+
+class TestFileCheckpointStore:
+
+    def test_saved_checkpoint_and_states_are_loaded_back(self, tmp_path):
+        # Arrange
+        path = str(tmp_path / "run.checkpoint")
+        failure = RobotFailure(1, 3, Position(0, 5), Orientation("W"), "out of bounds")
+        progress = RobotProgress(1 << 20, Position(7, -2), Orientation("S"))
+        store = FileCheckpointStore(path)
+        store.save(
+            FleetCheckpoint(2, fingerprint=b"\x01" * 16),
+            [(Position(1, 3), Orientation("N")), failure],
+        )
+        store.save(
+            FleetCheckpoint(3, progress, b"\x02" * 16),
+            [(Position(4, 4), Orientation("E"))],
+        )
+
+        # Act
+        reloaded = FileCheckpointStore(path)
+        checkpoint = reloaded.load()
+        final_states = list(reloaded.iter_final_states())
+
+        # Assert
+        assert checkpoint == FleetCheckpoint(3, progress, b"\x02" * 16)
+        assert final_states == [
+            (Position(1, 3), Orientation("N")),
+            failure,
+            (Position(4, 4), Orientation("E")),
+        ]
+        assert os.path.getsize(reloaded.states_path) == 3 * 9
+        with open(reloaded.failures_path) as failures_file:
+            assert failures_file.read() == '[1, 3, "W", "out of bounds"]\n'
+        assert not os.path.exists(path + ".tmp")
+
+    def test_load_drops_states_of_uncommitted_save(self, tmp_path):
+        # Arrange
+        path = str(tmp_path / "run.checkpoint")
+        failure = RobotFailure(1, 3, Position(0, 5), Orientation("W"), "out of bounds")
+        FileCheckpointStore(path).save(
+            FleetCheckpoint(2), [(Position(1, 3), Orientation("N")), failure]
+        )
+        # A save that was interrupted before committing its checkpoint
+        with open(path + ".states", "ab") as states_file:
+            states_file.write(b"\x00" * 9)
+        with open(path + ".failures", "ab") as failures_file:
+            failures_file.write(b'[2, 1, "N", "blocked"]\n')
+
+        # Act
+        store = FileCheckpointStore(path)
+        checkpoint = store.load()
+
+        # Assert
+        assert checkpoint == FleetCheckpoint(2)
+        assert list(store.iter_final_states()) == [
+            (Position(1, 3), Orientation("N")),
+            failure,
+        ]
+        assert os.path.getsize(store.failures_path) == len(
+            b'[1, 3, "W", "out of bounds"]\n'
+        )
+
+    @pytest.mark.parametrize(
+        "suffix,size,message",
+        [
+            pytest.param(".states", None, "is missing", id="states_missing"),
+            pytest.param(
+                ".states", 9, "shorter than its committed 18 bytes", id="states_short"
+            ),
+            pytest.param(".failures", None, "is missing", id="failures_missing"),
+            pytest.param(".failures", 4, "shorter than its committed", id="failures_short"),
+        ],
+    )
+    def test_load_rejects_missing_or_short_side_file(
+        self, tmp_path, suffix, size, message
+    ):
+        # Arrange
+        path = str(tmp_path / "run.checkpoint")
+        failure = RobotFailure(1, 3, Position(0, 5), Orientation("W"), "out of bounds")
+        FileCheckpointStore(path).save(
+            FleetCheckpoint(2), [(Position(1, 3), Orientation("N")), failure]
+        )
+        if size is None:
+            os.remove(path + suffix)
+        else:
+            os.truncate(path + suffix, size)
+
+        # Act & Assert
+        with pytest.raises(ValueError, match=message):
+            FileCheckpointStore(path).load()
+
+    def test_clear_removes_files(self, tmp_path):
+        # Arrange
+        path = str(tmp_path / "run.checkpoint")
+        store = FileCheckpointStore(path)
+        store.save(FleetCheckpoint(1), [(Position(1, 3), Orientation("N"))])
+
+        # Act
+        store.clear()
+
+        # Assert
+        assert store.load() is None
+        assert list(store.iter_final_states()) == []
+        assert not os.path.exists(store.states_path)
+        assert not os.path.exists(store.failures_path)
+
+    def test_unsupported_version_raises_value_error(self, tmp_path):
+        # Arrange
+        path = tmp_path / "run.checkpoint"
+        path.write_text('{"version": 99}')
+
+        # Act & Assert
+        with pytest.raises(ValueError, match="Unsupported checkpoint version"):
+            FileCheckpointStore(str(path)).load()
+
+    def test_interrupted_run_resumes_without_redoing_completed_robots(self, tmp_path):
+        # Arrange
+        path = str(tmp_path / "run.checkpoint")
+        robots = [
+            (Position(1, 2), Orientation("N"), "LMLMLMLMM"),
+            (Position(9, 9), Orientation("N"), "M"),
+            (Position(3, 3), Orientation("E"), "MMRMMRMRRM"),
+            (Position(0, 0), Orientation("N"), "MRML" * 4),
+        ]
+
+        def interrupted_robots():
+            yield from robots[:3]
+            raise KeyboardInterrupt
+
+        def make_service(robot_iterator, error_table):
+            workspace_service = Mock(spec=WorkSpaceService)
+            workspace_service.get_workspace.return_value = WorkSpace(5, 5)
+            robot_repository = Mock(spec=RobotRepository)
+            robot_repository.iter_robots.return_value = robot_iterator
+            return CheckpointedRobotService(
+                robot_repository=robot_repository,
+                workspace_service=workspace_service,
+                park_finished_robots=True,
+                error_table=error_table,
+                checkpoint_store=FileCheckpointStore(path),
+                checkpoint_interval=60.0,
+                checkpoint_steps=4,
+            )
+
+        with pytest.raises(KeyboardInterrupt):
+            make_service(interrupted_robots(), RobotErrorTable()).process_instructions()
+
+        # Act
+        error_table = RobotErrorTable()
+        resumed_robots = iter(robots)
+        result = make_service(resumed_robots, error_table).process_instructions()
+
+        # Assert
+        assert result.splitlines() == [
+            "1 3 N",
+            f"ERROR Initial position {Position(9, 9)} is out of workspace bounds",
+            "5 1 E",
+            "4 4 N",
+        ]
+        assert error_table.failed_indexes() == [1]
+        assert next(resumed_robots, None) is None
+
+    def test_resume_with_other_mission_raises_value_error(self, tmp_path):
+        # Arrange
+        path = str(tmp_path / "run.checkpoint")
+        robots = [
+            (Position(1, 2), Orientation("N"), "LMLMLMLMM"),
+            (Position(3, 3), Orientation("E"), "MMRMMRMRRM"),
+        ]
+
+        def make_service(robot_iterator):
+            workspace_service = Mock(spec=WorkSpaceService)
+            workspace_service.get_workspace.return_value = WorkSpace(5, 5)
+            robot_repository = Mock(spec=RobotRepository)
+            robot_repository.iter_robots.return_value = robot_iterator
+            return CheckpointedRobotService(
+                robot_repository=robot_repository,
+                workspace_service=workspace_service,
+                checkpoint_store=FileCheckpointStore(path),
+            )
+
+        assert make_service(iter(robots)).process_instructions() == "1 3 N\n5 1 E"
+
+        # Act & Assert
+        changed_robots = [robots[0], (Position(3, 3), Orientation("E"), "MMRMMRMRR")]
+        with pytest.raises(ValueError, match="does not match this mission"):
+            make_service(iter(changed_robots)).process_instructions()
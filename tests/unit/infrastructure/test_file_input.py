@@ -32,4 +32,63 @@ class TestFileInputAdapter:
             self.adapter.get_input(file_path)
 
         mock_file.assert_called_once_with(file_path, "r")
-        assert str(exc_info.value) == expected_message
\ No newline at end of file
+        assert str(exc_info.value) == expected_message
+
+    @patch("builtins.open", new_callable=mock_open, read_data="5 5\n1 2 N\nM")
+    def test_open_input_returns_open_stream(self, mock_file):
+        # Act
+        result = self.adapter.open_input("file.txt")
+
+        # Assert
+        mock_file.assert_called_once_with("file.txt", "r")
+        assert result.readline() == "5 5\n"
+
+    @patch("builtins.open", side_effect=FileNotFoundError)
+    def test_open_input_file_not_found_raises_error(self, mock_file):
+        # Act & Assert
+        with pytest.raises(FileNotFoundError) as exc_info:
+            self.adapter.open_input("nonexistent_file.txt")
+
+        assert str(exc_info.value) == (
+            "Input file 'nonexistent_file.txt' not found. "
+            "Please create it with the required input format."
+        )
+
+    def test_map_input_returns_read_only_bytes_view(self, tmp_path):
+        # Arrange
+        input_file = tmp_path / "input.txt"
+        input_file.write_bytes(b"5 5\n1 2 N\nM")
+
+        # Act
+        with self.adapter.map_input(str(input_file)) as input_map:
+            first_line = input_map.readline()
+            with pytest.raises(TypeError):
+                input_map[0] = ord("6")
+
+        # Assert
+        assert first_line == b"5 5\n"
+
+    def test_map_input_handles_empty_file(self, tmp_path):
+        # Arrange
+        input_file = tmp_path / "input.txt"
+        input_file.write_bytes(b"")
+
+        # Act
+        with self.adapter.map_input(str(input_file)) as input_map:
+            content = input_map.readline()
+
+        # Assert
+        assert content == b""
+
+    def test_map_input_file_not_found_raises_error(self, tmp_path):
+        # Arrange
+        file_path = str(tmp_path / "nonexistent_file.txt")
+
+        # Act & Assert
+        with pytest.raises(FileNotFoundError) as exc_info:
+            self.adapter.map_input(file_path)
+
+        assert str(exc_info.value) == (
+            f"Input file '{file_path}' not found. "
+            "Please create it with the required input format."
+        )
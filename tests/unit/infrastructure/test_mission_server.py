@@ -0,0 +1,196 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.infrastructure import mission_server
+from src.infrastructure.mission_server import MissionServer
+
+SAMPLE_MISSION = "5 5\n1 2 N\nLMLMLMLMM\n3 3 E\nMMRMMRMRRM"
+
+
+class TestMissionServer:
+
+    def setup_method(self):
+        self.executor = ThreadPoolExecutor(max_workers=2)
+        self.server = MissionServer(executor=self.executor)
+
+    def teardown_method(self):
+        self.server.close()
+        self.executor.shutdown()
+
+    async def _send(self, reader, writer, mission):
+        writer.write(f"{mission}\nEND\n".encode())
+        await writer.drain()
+        lines = []
+        while True:
+            line = (await reader.readline()).decode().rstrip("\n")
+            if line == "END" or line.startswith("ERROR"):
+                return lines, line
+            lines.append(line)
+
+    def test_serves_missions_over_tcp(self):
+        # Arrange
+        async def scenario():
+            listener = await self.server.start_tcp()
+            port = listener.sockets[0].getsockname()[1]
+            async with listener:
+                reader, writer = await asyncio.open_connection("127.0.0.1", port)
+                first = await self._send(reader, writer, SAMPLE_MISSION)
+                second = await self._send(reader, writer, "5 5\n0 0 S\nM")
+                writer.close()
+                await writer.wait_closed()
+            return first, second
+
+        # Act
+        first, second = asyncio.run(scenario())
+
+        # Assert
+        assert first == (["1 3 N", "5 1 E"], "END")
+        assert second == (
+            [],
+            "ERROR Position Position(x=0, y=-1) is out of workspace bounds",
+        )
+
+    def test_mission_can_end_with_end_of_file_on_unix_socket(self, tmp_path):
+        # Arrange
+        path = str(tmp_path / "missions.sock")
+
+        async def scenario():
+            listener = await self.server.start_unix(path)
+            async with listener:
+                reader, writer = await asyncio.open_unix_connection(path)
+                writer.write(SAMPLE_MISSION.encode())
+                writer.write_eof()
+                response = await reader.read()
+                writer.close()
+                await writer.wait_closed()
+            return response
+
+        # Act
+        response = asyncio.run(scenario())
+
+        # Assert
+        assert response == b"1 3 N\n5 1 E\nEND\n"
+
+    def test_serves_concurrent_clients(self):
+        # Arrange
+        missions = [f"9 9\n{i} 0 N\n{'M' * i}" for i in range(1, 10)]
+
+        async def client(port, mission):
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            response = await self._send(reader, writer, mission)
+            writer.close()
+            await writer.wait_closed()
+            return response
+
+        async def scenario():
+            listener = await self.server.start_tcp()
+            port = listener.sockets[0].getsockname()[1]
+            async with listener:
+                return await asyncio.gather(
+                    *(client(port, mission) for mission in missions)
+                )
+
+        # Act
+        responses = asyncio.run(scenario())
+
+        # Assert
+        assert responses == [([f"{i} {i} N"], "END") for i in range(1, 10)]
+        assert self.server.missions_served == 9
+
+    def test_serves_more_clients_than_threads(self, monkeypatch):
+        # Arrange
+        monkeypatch.setattr(mission_server, "STREAM_BATCH_LINES", 1)
+        monkeypatch.setattr(mission_server, "STREAM_MAX_CHUNKS", 1)
+        server = MissionServer(executor=ThreadPoolExecutor(max_workers=1))
+        missions = [
+            "9 9\n" + "\n".join(f"{i} {j} N\nM" for j in range(5)) for i in range(6)
+        ]
+
+        async def client(port, mission):
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            response = await self._send(reader, writer, mission)
+            writer.close()
+            await writer.wait_closed()
+            return response
+
+        async def scenario():
+            # Connections waiting on queued missions must not use up the
+            # only thread left to the event loop
+            asyncio.get_running_loop().set_default_executor(
+                ThreadPoolExecutor(max_workers=1)
+            )
+            listener = await server.start_tcp()
+            port = listener.sockets[0].getsockname()[1]
+            async with listener:
+                return await asyncio.wait_for(
+                    asyncio.gather(*(client(port, mission) for mission in missions)),
+                    timeout=10,
+                )
+
+        # Act
+        try:
+            responses = asyncio.run(scenario())
+        finally:
+            server.executor.shutdown()
+
+        # Assert
+        assert responses == [
+            ([f"{i} {j + 1} N" for j in range(5)], "END") for i in range(6)
+        ]
+
+    def test_streams_poses_before_a_failure_in_batches(self, monkeypatch):
+        # Arrange
+        monkeypatch.setattr(mission_server, "STREAM_BATCH_LINES", 2)
+        mission = "5 5\n0 0 N\nM\n1 1 N\nM\n2 2 N\nM\n0 0 S\nM"
+
+        async def scenario():
+            listener = await self.server.start_tcp()
+            port = listener.sockets[0].getsockname()[1]
+            async with listener:
+                reader, writer = await asyncio.open_connection("127.0.0.1", port)
+                response = await self._send(reader, writer, mission)
+                writer.close()
+                await writer.wait_closed()
+            return response
+
+        # Act
+        response = asyncio.run(scenario())
+
+        # Assert
+        assert response == (
+            ["0 1 N", "1 2 N", "2 3 N"],
+            "ERROR Position Position(x=0, y=-1) is out of workspace bounds",
+        )
+        assert self.server.missions_served == 0
+
+    @pytest.mark.parametrize(
+        "payload,expected_error",
+        [
+            pytest.param(b"5 5\n\xff\xfe\nEND\n", "ERROR 'utf-8' codec", id="invalid_utf8"),
+            pytest.param(b"5 5\n" + b"M" * 64 + b"\nEND\n", "ERROR ", id="line_over_limit"),
+        ],
+    )
+    def test_unreadable_input_is_answered_with_error_line(self, payload, expected_error):
+        # Arrange
+        server = MissionServer(executor=self.executor, line_limit=32)
+
+        async def scenario():
+            listener = await server.start_tcp()
+            port = listener.sockets[0].getsockname()[1]
+            async with listener:
+                reader, writer = await asyncio.open_connection("127.0.0.1", port)
+                writer.write(payload)
+                await writer.drain()
+                response = await reader.read()
+                writer.close()
+                await writer.wait_closed()
+            return response.decode()
+
+        # Act
+        response = asyncio.run(scenario())
+
+        # Assert
+        assert response.startswith(expected_error)
+        assert response.count("\n") == 1
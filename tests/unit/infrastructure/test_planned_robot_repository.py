@@ -0,0 +1,36 @@
+from unittest.mock import Mock
+
+from src.application.services.batch_path_planner import BatchPathPlanner
+from src.application.services.robot_service import RobotService
+from src.application.services.work_space import WorkSpaceService
+from src.domain.robot.value_objects import Orientation, Position
+from src.domain.workspace.entity import WorkSpace
+from src.domain.workspace.obstacle_map import ObstacleMap
+from src.infrastructure.planned_robot_repository import PlannedRobotRepository
+
+
+class TestPlannedRobotRepository:
+
+    def test_planned_robots_feed_robot_service(self):
+        # Arrange
+        workspace_service = Mock(spec=WorkSpaceService)
+        workspace_service.get_workspace.return_value = WorkSpace(
+            6, 6, ObstacleMap([(2, 0, 2, 4), (4, 2, 6, 2)])
+        )
+        batch_planner = BatchPathPlanner(workspace_service=workspace_service)
+        requests = [
+            (Position(0, 0), Orientation("N"), Position(6, 6), Orientation("E")),
+            (Position(3, 0), Orientation("W"), Position(5, 0), Orientation("S")),
+        ]
+
+        # Act
+        repository = PlannedRobotRepository.plan(batch_planner, requests)
+        robot_service = RobotService(
+            robot_repository=repository,
+            workspace_service=workspace_service,
+        )
+        result = robot_service.process_instructions()
+
+        # Assert
+        assert result == "6 6 E\n5 0 S"
+        assert repository.get_robot_position_list() == [Position(0, 0), Position(3, 0)]
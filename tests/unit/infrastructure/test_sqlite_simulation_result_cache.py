@@ -0,0 +1,145 @@
+import sqlite3
+from unittest.mock import Mock
+
+from src.application.repository.robot_repository import RobotRepository
+from src.application.services.cached_robot_service import CachedRobotService
+from src.application.services.work_space import WorkSpaceService
+from src.domain.robot.value_objects import Position, Orientation
+from src.domain.workspace.entity import WorkSpace
+from src.infrastructure.sqlite_simulation_result_cache import (
+    SqliteSimulationResultCache,
+)
+
+
+class TestSqliteSimulationResultCache:
+
+    def test_results_persist_across_instances(self, tmp_path):
+        # Arrange
+        path = str(tmp_path / "results.sqlite")
+        with SqliteSimulationResultCache(path) as cache:
+            cache.put(b"robot-1", Position(1, 3), Orientation("N"))
+
+        # Act
+        with SqliteSimulationResultCache(path) as cache:
+            hit = cache.get(b"robot-1")
+            miss = cache.get(b"robot-2")
+
+        # Assert
+        assert hit == (Position(1, 3), Orientation("N"))
+        assert miss is None
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_put_writes_full_batches(self, tmp_path):
+        # Arrange
+        path = str(tmp_path / "results.sqlite")
+        cache = SqliteSimulationResultCache(path, batch_size=2)
+
+        # Act
+        for i in range(3):
+            cache.put(bytes([i]), Position(i, i), Orientation("E"))
+        stored = SqliteSimulationResultCache(path)
+
+        # Assert
+        assert len(stored) == 2
+        assert len(cache) == 3
+        assert cache.get(bytes([2])) == (Position(2, 2), Orientation("E"))
+        cache.close()
+        stored.close()
+
+    def test_only_changed_robots_are_simulated_again(self, tmp_path):
+        # Arrange
+        path = str(tmp_path / "results.sqlite")
+        robots = [
+            (Position(1, 2), Orientation("N"), "LMLMLMLMM"),
+            (Position(3, 3), Orientation("E"), "MMRMMRMRRM"),
+            (Position(0, 0), Orientation("N"), "MMRMM"),
+        ]
+
+        def run(robots):
+            robot_repository = Mock(spec=RobotRepository)
+            robot_repository.iter_robots.return_value = iter(robots)
+            workspace_service = Mock(spec=WorkSpaceService)
+            workspace_service.get_workspace.return_value = WorkSpace(5, 5)
+            with SqliteSimulationResultCache(path) as cache:
+                output = CachedRobotService(
+                    robot_repository=robot_repository,
+                    workspace_service=workspace_service,
+                    result_cache=cache,
+                ).process_instructions()
+            return output, cache.hits, cache.misses
+
+        # Act
+        first = run(robots)
+        robots[1] = (Position(3, 3), Orientation("E"), "MMRMMRMRR")
+        second = run(robots)
+
+        # Assert
+        assert first == ("1 3 N\n5 1 E\n2 2 E", 0, 3)
+        assert second == ("1 3 N\n4 1 E\n2 2 E", 2, 1)
+
+    def test_flush_evicts_least_recently_used_results(self, tmp_path):
+        # Arrange
+        path = str(tmp_path / "results.sqlite")
+        with SqliteSimulationResultCache(path, max_rows=2) as cache:
+            cache.put(b"robot-1", Position(1, 1), Orientation("N"))
+            cache.put(b"robot-2", Position(2, 2), Orientation("N"))
+        with SqliteSimulationResultCache(path, max_rows=2) as cache:
+            # Using robot-1 again makes robot-2 the least recently used
+            cache.get(b"robot-1")
+            cache.put(b"robot-3", Position(3, 3), Orientation("N"))
+
+        # Act
+        with SqliteSimulationResultCache(path, max_rows=2) as cache:
+            stored = [
+                cache.get(fingerprint)
+                for fingerprint in (b"robot-1", b"robot-2", b"robot-3")
+            ]
+
+        # Assert
+        assert stored == [
+            (Position(1, 1), Orientation("N")),
+            None,
+            (Position(3, 3), Orientation("N")),
+        ]
+
+    def test_prune_keeps_most_recent_results(self, tmp_path):
+        # Arrange
+        path = str(tmp_path / "results.sqlite")
+        cache = SqliteSimulationResultCache(path, max_rows=None)
+        for i in range(5):
+            cache.put(bytes([i]), Position(i, i), Orientation("E"))
+        cache.flush()
+
+        # Act
+        deleted = cache.prune(3)
+
+        # Assert
+        assert deleted == 2
+        assert len(cache) == 3
+        assert cache.get(bytes([1])) is None
+        assert cache.get(bytes([2])) == (Position(2, 2), Orientation("E"))
+        cache.close()
+
+    def test_cache_written_without_use_column_is_upgraded(self, tmp_path):
+        # Arrange
+        path = str(tmp_path / "results.sqlite")
+        connection = sqlite3.connect(path)
+        connection.execute(
+            "CREATE TABLE results ("
+            "fingerprint BLOB PRIMARY KEY, x INTEGER, y INTEGER, heading INTEGER"
+            ") WITHOUT ROWID"
+        )
+        connection.execute("INSERT INTO results VALUES (?, 1, 3, 0)", (b"robot-1",))
+        connection.commit()
+        connection.close()
+
+        # Act
+        with SqliteSimulationResultCache(path, max_rows=1) as cache:
+            hit = cache.get(b"robot-1")
+            cache.put(b"robot-2", Position(2, 2), Orientation("E"))
+
+        # Assert
+        assert hit == (Position(1, 3), Orientation("N"))
+        with SqliteSimulationResultCache(path) as cache:
+            assert len(cache) == 1
+            assert cache.get(b"robot-2") == (Position(2, 2), Orientation("E"))
@@ -0,0 +1,33 @@
+import io
+
+from src.infrastructure.stream_output_writer import StreamOutputWriter
+
+
+class TestStreamOutputWriter:
+
+    def test_write_line_buffers_until_buffer_is_full(self):
+        # Arrange
+        output_stream = io.StringIO()
+        writer = StreamOutputWriter(output_stream=output_stream, buffer_size=2)
+
+        # Act
+        writer.write_line("1 3 N")
+        buffered = output_stream.getvalue()
+        writer.write_line("5 1 E")
+
+        # Assert
+        assert buffered == ""
+        assert output_stream.getvalue() == "1 3 N\n5 1 E\n"
+
+    def test_flush_writes_pending_lines(self):
+        # Arrange
+        output_stream = io.StringIO()
+        writer = StreamOutputWriter(output_stream=output_stream)
+        writer.write_line("1 3 N")
+
+        # Act
+        writer.flush()
+        writer.flush()
+
+        # Assert
+        assert output_stream.getvalue() == "1 3 N\n"
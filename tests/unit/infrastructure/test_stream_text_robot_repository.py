@@ -0,0 +1,144 @@
+import io
+
+import pytest
+from src.infrastructure.stream_text_robot_repository import (
+    StreamTextRobotRepository,
+    iter_input_lines,
+)
+from src.infrastructure.file_input_reader import FileInputReader
+
+
+class TestStreamTextRobotRepository:
+
+    @pytest.mark.parametrize(
+        "input_text,expected_robots",
+        [
+            pytest.param(
+                "5 5\n1 2 N\nLMLMLMLMM",
+                [(1, 2, "N", "LMLMLMLMM")],
+                id="single_robot_with_complex_instructions",
+            ),
+            pytest.param(
+                "5 5\n1 2 N\nLMLMLMLMM\n3 3 E\nMMRMMRMRRM\n",
+                [(1, 2, "N", "LMLMLMLMM"), (3, 3, "E", "MMRMMRMRRM")],
+                id="two_robots_with_trailing_newline",
+            ),
+            pytest.param(
+                "\n10 10\n0 0 N\nM\n5 5 S\nL\n2 3 W\nR\n\n\n",
+                [(0, 0, "N", "M"), (5, 5, "S", "L"), (2, 3, "W", "R")],
+                id="three_robots_surrounded_by_blank_lines",
+            ),
+            pytest.param(
+                "5 5\nOBSTACLES 2\n2 2\n0 4 1 4\n1 2 N\nLM",
+                [(1, 2, "N", "LM")],
+                id="robots_after_obstacle_section",
+            ),
+        ],
+    )
+    def test_iter_robots_yields_records_in_input_order(
+        self, input_text, expected_robots
+    ):
+        # Arrange
+        repository = StreamTextRobotRepository(input_stream=io.StringIO(input_text))
+
+        # Act
+        robots = [
+            (position.x, position.y, orientation.current_orientation, instructions)
+            for position, orientation, instructions in repository.iter_robots()
+        ]
+
+        # Assert
+        assert robots == expected_robots
+
+    def test_iter_robots_parses_lazily(self):
+        # Arrange
+        input_stream = io.StringIO("5 5\n1 2 N\nM\n1 2 X\nM")
+        repository = StreamTextRobotRepository(input_stream=input_stream)
+
+        # Act
+        robots = repository.iter_robots()
+        position, orientation, instructions = next(robots)
+
+        # Assert
+        assert (position.x, position.y) == (1, 2)
+        assert instructions == "M"
+        with pytest.raises(ValueError):
+            next(robots)
+
+    def test_iter_robots_can_be_repeated(self):
+        # Arrange
+        repository = StreamTextRobotRepository(
+            input_stream=io.StringIO("5 5\n1 2 N\nM\n3 3 E\nL")
+        )
+
+        # Act
+        first_pass = [instructions for _, _, instructions in repository.iter_robots()]
+        second_pass = repository.get_robot_instruction_list()
+
+        # Assert
+        assert first_pass == second_pass == ["M", "L"]
+
+    def test_list_accessors_match_text_repository(self):
+        # Arrange
+        repository = StreamTextRobotRepository(
+            input_stream=io.StringIO("5 5\n1 2 N\nLM\n3 3 E\nMR")
+        )
+
+        # Act
+        positions = repository.get_robot_position_list()
+        orientations = repository.get_robot_orientation_list()
+
+        # Assert
+        assert [(p.x, p.y) for p in positions] == [(1, 2), (3, 3)]
+        assert [o.current_orientation for o in orientations] == ["N", "E"]
+
+    @pytest.mark.parametrize(
+        "invalid_input",
+        [
+            pytest.param("5 5", id="only_workspace_dimensions_no_robot_data"),
+            pytest.param("5 5\n1 2 N", id="workspace_and_position_but_no_instructions"),
+            pytest.param("", id="empty_input_string"),
+            pytest.param("\n\n", id="only_newlines_no_content"),
+            pytest.param(
+                "5 5\n1 2 N\nLMLMLMLMM\n3 3 E",
+                id="missing_instruction_for_second_robot",
+            ),
+            pytest.param("5 5\n1 N\nM", id="missing_position_coordinate"),
+        ],
+    )
+    def test_iter_robots_raises_error_for_invalid_input(self, invalid_input):
+        # Arrange
+        repository = StreamTextRobotRepository(input_stream=io.StringIO(invalid_input))
+
+        # Act & Assert
+        with pytest.raises(ValueError):
+            list(repository.iter_robots())
+
+    def test_iter_robots_reads_memory_mapped_file(self, tmp_path):
+        # Arrange
+        input_file = tmp_path / "input.txt"
+        input_file.write_bytes(b"5 5\r\n1 2 N\r\nLMLMLMLMM\r\n3 3 E\r\nMMRMMRMRRM\r\n")
+
+        # Act
+        with FileInputReader().map_input(str(input_file)) as input_map:
+            repository = StreamTextRobotRepository(input_stream=input_map)
+            robots = [
+                (position.x, position.y, orientation.current_orientation, instructions)
+                for position, orientation, instructions in repository.iter_robots()
+            ]
+
+        # Assert
+        assert robots == [(1, 2, "N", "LMLMLMLMM"), (3, 3, "E", "MMRMMRMRRM")]
+
+    def test_iter_input_lines_keeps_inner_blank_lines(self):
+        # Act
+        lines = list(iter_input_lines(io.StringIO("\n5 5\n1 2 N\n\n\n")))
+
+        # Assert
+        assert lines == ["5 5", "1 2 N"]
+
+        # Act
+        lines = list(iter_input_lines(io.StringIO("5 5\n1 2 N\n\n3 3 E\nM")))
+
+        # Assert
+        assert lines == ["5 5", "1 2 N", "", "3 3 E", "M"]
@@ -0,0 +1,61 @@
+import io
+
+import pytest
+from src.infrastructure.stream_text_work_space_repository import (
+    StreamTextWorkSpaceRepository,
+)
+from src.domain.workspace.entity import WorkSpace
+
+
+class TestStreamTextWorkSpaceRepository:
+
+    @pytest.mark.parametrize(
+        "input_text,expected_max_x,expected_max_y",
+        [
+            pytest.param("5 5\n1 2 N\nLMLMLMLMM", 5, 5, id="standard_5x5_workspace"),
+            pytest.param("\n\n10 15\n0 0 N\nM", 10, 15, id="leading_blank_lines"),
+        ],
+    )
+    def test_get_workspace_reads_first_line(
+        self, input_text, expected_max_x, expected_max_y
+    ):
+        # Arrange
+        repository = StreamTextWorkSpaceRepository(input_stream=io.StringIO(input_text))
+
+        # Act
+        workspace = repository.get_workspace()
+
+        # Assert
+        assert isinstance(workspace, WorkSpace)
+        assert workspace.max_x == expected_max_x
+        assert workspace.max_y == expected_max_y
+
+    def test_get_workspace_reads_obstacle_section(self):
+        # Arrange
+        repository = StreamTextWorkSpaceRepository(
+            input_stream=io.StringIO("5 5\nOBSTACLES 2\n2 2\n0 4 1 4\n1 2 N\nLM")
+        )
+
+        # Act
+        workspace = repository.get_workspace()
+
+        # Assert
+        assert workspace.obstacles.rectangles == [(2, 2, 2, 2), (0, 4, 1, 4)]
+
+    @pytest.mark.parametrize(
+        "invalid_input",
+        [
+            pytest.param("", id="empty_input"),
+            pytest.param("5\n1 2 N\nM", id="single_dimension_missing_y_coordinate"),
+            pytest.param("abc def\n1 2 N\nM", id="non_numeric_coordinates"),
+        ],
+    )
+    def test_get_workspace_raises_error_for_invalid_dimensions(self, invalid_input):
+        # Arrange
+        repository = StreamTextWorkSpaceRepository(
+            input_stream=io.StringIO(invalid_input)
+        )
+
+        # Act & Assert
+        with pytest.raises(ValueError):
+            repository.get_workspace()
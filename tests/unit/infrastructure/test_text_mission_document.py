@@ -0,0 +1,150 @@
+import pytest
+from unittest.mock import patch
+
+from src.domain.robot.packed_instructions import PackedInstructions
+from src.domain.robot.value_objects import Position
+
+from src.infrastructure.text_mission_document import (
+    TextMissionDocument,
+    parse_workspace_line,
+)
+from src.infrastructure.text_robot_repository import TextRobotRepository
+from src.infrastructure.text_work_space_repository import TextWorkSpaceRepository
+
+
+class TestTextMissionDocument:
+
+    def test_get_workspace_is_parsed_once(self):
+        # Arrange
+        document = TextMissionDocument(input_text="5 7\n1 2 N\nM")
+
+        # Act
+        with patch(
+            "src.infrastructure.text_mission_document.parse_workspace_line",
+            wraps=parse_workspace_line,
+        ) as mock_parse:
+            first = document.get_workspace()
+            second = document.get_workspace()
+
+        # Assert
+        mock_parse.assert_called_once_with("5 7", obstacle_lines=[])
+        assert first is second
+        assert (first.max_x, first.max_y) == (5, 7)
+
+    def test_get_robots_is_parsed_once_and_releases_robot_lines(self):
+        # Arrange
+        document = TextMissionDocument(input_text="5 5\n1 2 N\nLM\n3 3 E\nMR")
+
+        # Act
+        first = document.get_robots()
+        second = document.get_robots()
+
+        # Assert
+        assert first is second
+        assert first[2] == ["LM", "MR"]
+        assert document.lines == ["5 5"]
+        assert document.get_workspace().max_x == 5
+
+    def test_repositories_share_the_parsed_document(self):
+        # Arrange
+        document = TextMissionDocument(
+            input_text="5 5\n1 2 N\nLMLMLMLMM\n3 3 E\nMMRMMRMRRM"
+        )
+
+        # Act
+        workspace = TextWorkSpaceRepository(document=document).get_workspace()
+        robots = TextRobotRepository(document=document)
+
+        # Assert
+        assert workspace is document.get_workspace()
+        assert robots.get_robot_position_list() is document.get_robots()[0]
+        assert robots.get_robot_instruction_list() == ["LMLMLMLMM", "MMRMMRMRRM"]
+
+    @pytest.mark.parametrize(
+        "invalid_input",
+        [
+            pytest.param("5 5", id="only_workspace_dimensions_no_robot_data"),
+            pytest.param("5 5\n1 2 N\nM\n3 3 E", id="missing_instruction"),
+        ],
+    )
+    def test_get_robots_raises_error_for_invalid_input_every_time(
+        self, invalid_input
+    ):
+        # Arrange
+        document = TextMissionDocument(input_text=invalid_input)
+
+        # Act & Assert
+        for _ in range(2):
+            with pytest.raises(ValueError):
+                document.get_robots()
+
+    def test_obstacle_section_is_parsed_before_robots(self):
+        # Arrange
+        document = TextMissionDocument(
+            input_text="5 5\nOBSTACLES 2\n2 2\n0 4 1 4\n1 2 N\nLM\n3 3 E\nMR"
+        )
+
+        # Act
+        workspace = document.get_workspace()
+        robots = document.get_robots()
+
+        # Assert
+        assert workspace.obstacles.rectangles == [(2, 2, 2, 2), (0, 4, 1, 4)]
+        assert workspace.is_blocked(Position(1, 4))
+        assert robots[2] == ["LM", "MR"]
+        assert len(document.lines) == 4
+
+    def test_huge_obstacle_outside_workspace_is_rejected_without_indexing(self):
+        # Arrange
+        document = TextMissionDocument(
+            input_text="5 5\nOBSTACLES 1\n0 0 0 50000000\n1 2 N\nLM"
+        )
+
+        # Act & Assert
+        with pytest.raises(ValueError, match="out of workspace bounds"):
+            document.get_workspace()
+
+    @pytest.mark.parametrize(
+        "invalid_input",
+        [
+            pytest.param("5 5\nOBSTACLES\n1 2 N\nM", id="missing_obstacle_count"),
+            pytest.param("5 5\nOBSTACLES 3\n1 1\n2 2", id="truncated_obstacle_section"),
+            pytest.param("5 5\nOBSTACLES 1\n1 1 2\n1 2 N\nM", id="malformed_obstacle"),
+            pytest.param("5 5\nOBSTACLES 1\n9 9\n1 2 N\nM", id="obstacle_out_of_bounds"),
+        ],
+    )
+    def test_get_workspace_raises_error_for_invalid_obstacle_section(
+        self, invalid_input
+    ):
+        # Arrange
+        document = TextMissionDocument(input_text=invalid_input)
+
+        # Act & Assert
+        with pytest.raises(ValueError):
+            document.get_workspace()
+
+    def test_pack_instructions_keeps_packed_instructions(self):
+        # Arrange
+        document = TextMissionDocument(
+            input_text="5 5\n1 2 N\nLMLMLMLMM\n3 3 E\nMMRMMRMRRM",
+            pack_instructions=True,
+        )
+
+        # Act
+        instructions = TextRobotRepository(document=document).get_robot_instruction_list()
+
+        # Assert
+        assert instructions == [
+            PackedInstructions.pack("LMLMLMLMM"),
+            PackedInstructions.pack("MMRMMRMRRM"),
+        ]
+
+    def test_pack_instructions_validates_instructions_when_loading(self):
+        # Arrange
+        document = TextMissionDocument(
+            input_text="5 5\n1 2 N\nLMX", pack_instructions=True
+        )
+
+        # Act & Assert
+        with pytest.raises(ValueError, match="Invalid instruction: X"):
+            document.get_robots()
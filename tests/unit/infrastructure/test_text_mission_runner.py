@@ -0,0 +1,28 @@
+import pytest
+
+from src.domain.robot.value_objects import Orientation, Position
+from src.infrastructure.text_mission_runner import build_robot_service, run_mission
+
+SAMPLE_MISSION = "5 5\n1 2 N\nLMLMLMLMM\n3 3 E\nMMRMMRMRRM"
+
+
+class TestTextMissionRunner:
+
+    def test_run_mission_matches_sample_output(self):
+        # Act & Assert
+        assert run_mission(SAMPLE_MISSION) == "1 3 N\n5 1 E"
+
+    def test_build_robot_service_streams_final_states(self):
+        # Act
+        final_states = list(build_robot_service(SAMPLE_MISSION).iter_final_states())
+
+        # Assert
+        assert final_states == [
+            (Position(1, 3), Orientation("N")),
+            (Position(5, 1), Orientation("E")),
+        ]
+
+    def test_run_mission_failure_raises_value_error(self):
+        # Act & Assert
+        with pytest.raises(ValueError, match="out of workspace bounds"):
+            run_mission("5 5\n0 0 S\nM")
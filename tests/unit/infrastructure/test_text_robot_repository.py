@@ -1,4 +1,6 @@
 import pytest
+from src.domain.robot.packed_instructions import PackedInstructions
+from src.infrastructure.text_mission_document import TextMissionDocument
 from src.infrastructure.text_robot_repository import TextRobotRepository
 
 class TestTextRobotRepository:
@@ -88,4 +90,33 @@ class TestTextRobotRepository:
     ):
         # Act & Assert
         with pytest.raises(ValueError):
-            TextRobotRepository(input_text=invalid_input)
\ No newline at end of file
+            TextRobotRepository(input_text=invalid_input)
+
+    def test_document_keeps_its_pack_instructions_setting(self):
+        # Arrange
+        document = TextMissionDocument("5 5\n1 2 N\nLMR", pack_instructions=True)
+
+        # Act
+        repository = TextRobotRepository(document=document, pack_instructions=True)
+
+        # Assert
+        assert isinstance(repository.get_robot_instruction_list()[0], PackedInstructions)
+
+    @pytest.mark.parametrize(
+        "document_packs,pack_instructions",
+        [
+            pytest.param(False, True, id="packing_requested_on_plain_document"),
+            pytest.param(True, False, id="plain_requested_on_packing_document"),
+        ],
+    )
+    def test_conflicting_pack_instructions_raises_error(
+        self, document_packs, pack_instructions
+    ):
+        # Arrange
+        document = TextMissionDocument(
+            "5 5\n1 2 N\nLMR", pack_instructions=document_packs
+        )
+
+        # Act & Assert
+        with pytest.raises(ValueError, match="conflicts"):
+            TextRobotRepository(document=document, pack_instructions=pack_instructions)